@@ -0,0 +1,73 @@
+"""
+Synthetic cohorts shaped like data/result.csv.
+
+Each student gets a latent ability drawn from a Beta distribution (skewed
+towards high marks by default, like the real course) and every mark is that
+ability times the component's maximum plus per-component noise, rounded the
+way teachers enter marks. On top of that, some marks are blank (NaN), some
+students miss individual class tests (0) and some miss the mid-term
+entirely (blank).
+"""
+import numpy as np
+import pandas as pd
+
+# column -> (maximum mark, rounding step)
+MARK_LAYOUT = {
+    'CT1': (10, 1),
+    'CT2': (10, 1),
+    'Mid-Term': (40, 1),
+    'CT3': (10, 1),
+    'CT4': (10, 1),
+    'Presentation': (10, 0.5),
+    'Attendance': (10, 1),
+}
+
+FIRST_NAMES = ['AFSANA', 'FARHAN', 'LUTFUL', 'MAINUL', 'NUSRAT', 'RAFIQ', 'SADIA', 'TANVIR', 'ISHRAT', 'KAMRUL',
+               'MEHEDI', 'NAFISA', 'RUMANA', 'SHAFIN', 'TASNIM', 'ZARIF', 'ANIKA', 'HASIB', 'JANNAT', 'OMAR']
+LAST_NAMES = ['AHMED', 'HASSAN', 'HENA', 'ISHRAQ', 'RAHMAN', 'ISLAM', 'HOSSAIN', 'KHAN', 'CHOWDHURY', 'SARKAR',
+              'UDDIN', 'AKTER', 'BEGUM', 'MIAH', 'ROY', 'DAS', 'KABIR', 'ALAM', 'NADIM', 'ASIF']
+
+
+def generate_cohort(n_students, seed=0, nan_rate=0.02, absent_rate=0.05, midterm_absent_rate=0.01,
+                    skew=(5.0, 2.0)):
+    """
+    Generate a result.csv-shaped cohort.
+
+    Args:
+        n_students (int): Number of rows
+        seed (int): Random seed; the same arguments always give the same frame
+        nan_rate (float): Share of mark cells left blank
+        absent_rate (float): Share of class-test marks recorded as 0 (absent)
+        midterm_absent_rate (float): Share of students with a blank mid-term
+        skew (tuple): Beta distribution (a, b) for ability; a > b skews high
+
+    Returns:
+        pd.DataFrame: Sl. No, StudentID, Student Name and the mark columns
+    """
+    rng = np.random.default_rng(seed)
+    ability = rng.beta(skew[0], skew[1], size=n_students)
+
+    frame = pd.DataFrame({
+        'Sl. No': np.arange(1, n_students + 1),
+        'StudentID': 2252421000 + rng.permutation(n_students * 10)[:n_students],
+        'Student Name': (np.array(FIRST_NAMES, dtype=object)[rng.integers(len(FIRST_NAMES), size=n_students)] + ' ' +
+                         np.array(LAST_NAMES, dtype=object)[rng.integers(len(LAST_NAMES), size=n_students)]),
+    })
+
+    for column, (maximum, step) in MARK_LAYOUT.items():
+        spread = 0.15 if column.startswith('CT') else 0.08
+        marks = np.clip(ability + rng.normal(0, spread, size=n_students), 0, 1) * maximum
+        marks = np.round(marks / step) * step
+        if column.startswith('CT'):
+            marks[rng.random(n_students) < absent_rate] = 0
+        marks[rng.random(n_students) < nan_rate] = np.nan
+        frame[column] = marks
+
+    frame.loc[rng.random(n_students) < midterm_absent_rate, 'Mid-Term'] = np.nan
+    return frame
+
+
+def write_cohort(file_path, n_students, **kwargs):
+    """Generate a cohort (see generate_cohort) and save it as CSV; returns the path"""
+    generate_cohort(n_students, **kwargs).to_csv(file_path, index=False)
+    return file_path
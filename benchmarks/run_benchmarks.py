@@ -0,0 +1,267 @@
+"""
+Time the analysis pipelines on synthetic cohorts of increasing size.
+
+    python -m benchmarks.run_benchmarks                          # 1k, 10k, 100k students
+    python -m benchmarks.run_benchmarks --sizes 1000000 --skip generate_graphs cluster
+    python -m benchmarks.run_benchmarks --compare benchmarks/results/bench_20250101_120000.json
+
+Benchmarks:
+    result_analyzer  load, preprocess, score, categorize and the detailed report
+    report_writing   save_report_to_file plus the JSON report
+    generate_graphs  every chart, chart cache off
+    cluster          ClusterAnalyzer.run_full_analysis
+    scholarship      ScholarshipService scoring: one predict per student (on the
+                     first PER_STUDENT_LIMIT students) against score_batch on all
+
+Each benchmark runs --repeat times per size. The first run is recorded as
+'cold': it parses the CSV, while later runs read the ingest sidecar. The
+best later run is recorded as 'warm'. The per-stage breakdown of the last
+run is stored too. Results are written as JSON (RESULT_SCHEMA_VERSION)
+with the environment and git commit, so runs from different days and
+machines can be compared with --compare.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+
+from benchmarks.cohort import write_cohort
+
+RESULT_SCHEMA_VERSION = 1
+BENCHMARKS = ['result_analyzer', 'report_writing', 'generate_graphs', 'cluster', 'scholarship']
+DEFAULT_SIZES = [1000, 10000, 100000]
+# The per-student scholarship path is timed on at most this many students
+PER_STUDENT_LIMIT = 2000
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+def _result_analyzer(data_file, output_dir, profiler, options):
+    from src.services.result_analyzer import ResultAnalyzer
+    analyzer = ResultAnalyzer(data_file, output_dir=output_dir, profiler=profiler)
+    if not analyzer.load_data():
+        raise RuntimeError(f"Could not load {data_file}")
+    analyzer.categorize_students()
+    analyzer.generate_detailed_report()
+    return analyzer
+
+
+def bench_result_analyzer(data_file, output_dir, profiler, options):
+    _result_analyzer(data_file, output_dir, profiler, options)
+
+
+def bench_report_writing(data_file, output_dir, profiler, options):
+    analyzer = _result_analyzer(data_file, output_dir, None, options)
+    analyzer.profiler = profiler
+    with profiler.stage('text report'):
+        analyzer.save_report_to_file('benchmark_report.txt')
+    with profiler.stage('json report'):
+        with open(os.path.join(output_dir, 'benchmark_report.json'), 'w') as f:
+            json.dump(analyzer.generate_detailed_report().to_dict(), f)
+
+
+def bench_generate_graphs(data_file, output_dir, profiler, options):
+    analyzer = _result_analyzer(data_file, output_dir, None, options)
+    analyzer.profiler = profiler
+    analyzer.generate_graphs(workers=options['workers'], dpi=options['dpi'], use_cache=False)
+
+
+def bench_cluster(data_file, output_dir, profiler, options):
+    from src.services.cluster_analyzer import ClusterAnalyzer
+    results = ClusterAnalyzer(data_file, output_dir=output_dir, profiler=profiler).run_full_analysis(dpi=options['dpi'])
+    if not results['success']:
+        raise RuntimeError("Cluster analysis failed")
+
+
+def bench_scholarship(data_file, output_dir, profiler, options):
+    import pandas as pd
+    from sklearn.tree import DecisionTreeClassifier
+    from benchmarks.cohort import MARK_LAYOUT
+    from src.services.scholarship_service import ScholarshipService
+
+    with profiler.stage('train'):
+        marks = pd.read_csv(data_file)[list(MARK_LAYOUT)].fillna(0)
+        # Synthetic target: the top quarter of the cohort by total marks
+        eligible = marks.sum(axis=1) >= marks.sum(axis=1).quantile(0.75)
+        service = ScholarshipService(DecisionTreeClassifier(random_state=0))
+        service.train_model(marks, eligible)
+
+    rows = marks.to_numpy()[:PER_STUDENT_LIMIT]
+    with profiler.stage(f'per-student x{len(rows)}'), warnings.catch_warnings():
+        # Plain rows make sklearn warn about missing feature names on every call
+        warnings.simplefilter('ignore', UserWarning)
+        for row in rows:
+            service.recommend_scholarship(row)
+    with profiler.stage(f'batch x{len(marks)}'):
+        service.score_batch(marks, chunksize=100000)
+
+
+RUNNERS = {
+    'result_analyzer': bench_result_analyzer,
+    'report_writing': bench_report_writing,
+    'generate_graphs': bench_generate_graphs,
+    'cluster': bench_cluster,
+    'scholarship': bench_scholarship,
+}
+
+
+def environment():
+    """Versions and machine details stored with every result file"""
+    import numpy
+    import pandas
+    import sklearn
+    import matplotlib
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': numpy.__version__,
+        'pandas': pandas.__version__,
+        'scikit-learn': sklearn.__version__,
+        'matplotlib': matplotlib.__version__,
+        'git_commit': commit,
+    }
+
+
+def run_benchmark(name, data_file, rows, work_dir, repeat, options):
+    """
+    Time one benchmark on one cohort file.
+
+    Returns:
+        dict: benchmark, rows, cold_seconds, warm_seconds, runs and stages
+    """
+    from src.utils.profiling import StageProfiler
+    runs, profiler = [], None
+    for i in range(repeat):
+        output_dir = os.path.join(work_dir, f"{name}_{rows}_{i}")
+        os.makedirs(output_dir, exist_ok=True)
+        profiler = StageProfiler(name, track_memory=options['memory'])
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            RUNNERS[name](data_file, output_dir, profiler, options)
+        runs.append(time.perf_counter() - start)
+        shutil.rmtree(output_dir, ignore_errors=True)
+
+    return {
+        'benchmark': name,
+        'rows': rows,
+        'cold_seconds': runs[0],
+        'warm_seconds': min(runs[1:]) if len(runs) > 1 else None,
+        'runs': runs,
+        'stages': profiler.to_dict()['stages'],
+    }
+
+
+def run_suite(sizes=DEFAULT_SIZES, benchmarks=BENCHMARKS, repeat=3, seed=0, dpi=300, workers=None,
+              memory=False, work_dir=None):
+    """
+    Generate one cohort per size and run every benchmark on it.
+
+    The ingest sidecar cache is pointed at a private directory for the
+    duration of the suite, so earlier runs (or the app's own cache) cannot
+    make a cold run look warm.
+
+    Returns:
+        dict: The result document (see RESULT_SCHEMA_VERSION)
+    """
+    from src.services import ingest_cache
+
+    options = {'dpi': dpi, 'workers': workers, 'memory': memory}
+    owns_work_dir = work_dir is None
+    work_dir = work_dir or tempfile.mkdtemp(prefix='edulink_bench_')
+    default_cache_dir = ingest_cache.DEFAULT_CACHE_DIR
+    ingest_cache.DEFAULT_CACHE_DIR = os.path.join(work_dir, 'ingest')
+    results = []
+    try:
+        for rows in sizes:
+            data_file = write_cohort(os.path.join(work_dir, f"cohort_{rows}.csv"), rows, seed=seed)
+            for name in benchmarks:
+                shutil.rmtree(ingest_cache.DEFAULT_CACHE_DIR, ignore_errors=True)
+                result = run_benchmark(name, data_file, rows, work_dir, repeat, options)
+                warm = f"{result['warm_seconds']:.3f}s" if result['warm_seconds'] is not None else "-"
+                print(f"{name:<16} {rows:>9} rows  cold {result['cold_seconds']:.3f}s  warm {warm}")
+                results.append(result)
+    finally:
+        ingest_cache.DEFAULT_CACHE_DIR = default_cache_dir
+        if owns_work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        'schema_version': RESULT_SCHEMA_VERSION,
+        'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'environment': environment(),
+        'settings': {'sizes': list(sizes), 'repeat': repeat, 'seed': seed, 'dpi': dpi, 'workers': workers,
+                     'memory': memory},
+        'results': results,
+    }
+
+
+def compare(baseline, current):
+    """
+    Pair up results by (benchmark, rows) and compute current / baseline.
+
+    Returns:
+        list: dicts with benchmark, rows, baseline, current and ratio
+            (warm times when both runs have them, cold otherwise)
+    """
+    previous = {(result['benchmark'], result['rows']): result for result in baseline['results']}
+    rows = []
+    for result in current['results']:
+        old = previous.get((result['benchmark'], result['rows']))
+        if old is None:
+            continue
+        key = 'warm_seconds' if result['warm_seconds'] is not None and old['warm_seconds'] is not None \
+            else 'cold_seconds'
+        rows.append({'benchmark': result['benchmark'], 'rows': result['rows'], 'metric': key,
+                     'baseline': old[key], 'current': result[key], 'ratio': result[key] / old[key]})
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark EduLink's analysis pipelines on synthetic cohorts")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="cohort sizes (students)")
+    parser.add_argument('--skip', nargs='*', default=[], choices=BENCHMARKS, help="benchmarks to leave out")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per benchmark and size (first one is cold)")
+    parser.add_argument('--seed', type=int, default=0, help="cohort random seed")
+    parser.add_argument('--dpi', type=int, default=300, help="chart resolution")
+    parser.add_argument('--workers', type=int, help="chart rendering processes")
+    parser.add_argument('--memory', action='store_true', help="also trace peak memory per stage (slower)")
+    parser.add_argument('--output', help="result file (default: benchmarks/results/bench_<timestamp>.json)")
+    parser.add_argument('--compare', help="earlier result file to compare against")
+    args = parser.parse_args(argv)
+
+    benchmarks = [name for name in BENCHMARKS if name not in args.skip]
+    document = run_suite(args.sizes, benchmarks, repeat=args.repeat, seed=args.seed, dpi=args.dpi,
+                         workers=args.workers, memory=args.memory)
+
+    output = args.output or os.path.join(RESULTS_DIR, f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(document, f, indent=2)
+    print(f"Results saved to: {output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print(f"\nCompared with {args.compare} ({baseline['environment'].get('git_commit')}):")
+        for row in compare(baseline, document):
+            print(f"{row['benchmark']:<16} {row['rows']:>9} rows  {row['baseline']:.3f}s -> {row['current']:.3f}s"
+                  f"  x{row['ratio']:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
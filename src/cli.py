@@ -0,0 +1,287 @@
+"""
+Command-line entry point for scheduled, headless runs:
+
+    python -m src analyze data/result.csv -o output/nightly --charts
+    python -m src analyze courses/ -o output/batch --workers 4
+    python -m src cluster data/result.csv -o output/nightly --clusters 3
+    python -m src cluster data/result.csv -o output/nightly --clusters auto --max-clusters 10
+    python -m src assign late_registrations.csv --model output/nightly/cluster_model_<ts>.json
+    python -m src similar output/nightly/student_index_<ts>.npz --student 23524202070 -k 5
+    python -m src report data/result.csv --format json
+
+No GUI module is imported, and the analysis services are only imported
+once a command runs. Progress messages go to stderr; stdout carries the
+report (for `report`) or the paths written. Exit status is 0 on success,
+1 when an analysis fails (or any course in a batch fails) and 2 for bad
+arguments or missing input.
+"""
+import argparse
+import contextlib
+import json
+import os
+import sys
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+
+DEFAULT_OUTPUT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'output')
+
+
+def _grading(args):
+    """(grade_scale, category_scale) from --grading, or the built-in scales"""
+    if not args.grading:
+        return None, None
+    from src.services.grading import load_grading_config
+    return load_grading_config(args.grading)
+
+
+def _write_json(path, payload):
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2, default=lambda value: value.item() if hasattr(value, 'item') else str(value))
+    return path
+
+
+def _cluster_count(value):
+    """argparse type for --clusters: a positive integer or 'auto'"""
+    if value == 'auto':
+        return value
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an integer or 'auto', got {value!r}")
+    if count < 1:
+        raise argparse.ArgumentTypeError("the number of clusters must be at least 1")
+    return count
+
+
+def _profiler(args, name):
+    """StageProfiler when --profile was given, else None"""
+    if not args.profile:
+        return None
+    from src.utils.profiling import StageProfiler
+    return StageProfiler(name)
+
+
+def _save_profile(args, profiler, file=None):
+    if profiler is not None:
+        print(profiler.save_json(args.profile), file=file)
+
+
+def cmd_analyze(args):
+    """Score, grade and report one result file, or every file in a directory or glob"""
+    grade_scale, category_scale = _grading(args)
+    os.makedirs(args.output, exist_ok=True)
+
+    if not os.path.isfile(args.input):
+        from src.services.batch_runner import find_result_files, run_batch
+        if not find_result_files(args.input):
+            print(f"No result files found in {args.input}", file=sys.stderr)
+            return EXIT_USAGE
+        with contextlib.redirect_stdout(sys.stderr):
+            results = run_batch(args.input, args.output, workers=args.workers, charts=args.charts,
+                                grade_scale=grade_scale, category_scale=category_scale,
+                                compact=args.compact, dpi=args.dpi)
+        print(results['summary_json'])
+        print(results['summary_csv'])
+        return EXIT_FAILED if results['summary']['courses_failed'] else EXIT_OK
+
+    from src.services.result_analyzer import ResultAnalyzer
+    profiler = _profiler(args, 'analyze')
+    with contextlib.redirect_stdout(sys.stderr):
+        analyzer = ResultAnalyzer(args.input, grade_scale=grade_scale, category_scale=category_scale,
+                                  compact=args.compact, output_dir=args.output, profiler=profiler)
+        if not analyzer.load_data():
+            return EXIT_FAILED
+        analyzer.categorize_students()
+        report = analyzer.generate_detailed_report()
+
+        written = []
+        if args.format in ('text', 'both'):
+            analyzer.save_report_to_file('result_analysis_report.txt')
+            written.append(os.path.join(args.output, 'result_analysis_report.txt'))
+        if args.format in ('json', 'both'):
+            written.append(_write_json(os.path.join(args.output, 'result_analysis_report.json'), report.to_dict()))
+        if args.charts:
+            analyzer.generate_graphs(workers=args.workers, dpi=args.dpi)
+    for path in written:
+        print(path)
+    _save_profile(args, profiler)
+    return EXIT_OK
+
+
+def cmd_cluster(args):
+    """Cluster students by performance and write the plot, CSV and report"""
+    from src.services.cluster_analyzer import ClusterAnalyzer
+    os.makedirs(args.output, exist_ok=True)
+    profiler = _profiler(args, 'cluster')
+    with contextlib.redirect_stdout(sys.stderr):
+        analyzer = ClusterAnalyzer(args.input, compact=args.compact, output_dir=args.output, profiler=profiler)
+        results = analyzer.run_full_analysis(n_clusters=args.clusters, k_values=range(2, args.max_clusters + 1),
+                                             workers=args.workers, previous_model=args.previous_model,
+                                             plot_mode=args.plot, dpi=args.dpi, stability=args.stability)
+    if not results['success']:
+        return EXIT_FAILED
+
+    statistics = _write_json(os.path.join(args.output, f"cluster_statistics_{analyzer.timestamp}.json"),
+                             results['statistics'])
+    k_selection = None
+    if results['k_selection'] is not None:
+        k_selection = _write_json(os.path.join(args.output, f"cluster_k_selection_{analyzer.timestamp}.json"),
+                                  results['k_selection'])
+    for path in [results['cluster_plot'], results['csv_file'], results['report_file'], results['model_file'],
+                 results['index_file'], results['transitions_file'], statistics, k_selection]:
+        if path:
+            print(path)
+    _save_profile(args, profiler)
+    return EXIT_OK
+
+
+def cmd_assign(args):
+    """Place new or updated students into the groups of a saved cluster model"""
+    from src.services.cluster_analyzer import ClusterAnalyzer
+    os.makedirs(args.output, exist_ok=True)
+    profiler = _profiler(args, 'assign')
+    with contextlib.redirect_stdout(sys.stderr):
+        analyzer = ClusterAnalyzer(args.input, output_dir=args.output, profiler=profiler)
+        analyzer.load_model(args.model)
+        assigned = analyzer.assign_students(args.input)
+    assigned_path = os.path.join(args.output, f"student_assignments_{analyzer.timestamp}.csv")
+    assigned.to_csv(assigned_path)
+    print(assigned_path)
+    _save_profile(args, profiler)
+    return EXIT_OK
+
+
+def _student_id(value):
+    """StudentIDs are numeric in result files; keep anything else as text"""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def cmd_similar(args):
+    """Print the students closest to a student or a mark vector as JSON"""
+    from src.services.student_index import StudentIndex
+    index = StudentIndex.load(args.input)
+    try:
+        if args.student is not None:
+            neighbours = index.query(student_id=_student_id(args.student), k=args.k)
+        else:
+            neighbours = index.query(marks=args.marks, k=args.k)
+    except (KeyError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return EXIT_USAGE
+    json.dump(neighbours, sys.stdout, indent=2)
+    print()
+    return EXIT_OK
+
+
+def cmd_report(args):
+    """Print the detailed report for one result file to stdout"""
+    from src.services.result_analyzer import ResultAnalyzer
+    grade_scale, category_scale = _grading(args)
+    profiler = _profiler(args, 'report')
+    with contextlib.redirect_stdout(sys.stderr):
+        analyzer = ResultAnalyzer(args.input, grade_scale=grade_scale, category_scale=category_scale,
+                                  compact=args.compact, output_dir=args.output, profiler=profiler)
+        if args.stream:
+            report = analyzer.generate_streaming_report()
+            if report is None:
+                return EXIT_FAILED
+        else:
+            if not analyzer.load_data():
+                return EXIT_FAILED
+            analyzer.categorize_students()
+            report = analyzer.generate_detailed_report()
+
+    # A streamed report has no processed_data for the text layout, so it is always JSON
+    as_json = args.format == 'json' or args.stream
+    if as_json:
+        json.dump(report.to_dict(), sys.stdout, indent=2)
+        print()
+    else:
+        analyzer.print_report_to_terminal()
+    # Keep stdout parseable when it carries the JSON report
+    _save_profile(args, profiler, file=sys.stderr if as_json else None)
+    return EXIT_OK
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m src', description="EduLink headless result analysis")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('input', help="result file (CSV or Excel); analyze also takes a directory or glob")
+    common.add_argument('-o', '--output', default=DEFAULT_OUTPUT_DIR, help="output directory (default: output/)")
+    common.add_argument('--compact', action='store_true', help="use the compact dtype schema")
+    common.add_argument('--profile', help="write per-stage timings and peak memory to this JSON file")
+
+    grading = argparse.ArgumentParser(add_help=False)
+    grading.add_argument('--grading', help="JSON file with grade_scale and/or category_scale")
+
+    analyze = subparsers.add_parser('analyze', parents=[common, grading],
+                                    help="score and grade a file, directory or glob and write reports")
+    analyze.add_argument('--format', choices=['text', 'json', 'both'], default='both', help="report files to write")
+    analyze.add_argument('--charts', action='store_true', help="also render the charts")
+    analyze.add_argument('--dpi', type=int, default=300, help="chart resolution")
+    analyze.add_argument('--workers', type=int, help="process pool size for charts and batches")
+    analyze.set_defaults(handler=cmd_analyze)
+
+    cluster = subparsers.add_parser('cluster', parents=[common], help="cluster students into performance groups")
+    cluster.add_argument('--clusters', type=_cluster_count, default=3,
+                         help="number of groups, or 'auto' to pick it by silhouette score")
+    cluster.add_argument('--max-clusters', type=int, default=8, help="largest k tried by --clusters auto")
+    cluster.add_argument('--workers', type=int, help="processes used to score the candidate k values")
+    cluster.add_argument('--plot', choices=['auto', 'scatter', 'sample', 'density'], default='auto',
+                         help="cluster plot: every student, a stratified sample, or per-group density "
+                              "(auto: density above 10,000 students)")
+    cluster.add_argument('--dpi', type=int, default=300, help="plot resolution")
+    cluster.add_argument('--stability', type=int, default=0, metavar='N',
+                         help="rerun the clustering on N bootstrap resamples and report per-student and "
+                              "per-group stability")
+    cluster.add_argument('--previous-model', help="cluster_model_<timestamp>.json of an earlier run to warm-start "
+                                                  "from; keeps its group names and writes the transitions")
+    cluster.set_defaults(handler=cmd_cluster)
+
+    assign = subparsers.add_parser('assign', parents=[common],
+                                   help="place students into the groups of a saved cluster model")
+    assign.add_argument('--model', required=True, help="cluster_model_<timestamp>.json written by cluster")
+    assign.set_defaults(handler=cmd_assign)
+
+    similar = subparsers.add_parser('similar', help="find the students with the most similar marks")
+    similar.add_argument('input', help="student_index_<timestamp>.npz written by cluster")
+    query = similar.add_mutually_exclusive_group(required=True)
+    query.add_argument('--student', help="StudentID to search around")
+    query.add_argument('--marks', type=float, nargs='+', help="marks in the index's feature order")
+    similar.add_argument('-k', type=int, default=5, help="number of students to return")
+    similar.set_defaults(handler=cmd_similar)
+
+    report = subparsers.add_parser('report', parents=[common, grading], help="print the detailed report")
+    report.add_argument('--format', choices=['text', 'json'], default='text')
+    report.add_argument('--stream', action='store_true', help="stream a large CSV in chunks (JSON output)")
+    report.set_defaults(handler=cmd_report)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command != 'analyze' and not os.path.isfile(args.input):
+        print(f"Input file not found: {args.input}", file=sys.stderr)
+        return EXIT_USAGE
+    for model in (getattr(args, 'model', None), getattr(args, 'previous_model', None)):
+        if model and not os.path.isfile(model):
+            print(f"Cluster model not found: {model}", file=sys.stderr)
+            return EXIT_USAGE
+    if getattr(args, 'grading', None) and not os.path.isfile(args.grading):
+        print(f"Grading config not found: {args.grading}", file=sys.stderr)
+        return EXIT_USAGE
+
+    # Charts are written to files only; never try to open a display
+    os.environ.setdefault('MPLBACKEND', 'Agg')
+    try:
+        return args.handler(args)
+    except Exception as e:
+        print(f"Error: {type(e).__name__}: {e}", file=sys.stderr)
+        return EXIT_FAILED
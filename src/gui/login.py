@@ -3,7 +3,6 @@ import customtkinter as ctk
 from PIL import Image, ImageTk
 import os
 from ..services import accounts_db
-from src.gui.teachers_menu import TeachersMenu
 
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
@@ -110,6 +109,7 @@ class LoginWindow:
         if usertype:
             # Call the TeachersMenu class if usertype is 'teacher'
             if usertype == 'teacher':
+                from src.gui.teachers_menu import TeachersMenu
                 self.master.destroy()
                 root = ctk.CTk()
                 app = TeachersMenu(root)
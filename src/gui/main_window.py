@@ -1,6 +1,4 @@
 import customtkinter as ctk
-import ttkbootstrap as ttkb
-from ttkbootstrap.constants import *
 import os
 import sys
 
@@ -8,7 +6,8 @@ import sys
 project_root = os.path.join(os.path.dirname(__file__), '..', '..')
 sys.path.insert(0, project_root)
 
-from src.services.result_analyzer import ResultAnalyzer
+# ResultAnalyzer (pandas, matplotlib) is imported inside the report windows,
+# not here, to keep start-up light.
 
 class MainWindow:
     def __init__(self, master):
@@ -140,14 +139,14 @@ class ScholarshipAnalysisWindow:
             for widget in self.scrollable_frame.winfo_children():
                 widget.destroy()
             
-            # Load data from result.csv
+            from src.services.result_analyzer import ResultAnalyzer
+
+            # Load data from result.csv (served from the analysis cache when the file is unchanged)
             dataset_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'result.csv')
-            analyzer = ResultAnalyzer(dataset_path)
+            cache_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'output', '.cache')
+            analyzer = ResultAnalyzer(dataset_path, cache_dir=cache_dir)
             
-            if analyzer.load_data():
-                analyzer.preprocess_data()
-                analyzer.calculate_total_and_percentage()
-                analyzer.categorize_students()
+            if analyzer.run_analysis():
                 report = analyzer.generate_detailed_report()
                 student_results = analyzer.get_student_results()
                 
@@ -308,13 +307,13 @@ class ResultAnalysisWindow:
     def generate_detailed_report(self):
         """Generate and display detailed analysis report"""
         try:
+            from src.services.result_analyzer import ResultAnalyzer
             dataset_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'result.csv')
-            analyzer = ResultAnalyzer(dataset_path)
+            cache_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'output', '.cache')
+            analyzer = ResultAnalyzer(dataset_path, cache_dir=cache_dir)
             
-            if analyzer.load_data():
-                analyzer.preprocess_data()
-                analyzer.calculate_total_and_percentage()
-                analyzer.categorize_students()
+            # Served from the analysis cache when the file is unchanged
+            if analyzer.run_analysis():
                 
                 # Generate report text
                 report_text = "="*80 + "\n"
@@ -1,9 +1,10 @@
 import customtkinter as ctk
 import os
 import tkinter as tk
-from PIL import Image, ImageTk
-from src.services.result_analyzer import ResultAnalyzer
-from src.services.cluster_analyzer import ClusterAnalyzer
+
+# pandas, matplotlib, scikit-learn and PIL are imported on first use rather
+# than here, so the window appears before the analysis stack is loaded.
+# Check with: python -m src.utils.startup_profile
 
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
@@ -47,6 +48,14 @@ class TeachersMenu:
         )
         self.cluster_button.pack(side="left", padx=10, pady=10)
 
+        self.batch_button = ctk.CTkButton(
+            self.control_panel,
+            text="Batch Analysis",
+            command=self.perform_batch_analysis,
+            font=('Century Gothic', 14)
+        )
+        self.batch_button.pack(side="left", padx=10, pady=10)
+
         self.view_reports_button = ctk.CTkButton(
             self.control_panel, 
             text="View Reports", 
@@ -70,29 +79,45 @@ class TeachersMenu:
         
         # Path to the result file
         self.dataset_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'result.csv')
-        self.analyzer = ResultAnalyzer(self.dataset_path)
-        self.cluster_analyzer = ClusterAnalyzer(self.dataset_path)
+        self._analyzer = None
+        self._cluster_analyzer = None
 
         # Check if data exists
         if not os.path.exists(self.dataset_path):
             self.status_label.configure(text="Error: Result file not found", text_color="#F44336")
     
+    @property
+    def analyzer(self):
+        """ResultAnalyzer for the dataset, created (and pandas imported) on first use"""
+        if self._analyzer is None:
+            from src.services.result_analyzer import ResultAnalyzer
+            cache_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'output', '.cache')
+            self._analyzer = ResultAnalyzer(self.dataset_path, cache_dir=cache_dir)
+        return self._analyzer
+
+    @property
+    def cluster_analyzer(self):
+        """ClusterAnalyzer for the dataset, created (and scikit-learn imported) on first use"""
+        if self._cluster_analyzer is None:
+            from src.services.cluster_analyzer import ClusterAnalyzer
+            self._cluster_analyzer = ClusterAnalyzer(self.dataset_path)
+        return self._cluster_analyzer
+
     def analyze_results(self):
         """Analyze the results and generate graphs"""
         self.status_label.configure(text="Analyzing results...", text_color="#FFC107")
         self.master.update()
         
-        # Load and process the data
-        if self.analyzer.load_data():
-            self.analyzer.preprocess_data()
-            self.analyzer.calculate_total_and_percentage()
-            self.analyzer.categorize_students()
-            
+        from src.utils.profiling import StageProfiler
+        self.analyzer.profiler = StageProfiler('result analysis', track_memory=False)
+
+        # Load and process the data (served from the analysis cache when the file is unchanged)
+        if self.analyzer.run_analysis():
             # Generate graphs
             output_dir = self.analyzer.generate_graphs()
             self.analyzer.save_report_to_file()
             self.status_label.configure(
-                text=f"Analysis complete! Graphs saved to: {output_dir}", 
+                text=f"Analysis complete! Graphs saved to: {output_dir}\n{self.analyzer.profiler.summary()}",
                 text_color="#4CAF50"
             )
         else:
@@ -101,17 +126,41 @@ class TeachersMenu:
                 text_color="#F44336"
             )
 
+    def perform_batch_analysis(self):
+        """Analyze every result file in a folder chosen by the user"""
+        from tkinter import filedialog
+        from src.services.batch_runner import run_batch
+        source = filedialog.askdirectory(title="Select a folder of course result files")
+        if not source:
+            return
+
+        self.status_label.configure(text="Running batch analysis...", text_color="#FFC107")
+        self.master.update()
+
+        output_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'output', 'batch')
+        results = run_batch(source, output_dir)
+        summary = results['summary']
+        self.status_label.configure(
+            text=(f"Batch complete: {summary['courses_analyzed']} courses analyzed, "
+                  f"{summary['courses_failed']} failed. Summary: {results['summary_csv']}"),
+            text_color="#4CAF50" if summary['courses_failed'] == 0 else "#FFC107"
+        )
+
     def perform_cluster_analysis(self):
         """Perform cluster analysis on the results"""
         self.status_label.configure(text="Performing cluster analysis...", text_color="#FFC107")
         self.master.update()
 
+        from src.utils.profiling import StageProfiler
+        self.cluster_analyzer.profiler = StageProfiler('cluster analysis', track_memory=False)
+
         # Run the full cluster analysis
         results = self.cluster_analyzer.run_full_analysis(n_clusters=3)
 
         if results['success']:
             self.status_label.configure(
-                text="Cluster analysis complete! View the results in Reports.",
+                text=("Cluster analysis complete! View the results in Reports.\n"
+                      f"{self.cluster_analyzer.profiler.summary()}"),
                 text_color="#4CAF50"
             )
 
@@ -228,8 +277,12 @@ class TeachersMenu:
             label.pack(pady=20)
             return
         
-        # Get all PNG files in the output directory
-        png_files = [f for f in os.listdir(output_dir) if f.endswith('.png')]
+        # Prefer the charts the manifest marks as current; fall back to every PNG
+        from src.services.chart_cache import ChartCache
+        manifest = ChartCache(output_dir)
+        png_files = [os.path.relpath(path, output_dir) for path in manifest.current_files()]
+        if not png_files:
+            png_files = [f for f in os.listdir(output_dir) if f.endswith('.png')]
         
         if not png_files:
             label = ctk.CTkLabel(self.reports_container, text="No graphs found. Generate analysis first.", font=('Century Gothic', 14))
@@ -257,6 +310,7 @@ class TeachersMenu:
     
     def display_image(self, parent_frame, img_path, max_height=280):
         """Display an image in the given frame with a maximum height"""
+        from PIL import Image, ImageTk
         try:
             # Open the image and resize it
             img = Image.open(img_path)
@@ -1,7 +1,6 @@
 # Contents of /EduLink/EduLink/src/main.py
 
 import customtkinter as ctk
-from src.gui.login import LoginWindow
 from src.gui.teachers_menu import TeachersMenu
 
 def main():
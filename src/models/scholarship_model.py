@@ -1,30 +1,152 @@
+import json
+import os
 from sklearn.tree import DecisionTreeClassifier
+import numpy as np
 import pandas as pd
 
+
+def _chunks(students, chunksize):
+    """Yield (features, index) blocks of at most chunksize rows"""
+    is_frames = isinstance(students, (list, tuple)) and len(students) > 0 and isinstance(students[0], pd.DataFrame)
+    if isinstance(students, (pd.DataFrame, np.ndarray, list, tuple)) and not is_frames:
+        if not isinstance(students, pd.DataFrame):
+            students = np.atleast_2d(np.asarray(students, dtype=np.float64))
+        step = chunksize or max(len(students), 1)
+        for start in range(0, len(students), step):
+            block = students[start:start + step]
+            yield block, block.index if isinstance(block, pd.DataFrame) else pd.RangeIndex(start, start + len(block))
+    else:
+        # Already chunked, e.g. pd.read_csv(..., chunksize=...)
+        offset = 0
+        for block in students:
+            for part, index in _chunks(block, chunksize):
+                yield part, index if isinstance(block, pd.DataFrame) else index + offset
+            offset += len(block)
+
+
+def score_batch(estimator, students, chunksize=None):
+    """
+    Score many students with one predict_proba call per chunk.
+
+    Args:
+        estimator: Fitted classifier with predict_proba
+        students: DataFrame, 2-D array or list of rows, or an iterable of
+            DataFrames (such as pd.read_csv(..., chunksize=...))
+        chunksize (int, optional): Rows per call, to bound memory
+
+    Returns:
+        pd.DataFrame: 'prediction' plus one 'probability_<class>' column per
+            class, indexed like the input
+    """
+    features = getattr(estimator, 'feature_names_in_', None)
+    classes = estimator.classes_
+    columns = ['prediction'] + [f"probability_{label}" for label in classes]
+    results = []
+    for block, index in _chunks(students, chunksize):
+        if isinstance(block, pd.DataFrame):
+            block = block[list(features)] if features is not None else block.to_numpy(dtype=np.float64)
+        elif features is not None:
+            # Plain rows in the fitted column order; named so sklearn does not warn
+            block = pd.DataFrame(block, columns=features)
+        probabilities = estimator.predict_proba(block)
+        # The class with the highest probability, which is what predict returns
+        scored = pd.DataFrame(probabilities, index=index, columns=columns[1:])
+        scored.insert(0, 'prediction', classes.take(probabilities.argmax(axis=1)))
+        results.append(scored)
+    if not results:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(results) if len(results) > 1 else results[0]
+
+
 class ScholarshipModel:
-    def __init__(self):
+    def __init__(self, registry=None):
         self.model = DecisionTreeClassifier()
         self.data = None
+        # Optional ModelRegistry: training on unchanged data becomes a lookup
+        self.registry = registry
+        # Training key and metadata (data hash, features, sklearn version) of the current model
+        self.model_key = None
+        self.model_info = None
 
     def load_data(self, file_path):
         self.data = pd.read_csv(file_path)
 
+    def _training_key(self, features, target):
+        from src.services.model_registry import training_key
+        X = self.data[features]
+        y = self.data[target]
+        return X, y, training_key(self.model, X, y, features)
+
     def train_model(self, features, target):
+        """
+        Fit the model, or fetch it from the registry when this exact fit exists.
+
+        Returns:
+            bool: True if the model came from the registry
+        """
         if self.data is not None:
-            X = self.data[features]
-            y = self.data[target]
+            X, y, (key, info) = self._training_key(features, target)
+            self.model_key, self.model_info = key, info
+            if self.registry is not None:
+                cached = self.registry.lookup(key)
+                if cached is not None:
+                    self.model = cached
+                    return True
             self.model.fit(X, y)
+            if self.registry is not None:
+                self.registry.register(key, self.model, info)
+        return False
+
+    def load_registered(self, features, target):
+        """
+        Load the registered model trained on the current data, features and settings.
+
+        Returns:
+            bool: True if a matching model was found
+        """
+        if self.data is None or self.registry is None:
+            return False
+        _, _, (key, info) = self._training_key(features, target)
+        cached = self.registry.lookup(key)
+        if cached is None:
+            return False
+        self.model, self.model_key, self.model_info = cached, key, info
+        return True
 
     def recommend_scholarship(self, student_data):
         return self.model.predict([student_data])
 
+    def score_batch(self, students, chunksize=None):
+        """Predictions and class probabilities for many students (see score_batch)"""
+        return score_batch(self.model, students, chunksize)
+
     def get_feature_importance(self):
         return self.model.feature_importances_ if self.model else None
 
     def save_model(self, filename):
+        """Save the model with joblib, and what it was trained on to <filename>.json"""
         import joblib
         joblib.dump(self.model, filename)
+        if self.model_info is not None:
+            with open(filename + '.json', 'w') as f:
+                json.dump(dict(self.model_info, key=self.model_key), f, indent=2)
 
     def load_model(self, filename):
+        """
+        Load a model saved with save_model.
+
+        Raises:
+            ValueError: If the model was saved with another scikit-learn version
+        """
         import joblib
-        self.model = joblib.load(filename)
\ No newline at end of file
+        import sklearn
+        info = None
+        if os.path.exists(filename + '.json'):
+            with open(filename + '.json', 'r') as f:
+                info = json.load(f)
+            if info.get('sklearn_version') != sklearn.__version__:
+                raise ValueError(f"Model was trained with scikit-learn {info.get('sklearn_version')}, "
+                                 f"this is {sklearn.__version__}; retrain it")
+        self.model = joblib.load(filename)
+        self.model_key = info.pop('key', None) if info else None
+        self.model_info = info
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import pickle
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+# Size budget for the analysis pickles in a cache directory, as for the ingest cache
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+
+def file_fingerprint(file_path, chunk_size=1 << 20):
+    """
+    SHA-256 of a file's content.
+
+    Args:
+        file_path (str): File to hash
+        chunk_size (int): Read size in bytes
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def frame_fingerprint(frame):
+    """
+    Content hash of a DataFrame: values, index, column names and dtypes.
+
+    Uses pandas' vectorized row hashing, so any edit to any cell changes the
+    result.
+
+    Args:
+        frame (pd.DataFrame): Frame to hash
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([[str(col), str(dtype)] for col, dtype in frame.dtypes.items()]).encode())
+    digest.update(np.ascontiguousarray(pd.util.hash_pandas_object(frame, index=True).to_numpy()).tobytes())
+    return digest.hexdigest()
+
+
+def config_fingerprint(*scales):
+    """
+    Hash of the grading scales an analysis was run with.
+
+    Args:
+        *scales (GradeScale): Scales to include, in order
+
+    Returns:
+        str: Hex digest
+    """
+    payload = json.dumps([scale.to_dict() for scale in scales], sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class AnalysisCache:
+    """
+    Keyed store for finished analyses.
+
+    Entries live in a small in-memory LRU and, when `cache_dir` is given, as
+    pickle files on disk. Values are kept pickled, so every `get` hands back
+    a fresh copy that the caller is free to mutate. The least recently used
+    pickles are deleted once the directory's pickles exceed max_bytes.
+    """
+
+    def __init__(self, cache_dir=None, max_entries=4, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            cache_dir (str, optional): Directory for the on-disk layer
+            max_entries (int): Entries kept in memory
+            max_bytes (int): Size budget for the on-disk layer
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._memory = OrderedDict()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"analysis_{key}.pkl")
+
+    def get(self, key):
+        """
+        Look up an entry.
+
+        Args:
+            key (str): Cache key
+
+        Returns:
+            object: The cached value, or None on a miss (an unreadable
+                file on disk counts as a miss and is deleted)
+        """
+        payload = self._memory.get(key)
+        if payload is not None:
+            self._memory.move_to_end(key)
+            return pickle.loads(payload)
+        if not self.cache_dir or not os.path.exists(self._path(key)):
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                payload = f.read()
+            value = pickle.loads(payload)
+            os.utime(path)  # mark as recently used for eviction
+        except OSError as e:
+            print(f"Error reading analysis cache: {e}")
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, IndexError, ValueError) as e:
+            # Truncated, or written by an incompatible version of the code
+            print(f"Ignoring unreadable analysis cache entry {key}: {e}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+        self._remember(key, payload)
+        return value
+
+    def put(self, key, value):
+        """
+        Store an entry in memory and, if enabled, on disk.
+
+        Args:
+            key (str): Cache key
+            value (object): Picklable value
+        """
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._remember(key, payload)
+        if self.cache_dir:
+            tmp_path = self._path(key) + '.tmp'
+            try:
+                with open(tmp_path, 'wb') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self._path(key))
+                self.evict(keep=self._path(key))
+            except OSError as e:
+                print(f"Error writing analysis cache: {e}")
+
+    def evict(self, keep=None):
+        """
+        Delete least recently used pickles until the on-disk layer fits in max_bytes.
+
+        Args:
+            keep (str, optional): Pickle that must survive (the one just written)
+        """
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.startswith('analysis_') and name.endswith('.pkl'):
+                path = os.path.join(self.cache_dir, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, path, stat.st_size))
+
+        total = sum(size for _, _, size in entries)
+        for _, path, size in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        """Drop every entry, in memory and on disk"""
+        self._memory.clear()
+        if self.cache_dir and os.path.isdir(self.cache_dir):
+            for name in os.listdir(self.cache_dir):
+                if name.startswith('analysis_') and name.endswith('.pkl'):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+    def _remember(self, key, payload):
+        self._memory[key] = payload
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+# Process-wide memory cache shared by analyzers created without a cache_dir
+DEFAULT_ANALYSIS_CACHE = AnalysisCache()
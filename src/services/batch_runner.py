@@ -0,0 +1,199 @@
+import csv
+import glob
+import json
+import multiprocessing
+import os
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+RESULT_EXTENSIONS = ('.csv', '.xls', '.xlsx')
+SUMMARY_FIELDS = ['course', 'file', 'status', 'total_students', 'average_percentage',
+                  'highest_percentage', 'lowest_percentage', 'median_percentage', 'output_dir', 'error']
+
+
+def find_result_files(source):
+    """
+    Expand a directory or glob pattern into result files.
+
+    Args:
+        source (str): Directory (searched recursively) or glob pattern
+
+    Returns:
+        list: Sorted file paths with a CSV or Excel extension
+    """
+    if os.path.isdir(source):
+        pattern = os.path.join(source, '**', '*')
+    else:
+        pattern = source
+    return sorted(path for path in glob.glob(pattern, recursive=True)
+                  if os.path.isfile(path) and path.endswith(RESULT_EXTENSIONS))
+
+
+def course_names(files):
+    """
+    Unique, filesystem-safe course names for a list of result files.
+
+    Uses the file name without extension and appends a counter when two
+    files share a name.
+
+    Args:
+        files (list): Result file paths
+
+    Returns:
+        list: One name per file, same order
+    """
+    names, seen = [], {}
+    for path in files:
+        name = os.path.splitext(os.path.basename(path))[0]
+        seen[name] = seen.get(name, 0) + 1
+        names.append(name if seen[name] == 1 else f"{name}_{seen[name]}")
+    return names
+
+
+def analyze_course(file_path, course, output_dir, options):
+    """
+    Run load, score, categorize and report for one course file.
+
+    Never raises: failures come back as a summary row with status 'failed'
+    so one bad file cannot stop the batch.
+
+    Args:
+        file_path (str): Result file
+        course (str): Course name, used for the output sub-directory
+        output_dir (str): Batch output directory
+        options (dict): grade_scale, category_scale, charts, compact
+
+    Returns:
+        dict: Summary row (see SUMMARY_FIELDS) plus the grade/category distributions
+    """
+    from src.services.result_analyzer import ResultAnalyzer
+
+    course_dir = os.path.join(output_dir, course)
+    row = {'course': course, 'file': file_path, 'status': 'failed', 'output_dir': course_dir, 'error': ''}
+    try:
+        analyzer = ResultAnalyzer(file_path,
+                                  grade_scale=options.get('grade_scale'),
+                                  category_scale=options.get('category_scale'),
+                                  compact=options.get('compact', False),
+                                  output_dir=course_dir)
+        if not analyzer.load_data():
+            raise ValueError(f"Could not load data from {file_path}")
+        analyzer.preprocess_data()
+        analyzer.calculate_total_and_percentage()
+        analyzer.categorize_students()
+        report = analyzer.generate_detailed_report()
+
+        analyzer.save_report_to_file('result_analysis_report.txt')
+        with open(os.path.join(course_dir, 'result_analysis_report.json'), 'w') as f:
+            json.dump(report.to_dict(), f, indent=2)
+        if options.get('charts'):
+            analyzer.generate_graphs(dpi=options.get('dpi', 300))
+
+        row.update({key: report[key] for key in ['total_students', 'average_percentage', 'highest_percentage',
+                                                 'lowest_percentage', 'median_percentage']})
+        row['grade_distribution'] = report['grade_distribution']
+        row['category_distribution'] = report['category_distribution']
+        row['status'] = 'ok'
+    except Exception as e:
+        row['error'] = f"{type(e).__name__}: {e}"
+        row['traceback'] = traceback.format_exc()
+    return row
+
+
+def merge_summaries(rows):
+    """
+    Combine per-course summaries into an institution-wide summary.
+
+    Args:
+        rows (list): Rows from analyze_course
+
+    Returns:
+        dict: Totals over the successful courses plus the failed files
+    """
+    ok = [row for row in rows if row['status'] == 'ok']
+    students = sum(row['total_students'] for row in ok)
+    grades, categories = {}, {}
+    for row in ok:
+        for grade, count in row['grade_distribution'].items():
+            grades[grade] = grades.get(grade, 0) + count
+        for category, count in row['category_distribution'].items():
+            categories[category] = categories.get(category, 0) + count
+
+    return {
+        'generated': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'courses_analyzed': len(ok),
+        'courses_failed': len(rows) - len(ok),
+        'total_students': students,
+        'average_percentage': (sum(row['average_percentage'] * row['total_students'] for row in ok) / students
+                               if students else None),
+        'highest_percentage': max((row['highest_percentage'] for row in ok), default=None),
+        'lowest_percentage': min((row['lowest_percentage'] for row in ok), default=None),
+        'grade_distribution': dict(sorted(grades.items(), key=lambda item: -item[1])),
+        'category_distribution': dict(sorted(categories.items(), key=lambda item: -item[1])),
+        'failed_files': [{'file': row['file'], 'error': row['error']} for row in rows if row['status'] != 'ok'],
+    }
+
+
+def run_batch(source, output_dir, workers=None, charts=False, grade_scale=None, category_scale=None,
+              compact=False, dpi=300):
+    """
+    Analyze every result file in a directory or glob, in a process pool.
+
+    Writes each course's report (text and JSON, plus charts if requested)
+    to output_dir/<course>/, then institution_summary.csv with one row per
+    course and institution_summary.json with the merged totals.
+
+    Args:
+        source (str): Directory or glob pattern
+        output_dir (str): Batch output directory
+        workers (int, optional): Pool size, capped at the CPU count and the
+            number of files; None uses the CPU count, 1 runs in-process
+        charts (bool): Also render each course's charts
+        grade_scale (GradeScale, optional): Letter grade scale
+        category_scale (GradeScale, optional): Category scale
+        compact (bool): Use the compact dtype schema
+        dpi (int): Chart resolution
+
+    Returns:
+        dict: {'courses': per-course rows, 'summary': merged summary,
+               'summary_csv': path, 'summary_json': path}
+    """
+    files = find_result_files(source)
+    os.makedirs(output_dir, exist_ok=True)
+    options = {'grade_scale': grade_scale, 'category_scale': category_scale,
+               'charts': charts, 'compact': compact, 'dpi': dpi}
+    jobs = list(zip(files, course_names(files)))
+
+    workers = min(workers or os.cpu_count() or 1, os.cpu_count() or 1, max(len(jobs), 1))
+    rows = []
+    if workers <= 1:
+        for file_path, course in jobs:
+            rows.append(analyze_course(file_path, course, output_dir, options))
+            print(f"[{len(rows)}/{len(jobs)}] {course}: {rows[-1]['status']}")
+    else:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [(file_path, course, pool.submit(analyze_course, file_path, course, output_dir, options))
+                       for file_path, course in jobs]
+            for file_path, course, future in futures:
+                try:
+                    rows.append(future.result())
+                except Exception as e:  # worker died (e.g. out of memory)
+                    rows.append({'course': course, 'file': file_path, 'status': 'failed',
+                                 'output_dir': os.path.join(output_dir, course),
+                                 'error': f"{type(e).__name__}: {e}"})
+                print(f"[{len(rows)}/{len(jobs)}] {course}: {rows[-1]['status']}")
+
+    summary = merge_summaries(rows)
+    summary_csv = os.path.join(output_dir, 'institution_summary.csv')
+    with open(summary_csv, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=SUMMARY_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+    summary_json = os.path.join(output_dir, 'institution_summary.json')
+    with open(summary_json, 'w') as f:
+        json.dump(summary, f, indent=2)
+
+    print(f"Batch complete: {summary['courses_analyzed']} analyzed, {summary['courses_failed']} failed")
+    return {'courses': rows, 'summary': summary, 'summary_csv': summary_csv, 'summary_json': summary_json}
@@ -0,0 +1,105 @@
+import hashlib
+import json
+import os
+import pickle
+from datetime import datetime
+
+from src.services.chart_renderer import RENDERER_VERSION
+
+MANIFEST_NAME = 'chart_manifest.json'
+
+
+def chart_key(name, payload, style, dpi):
+    """
+    Content hash of everything that determines a chart's pixels.
+
+    Args:
+        name (str): Chart name
+        payload: Data the chart is drawn from (picklable)
+        style (str): Matplotlib style
+        dpi (int): Output resolution
+
+    Returns:
+        str: Hex digest
+    """
+    digest = hashlib.sha256()
+    digest.update(json.dumps([RENDERER_VERSION, name, style, dpi]).encode())
+    digest.update(pickle.dumps(payload, protocol=4))
+    return digest.hexdigest()
+
+
+class ChartCache:
+    """
+    Manifest of the charts in an output directory and the inputs they were drawn from.
+
+    The manifest (chart_manifest.json) maps each chart name to its file and
+    content key. A chart whose key is unchanged and whose file still exists is
+    reused instead of redrawn, and `current_files` tells viewers which PNGs
+    belong to the latest analysis.
+    """
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+        self.manifest_path = os.path.join(output_dir, MANIFEST_NAME)
+        self.entries = {}
+        if os.path.exists(self.manifest_path):
+            try:
+                with open(self.manifest_path, 'r') as f:
+                    self.entries = json.load(f).get('charts', {})
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable chart manifest: {e}")
+
+    def lookup(self, name, key):
+        """
+        Return the path of a cached chart, or None if it has to be drawn.
+
+        Args:
+            name (str): Chart name
+            key (str): Key from chart_key
+
+        Returns:
+            str: Path to the existing PNG, or None
+        """
+        entry = self.entries.get(name)
+        if entry is None or entry['key'] != key:
+            return None
+        path = os.path.join(self.output_dir, entry['file'])
+        return path if os.path.exists(path) else None
+
+    def record(self, name, key, path, source=None):
+        """
+        Register a freshly drawn chart.
+
+        Args:
+            name (str): Chart name
+            key (str): Key from chart_key
+            path (str): Where the PNG was written
+            source (str, optional): Input file the chart was drawn from
+        """
+        self.entries[name] = {
+            'file': os.path.relpath(path, self.output_dir),
+            'key': key,
+            'source': source,
+            'updated': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        }
+
+    def save(self):
+        """Write the manifest atomically"""
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'renderer_version': RENDERER_VERSION, 'charts': self.entries}, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def current_files(self):
+        """
+        Charts listed in the manifest whose files still exist.
+
+        Returns:
+            list: Absolute paths, in manifest order
+        """
+        paths = []
+        for entry in self.entries.values():
+            path = os.path.join(self.output_dir, entry['file'])
+            if os.path.exists(path):
+                paths.append(path)
+        return paths
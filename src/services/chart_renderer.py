@@ -0,0 +1,219 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Chart drawing for ResultAnalyzer.generate_graphs.
+#
+# Every chart is a plain function of a small payload (label lists and the
+# arrays the chart actually plots) drawn on a standalone matplotlib Figure,
+# so charts can be rendered in any order, in any process, without pyplot's
+# global state. Keep this module free of pandas so worker start-up stays cheap.
+
+
+def _new_figure(figsize):
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=figsize)
+    return fig, fig.add_subplot()
+
+
+def _label_bars(ax, bars, fmt, color):
+    for bar in bars:
+        height = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width() / 2, height + 0.1, format(height, fmt),
+                ha='center', va='bottom', fontsize=9, color=color)
+
+
+def draw_grade_distribution(payload, path, dpi):
+    """Pie chart of the grade distribution"""
+    fig, ax = _new_figure((10, 8))
+    ax.pie(payload['values'], labels=payload['grades'], autopct='%1.1f%%')
+    ax.set_title('Grade Distribution', pad=20, fontsize=14)
+    fig.savefig(path, bbox_inches='tight', dpi=dpi)
+
+
+def draw_performance_distribution(payload, path, dpi):
+    """Line graph of percentages sorted from best to worst"""
+    fig, ax = _new_figure((12, 6))
+    percentages = payload['percentages']
+    ranks = np.arange(len(percentages))
+    ax.plot(ranks, percentages, '-', linewidth=2, color='#2196F3')
+    ax.fill_between(ranks, percentages, alpha=0.3, color='#2196F3')
+    ax.set_title('Overall Performance Distribution', pad=20, fontsize=14)
+    ax.set_xlabel('Student Rank')
+    ax.set_ylabel('Percentage')
+    ax.grid(True, alpha=0.3)
+    fig.savefig(path, bbox_inches='tight', dpi=dpi)
+
+
+def draw_assessment_distribution(payload, path, dpi):
+    """Box plot of assessment scores from precomputed box statistics"""
+    fig, ax = _new_figure((12, 6))
+    bp = ax.bxp(payload['box_stats'], patch_artist=True)
+    for box in bp['boxes']:
+        box.set(facecolor='#4CAF50', alpha=0.7)
+    ax.set_title('Assessment Score Distribution', pad=20, fontsize=14)
+    ax.set_ylabel('Marks')
+    ax.grid(True, alpha=0.3)
+    fig.savefig(path, bbox_inches='tight', dpi=dpi)
+
+
+def draw_component_distribution(payload, path, dpi):
+    """Stacked bar chart of each student's score components"""
+    fig, ax = _new_figure((12, 6))
+    colors = ['#2196F3', '#4CAF50', '#FFC107', '#FF5722']
+    positions = np.arange(payload['students'])
+    bottom = np.zeros(payload['students'])
+    for (component, values), color in zip(payload['components'], colors):
+        ax.bar(positions, values, bottom=bottom, label=component, alpha=0.7, color=color)
+        bottom += values
+    ax.set_title('Score Component Distribution', pad=20, fontsize=14)
+    ax.set_xlabel('Student Index')
+    ax.set_ylabel('Marks')
+    ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+    fig.tight_layout()
+    fig.savefig(path, bbox_inches='tight', dpi=dpi)
+
+
+def draw_exam_analysis(payload, path, dpi):
+    """Grouped bar chart of average, highest and lowest mark per exam"""
+    fig, ax = _new_figure((12, 6))
+    exams = payload['exams']
+    x = np.arange(len(exams))
+    width = 0.25
+    bars1 = ax.bar(x - width, payload['averages'], width, label='Average', color='#2196F3')
+    bars2 = ax.bar(x, payload['highest'], width, label='Highest', color='#4CAF50')
+    bars3 = ax.bar(x + width, payload['lowest'], width, label='Lowest', color='#FF9800')
+
+    ax.set_xticks(x)
+    ax.set_xticklabels(exams)
+    ax.set_title('Exam-wise Analysis', pad=20, fontsize=14)
+    ax.set_xlabel('Exams')
+    ax.set_ylabel('Marks')
+    ax.legend()
+    ax.set_ylim(-1, max(payload['highest']) + 2)  # Keep zero-height lowest bars visible
+
+    _label_bars(ax, bars3, '.1f', '#FF9800')
+    _label_bars(ax, bars1, '.1f', '#2196F3')
+    _label_bars(ax, bars2, '.1f', '#4CAF50')
+    fig.savefig(path, bbox_inches='tight', dpi=dpi)
+
+
+def draw_basic_statistics(payload, path, dpi):
+    """Grouped bar chart of average/highest/lowest/median marks and percentage"""
+    fig, ax = _new_figure((10, 6))
+    categories = payload['categories']
+    x = np.arange(len(categories))
+    width = 0.35
+    bar1 = ax.bar(x - width / 2, payload['total_marks'], width, label='Total Marks', color='#2196F3')
+    bar2 = ax.bar(x + width / 2, payload['percentages'], width, label='Percentage', color='#4CAF50')
+    ax.set_xticks(x)
+    ax.set_xticklabels(categories)
+    ax.set_title('Basic Statistics of Student Performance', pad=20, fontsize=14)
+    ax.set_xlabel('Statistics')
+    ax.set_ylabel('Marks / Percentage')
+    ax.legend()
+    _label_bars(ax, bar1, '.2f', '#2196F3')
+    _label_bars(ax, bar2, '.2f', '#4CAF50')
+    fig.savefig(path, bbox_inches='tight', dpi=dpi)
+
+
+# Bump when any drawing function changes so cached PNGs are redrawn
+RENDERER_VERSION = 1
+
+# chart name -> (drawing function, output file name)
+CHARTS = {
+    'grade_distribution': (draw_grade_distribution, 'grade_distribution.png'),
+    'performance_distribution': (draw_performance_distribution, 'performance_distribution.png'),
+    'assessment_distribution': (draw_assessment_distribution, 'assessment_distribution.png'),
+    'component_distribution': (draw_component_distribution, 'component_distribution.png'),
+    'exam_analysis': (draw_exam_analysis, 'exam_analysis.png'),
+    'basic_statistics': (draw_basic_statistics, 'basic_statistics.png'),
+}
+
+
+def _init_worker(style):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.style
+    matplotlib.style.use(style)
+
+
+def render_chart(name, payload, output_dir, dpi=300):
+    """
+    Draw one chart and save it under output_dir.
+
+    Args:
+        name (str): Key in CHARTS
+        payload (dict): Data the chart needs
+        output_dir (str): Directory to write the PNG to
+        dpi (int): Output resolution
+
+    Returns:
+        str: Path to the saved image
+    """
+    draw, filename = CHARTS[name]
+    path = os.path.join(output_dir, filename)
+    draw(payload, path, dpi)
+    return path
+
+
+def render_charts(jobs, output_dir, workers=None, dpi=300, style='default', cache=None, source=None,
+                  profiler=None):
+    """
+    Render a batch of charts, optionally in a process pool.
+
+    Workers are started with the 'spawn' method (safe next to a running Tk
+    loop), use the Agg backend, and receive only their chart's payload.
+    With a ChartCache, charts whose payload, style and dpi are unchanged
+    are reused from disk and only the rest are drawn.
+
+    Args:
+        jobs (list): (chart name, payload) pairs
+        output_dir (str): Directory to write the PNGs to
+        workers (int, optional): Process count; None or 1 renders in-process
+        dpi (int): Output resolution
+        style (str): Matplotlib style applied before drawing
+        cache (ChartCache, optional): Manifest to reuse and record charts in
+        source (str, optional): Input file, recorded in the manifest
+        profiler (StageProfiler, optional): Records a 'chart:<name>' stage per
+            chart rendered in-process (a pool is timed only as a whole)
+
+    Returns:
+        list: Image paths, in job order
+    """
+    paths = [None] * len(jobs)
+    keys = [None] * len(jobs)
+    pending = []
+    for i, (name, payload) in enumerate(jobs):
+        if cache is not None:
+            from src.services.chart_cache import chart_key
+            keys[i] = chart_key(name, payload, style, dpi)
+            paths[i] = cache.lookup(name, keys[i])
+        if paths[i] is None:
+            pending.append(i)
+
+    if not workers or workers <= 1 or len(pending) <= 1:
+        if pending:
+            import matplotlib.style
+            matplotlib.style.use(style)
+        for i in pending:
+            if profiler is None:
+                paths[i] = render_chart(jobs[i][0], jobs[i][1], output_dir, dpi)
+                continue
+            with profiler.stage(f"chart:{jobs[i][0]}"):
+                paths[i] = render_chart(jobs[i][0], jobs[i][1], output_dir, dpi)
+    else:
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(workers, len(pending)), mp_context=context,
+                                 initializer=_init_worker, initargs=(style,)) as pool:
+            futures = {i: pool.submit(render_chart, jobs[i][0], jobs[i][1], output_dir, dpi) for i in pending}
+            for i, future in futures.items():
+                paths[i] = future.result()
+
+    if cache is not None:
+        for i in pending:
+            cache.record(jobs[i][0], keys[i], paths[i], source=source)
+        cache.save()
+    return paths
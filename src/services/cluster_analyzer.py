@@ -1,26 +1,317 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
 import os
+import multiprocessing
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from src.services.scoring import best_ct_average
+from src.services.report_stats import top_k_indices
+from src.services.streaming_stats import BoundedTopK
+from src.services.chart_cache import ChartCache, chart_key
+from src.services.cluster_model import ClusterModel
+from src.services.student_index import StudentIndex
+from src.services.schema import compact_frame, memory_report, memory_usage
+from src.utils.profiling import NULL_PROFILER, profiled
+
+# Columns that identify a student rather than describe performance
+ID_COLUMNS = ['StudentID', 'Student Name']
+# Columns perform_clustering adds to processed_data
+RESULT_COLUMNS = ['Cluster', 'Total', 'Group', 'Stability', 'Previous_Group']
+# Group names for three clusters, best first
+GROUP_NAMES = ['Good', 'Average', 'Struggling']
+# Candidate cluster counts tried by run_full_analysis(n_clusters='auto')
+DEFAULT_K_VALUES = range(2, 9)
+
+
+def prepare_marks(frame, fill_na_value=0):
+    """
+    Fill blanks, add Midterm_Scaled and CT_Avg, and drop the CT columns.
+
+    Shared by ClusterAnalyzer.load_data and the chunked clustering mode so
+    both see exactly the same features.
+
+    Args:
+        frame (pd.DataFrame): Raw results; modified in place where possible
+        fill_na_value: Value to use for filling NA/NaN values
+
+    Returns:
+        pd.DataFrame: The prepared frame
+    """
+    frame.fillna(fill_na_value, inplace=True)
+
+    # Optional preprocessing steps
+    if 'Mid-Term' in frame.columns:
+        frame['Midterm_Scaled'] = frame['Mid-Term'] / 2
+
+    # Best 3 CT average calculation
+    ct_columns = ['CT1', 'CT2', 'CT3', 'CT4']
+    valid_ct_cols = [col for col in ct_columns if col in frame.columns]
+
+    # Round to 2 decimal places
+    frame['CT_Avg'] = best_ct_average(frame, valid_ct_cols).round(2)
+
+    # Delete individual CT columns after calculating the average
+    return frame.drop(columns=valid_ct_cols)
+
+
+def performance_labels(cluster_means):
+    """
+    Name clusters by their mean total score.
+
+    Args:
+        cluster_means (pd.Series): cluster id -> mean Total
+
+    Returns:
+        tuple: (labels, groups) where labels maps cluster id -> group name
+            (Good/Average/Struggling for three clusters, "Group 1".. otherwise,
+            best first) and groups lists the names from best to worst
+    """
+    ranked = cluster_means.sort_values(ascending=False).index
+    if len(ranked) == len(GROUP_NAMES):
+        labels = {cluster: GROUP_NAMES[i] for i, cluster in enumerate(ranked)}
+    else:
+        # Generate generic labels for any number of clusters
+        labels = {cluster: f"Group {i+1}" for i, cluster in enumerate(ranked)}
+    return labels, [labels[cluster] for cluster in ranked]
+
+
+def transition_matrix(previous, current, groups):
+    """
+    Count students by their group in the previous run and in this one.
+
+    Args:
+        previous (pd.Series): Previous group per student ID
+        current (pd.Series): Current group per student ID
+        groups (list): Group names in display order; names only present in
+            previous come after them
+
+    Returns:
+        pd.DataFrame: Rows are previous groups plus 'New' (students not in
+            the previous run), columns are current groups plus 'Left'
+            (students not in this run)
+    """
+    joined = pd.concat([previous.rename('previous'), current.rename('current')], axis=1, join='outer')
+    joined['previous'] = joined['previous'].fillna('New')
+    joined['current'] = joined['current'].fillna('Left')
+    order = list(groups) + [group for group in pd.unique(previous) if group not in groups]
+    counts = pd.crosstab(joined['previous'], joined['current'])
+    return counts.reindex(index=order + ['New'], columns=order + ['Left'], fill_value=0)
+
+
+def previous_group_column(ids, previous):
+    """
+    Previous group of every student, for the Previous_Group results column.
+
+    Args:
+        ids (pd.Series): Student IDs of this run
+        previous (pd.Series): Previous group per student ID
+
+    Returns:
+        pd.Series: Previous group per row, 'New' for students not in the
+            previous run
+    """
+    return ids.map(previous).fillna('New')
+
+
+def score_k(X, k, random_state=83, sample_size=2000):
+    """
+    Fit KMeans with k clusters and score the result.
+
+    The fit uses the same settings as ClusterAnalyzer.perform_clustering,
+    so the inertia is the one a run with n_clusters=k would get.
+
+    Args:
+        X (np.ndarray): Standardized feature matrix
+        k (int): Number of clusters
+        random_state (int): Random seed for KMeans and the silhouette sample
+        sample_size (int): Rows used for the silhouette score, which is
+            quadratic in the number of rows
+
+    Returns:
+        dict: k, inertia, silhouette and calinski_harabasz (the last two are
+            NaN when KMeans found fewer than two distinct clusters)
+    """
+    from sklearn.metrics import calinski_harabasz_score, silhouette_score
+
+    kmeans = KMeans(n_clusters=k, random_state=random_state)
+    labels = kmeans.fit_predict(X)
+    scores = {'k': int(k), 'inertia': float(kmeans.inertia_), 'silhouette': np.nan, 'calinski_harabasz': np.nan}
+    if len(np.unique(labels)) > 1:
+        scores['silhouette'] = float(silhouette_score(X, labels, sample_size=min(sample_size, len(X)),
+                                                      random_state=random_state))
+        scores['calinski_harabasz'] = float(calinski_harabasz_score(X, labels))
+    return scores
+
+
+def elbow_k(scores):
+    """
+    The k at the bend of the inertia curve.
+
+    Inertia and k are scaled to [0, 1] and the bend is the point furthest
+    below the straight line from the first candidate to the last.
+
+    Args:
+        scores (list): score_k results, sorted by k
+
+    Returns:
+        int: The elbow k (the first candidate when there are fewer than three)
+    """
+    if len(scores) < 3:
+        return scores[0]['k']
+    k = np.array([score['k'] for score in scores], dtype=float)
+    inertia = np.array([score['inertia'] for score in scores])
+    span = inertia[0] - inertia[-1]
+    if span <= 0:
+        return scores[0]['k']
+    x = (k - k[0]) / (k[-1] - k[0])
+    y = (inertia - inertia[-1]) / span
+    # The line runs from (0, 1) to (1, 0); distance below it is 1 - x - y
+    return scores[int(np.argmax(1 - x - y))]['k']
+
+
+def choose_k(scores):
+    """
+    Pick the cluster count with the best sampled silhouette score.
+
+    Ties (within 0.01) go to the higher Calinski-Harabasz score.
+
+    Args:
+        scores (list): score_k results
+
+    Returns:
+        int: The chosen k
+
+    Raises:
+        ValueError: If no candidate has a silhouette score
+    """
+    valid = [score for score in scores if not np.isnan(score['silhouette'])]
+    if not valid:
+        raise ValueError("No candidate k produced more than one cluster")
+    best = max(score['silhouette'] for score in valid)
+    close = [score for score in valid if score['silhouette'] >= best - 0.01]
+    return max(close, key=lambda score: score['calinski_harabasz'])['k']
+
+
+# Feature matrix handed to each k-selection worker once, not once per k
+_worker_matrix = None
+_worker_limits = None
+
+
+def _init_k_worker(X):
+    global _worker_matrix, _worker_limits
+    from threadpoolctl import threadpool_limits
+    _worker_matrix = X
+    # The pool already uses every core; keep each worker's BLAS/OpenMP single-threaded
+    _worker_limits = threadpool_limits(limits=1)
+
+
+def _score_k_worker(k, random_state, sample_size):
+    return score_k(_worker_matrix, k, random_state, sample_size)
+
+
+def bootstrap_labels(marks, seed, reference_centroids, reference_scale):
+    """
+    Recluster one bootstrap resample and label every student with it.
+
+    The resample is drawn with replacement, standardized with its own
+    StandardScaler and clustered with KMeans. Every student (in the
+    resample or not) is then assigned to the nearest bootstrap centroid,
+    and the bootstrap clusters are matched to the reference clusters with
+    the Hungarian algorithm on centroid distances.
+
+    Args:
+        marks (np.ndarray): Unscaled feature matrix of the whole cohort
+        seed (int): Seed for the resample and KMeans
+        reference_centroids (np.ndarray): Reference centroids in marks units
+        reference_scale (np.ndarray): Reference scaler scale_, used to
+            measure centroid distances
+
+    Returns:
+        tuple: (labels, in_bag) where labels are reference cluster ids for
+            every student and in_bag marks the students drawn at least once
+    """
+    from scipy.optimize import linear_sum_assignment
+
+    rng = np.random.default_rng(seed)
+    sample = rng.integers(0, len(marks), len(marks))
+    scaler = StandardScaler().fit(marks[sample])
+    kmeans = KMeans(n_clusters=len(reference_centroids), random_state=seed, n_init=1)
+    kmeans.fit(scaler.transform(marks[sample]))
+
+    centroids = kmeans.cluster_centers_ * scaler.scale_ + scaler.mean_
+    cost = (((centroids[:, None, :] - reference_centroids[None, :, :]) / reference_scale) ** 2).sum(axis=2)
+    rows, columns = linear_sum_assignment(cost)
+    mapping = np.empty(len(centroids), dtype=np.int16)
+    mapping[rows] = columns
+
+    in_bag = np.zeros(len(marks), dtype=bool)
+    in_bag[sample] = True
+    return mapping[kmeans.predict(scaler.transform(marks))], in_bag
+
+
+# Stability workers attach to the parent's shared memory block instead of
+# receiving a pickled copy of the matrix
+_stability_memory = None
+_stability_args = None
+
+
+def _init_stability_worker(memory_name, shape, dtype, reference_centroids, reference_scale):
+    global _stability_memory, _stability_args, _worker_limits
+    from threadpoolctl import threadpool_limits
+    _stability_memory = shared_memory.SharedMemory(name=memory_name)
+    marks = np.ndarray(shape, dtype=dtype, buffer=_stability_memory.buf)
+    _stability_args = (marks, reference_centroids, reference_scale)
+    _worker_limits = threadpool_limits(limits=1)
+
+
+def _bootstrap_worker(seed):
+    marks, reference_centroids, reference_scale = _stability_args
+    return bootstrap_labels(marks, seed, reference_centroids, reference_scale)
+
 
 class ClusterAnalyzer:
-    def __init__(self, data_file):
+    def __init__(self, data_file, compact=False, output_dir=None, profiler=None):
         self.data_file = os.path.normpath(data_file)  # Normalize path
         self.data = None
         self.processed_data = None
+        # Store marks as float32, IDs as small ints and names as categoricals
+        self.compact = compact
+        self.memory_report = None
+        # Per-stage timing and peak memory; pass a src.utils.profiling.StageProfiler to collect them
+        self.profiler = profiler or NULL_PROFILER
         self.clusters = None
         self.labels = None
         self.X_scaled = None
+        # PCA of X_scaled for the cluster plot, fitted once per scaled matrix
+        self.pca = None
+        self.pca_components = None
+        self.scaler = None
+        self.kmeans = None
+        # Fitted scaler, centroids and group names; see save_model and assign_students
+        self.model = None
+        # Nearest-neighbour index over X_scaled; see build_student_index
+        self.student_index = None
+        # Set by assess_stability: replicates, per-cluster Jaccard and borderline count
+        self.stability = None
+        # Set by evaluate_k: chosen k, elbow k and the scores of every candidate
+        self.k_selection = None
+        # Per-group statistics of the latest clustering (print_group_statistics, or
+        # perform_chunked_clustering, which keeps no per-student frame in memory)
+        self.group_statistics = None
+        self.results_file = None
+        # (previous_model, its groups per StudentID) as read before this run's results were written
+        self.previous_assignments = None
         # Use os.path.abspath to get absolute path and normalize it
         root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.output_dir = os.path.join(root_dir, 'output')
+        self.output_dir = output_dir or os.path.join(root_dir, 'output')
         os.makedirs(self.output_dir, exist_ok=True)
         self.timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
+    @profiled('load')
     def load_data(self, index_col=0, fill_na_value=0):
         """
         Load data from CSV file and preprocess it.
@@ -36,47 +327,35 @@ class ClusterAnalyzer:
             if not os.path.exists(self.data_file):
                 raise FileNotFoundError(f"Data file not found: {self.data_file}")
 
-            self.data = pd.read_csv(self.data_file, index_col=index_col)
-            self.data.fillna(fill_na_value, inplace=True)
-
-            # Optional preprocessing steps
-            if 'Mid-Term' in self.data.columns:
-                self.data['Midterm_Scaled'] = self.data['Mid-Term'] / 2
-
-            # Best 3 CT average calculation
-            ct_columns = ['CT1', 'CT2', 'CT3', 'CT4']
-            valid_ct_cols = [col for col in ct_columns if col in self.data.columns]
-
-            ct_scores = []
-            for index, row in self.data.iterrows():
-                scores = [row[col] for col in valid_ct_cols if pd.notna(row[col])]
-                scores.sort(reverse=True)
-                best_3_avg = sum(scores[:3]) / 3 if len(scores) >= 3 else (sum(scores) / len(scores) if scores else 0)
-                # Round to 2 decimal places
-                best_3_avg = round(best_3_avg, 2)
-                ct_scores.append(best_3_avg)
+            self.data = prepare_marks(pd.read_csv(self.data_file, index_col=index_col), fill_na_value)
 
-            self.data['CT_Avg'] = ct_scores
-
-            # Delete individual CT columns after calculating the average
-            for col in valid_ct_cols:
-                if col in self.data.columns:
-                    self.data = self.data.drop(columns=[col])
+            if self.compact:
+                before_bytes = memory_usage(self.data)
+                compact_frame(self.data)
+                self.memory_report = memory_report(before_bytes, self.data)
 
             self.processed_data = self.data.copy()
+            self.X_scaled = self.scaler = None
+            self.pca = self.pca_components = None
             print(f"Data loaded successfully from {self.data_file}")
             return True
         except Exception as e:
             print(f"Error loading data: {e}")
             return False
 
-    def perform_clustering(self, n_clusters=3, random_state=83):
+    @profiled('clustering')
+    def perform_clustering(self, n_clusters=3, random_state=83, previous_model=None):
         """
         Perform clustering on student exam data.
 
         Args:
             n_clusters (int): Number of clusters to create
             random_state (int): Random seed for reproducibility
+            previous_model (ClusterModel, optional): Earlier run to warm-start
+                from. KMeans starts at its centroids (so n_clusters is taken
+                from it) and every cluster keeps that run's group name
+                instead of being renamed by mean total. Each student's group
+                in that run goes to a Previous_Group column.
 
         Returns:
             bool: True if clustering was successful, False otherwise
@@ -85,90 +364,361 @@ class ClusterAnalyzer:
             if self.processed_data is None:
                 raise ValueError("Data not loaded. Please load the data first.")
 
-            # Get assessment columns (excluding student ID and name)
-            exam_columns = self.processed_data.columns.drop(['StudentID', 'Student Name'])
-
-            # Extract exam data
-            X = self.processed_data[exam_columns]
-
-            # Standardize features
-            scaler = StandardScaler()
-            self.X_scaled = scaler.fit_transform(X)
+            exam_columns = self.exam_columns()
+            self.scale_features()
+            # Stability and Previous_Group describe the previous labeling
+            self.processed_data.drop(columns=['Stability', 'Previous_Group'], errors='ignore', inplace=True)
+            self.stability = None
 
             # KMeans clustering
-            kmeans = KMeans(n_clusters=n_clusters, random_state=random_state)
-            self.processed_data['Cluster'] = kmeans.fit_predict(self.X_scaled)
+            with self.profiler.stage('kmeans'):
+                if previous_model is None:
+                    self.kmeans = KMeans(n_clusters=n_clusters, random_state=random_state)
+                else:
+                    self.kmeans = KMeans(n_clusters=len(previous_model.centroids), random_state=random_state,
+                                         init=self._warm_start(previous_model, exam_columns), n_init=1)
+                self.processed_data['Cluster'] = self.kmeans.fit_predict(self.X_scaled)
 
-            # Calculate total score and assign group labels
+            # Calculate total score and assign group labels based on performance
             self.processed_data['Total'] = self.processed_data[exam_columns].sum(axis=1)
-            cluster_means = self.processed_data.groupby('Cluster')['Total'].mean().sort_values(ascending=False)
-
-            # Create label mapping based on performance
-            if n_clusters == 3:
-                self.labels = {
-                    cluster_means.index[0]: 'Good',
-                    cluster_means.index[1]: 'Average',
-                    cluster_means.index[2]: 'Struggling'
-                }
+            if previous_model is None:
+                cluster_means = self.processed_data.groupby('Cluster')['Total'].mean()
+                self.labels, self.groups = performance_labels(cluster_means)
             else:
-                # Generate generic labels for any number of clusters
-                self.labels = {
-                    idx: f"Group {i+1}"
-                    for i, idx in enumerate(cluster_means.index)
-                }
-
+                self.labels, self.groups = dict(previous_model.labels), list(previous_model.groups)
             self.processed_data['Group'] = self.processed_data['Cluster'].map(self.labels)
-
-            # Get the groups in order from highest to lowest performance
-            self.groups = sorted(self.processed_data['Group'].unique(),
-                              key=lambda x: ['Good', 'Average', 'Struggling'].index(x)
-                              if x in ['Good', 'Average', 'Struggling'] else 999)
+            previous = previous_model.previous_groups() if previous_model is not None else None
+            self.previous_assignments = (previous_model, previous)
+            if previous is not None:
+                self.processed_data['Previous_Group'] = previous_group_column(self.processed_data['StudentID'],
+                                                                              previous)
+            self.model = ClusterModel.from_fitted(self.scaler, self.kmeans, list(exam_columns), self.labels,
+                                                  self.groups, source=self.data_file)
 
             return True
         except Exception as e:
             print(f"Error performing clustering: {e}")
             return False
 
-    def visualize_clusters(self):
+    def _warm_start(self, previous_model, exam_columns):
+        """Previous centroids in the current scaler's space, after checking the features match"""
+        if list(exam_columns) != previous_model.features:
+            raise ValueError(f"Previous model was fitted on {previous_model.features}, "
+                             f"this data has {list(exam_columns)}")
+        return previous_model.seed_centroids(self.scaler.mean_, self.scaler.scale_)
+
+    def exam_columns(self):
+        """Assessment columns of processed_data (no IDs, names or clustering results)"""
+        return self.processed_data.columns.drop(ID_COLUMNS + RESULT_COLUMNS, errors='ignore')
+
+    def scale_features(self):
+        """
+        Standardize the assessment columns.
+
+        The matrix is computed once per load_data and kept in X_scaled, so
+        k selection and the final clustering share it.
+
+        Returns:
+            np.ndarray: The standardized feature matrix
+        """
+        if self.X_scaled is None:
+            with self.profiler.stage('scale'):
+                self.scaler = StandardScaler()
+                self.X_scaled = self.scaler.fit_transform(self.processed_data[self.exam_columns()])
+        return self.X_scaled
+
+    @profiled('k selection')
+    def evaluate_k(self, k_values=DEFAULT_K_VALUES, workers=None, sample_size=2000, random_state=83):
+        """
+        Score a range of cluster counts and pick the best one.
+
+        Each candidate k is fitted with KMeans on the shared X_scaled and
+        scored by inertia, a silhouette score on sample_size rows and the
+        Calinski-Harabasz index. Candidates run in a 'spawn' process pool
+        that receives the matrix once per worker. The chosen k has the best
+        silhouette (see choose_k); the inertia elbow is reported alongside.
+
+        Args:
+            k_values (iterable): Candidate cluster counts; values below 2 or
+                not below the number of students are skipped
+            workers (int, optional): Process count; None uses the CPU count,
+                1 runs in-process
+            sample_size (int): Rows used for each silhouette score
+            random_state (int): Random seed for reproducibility
+
+        Returns:
+            dict: best_k, elbow_k and scores (score_k results sorted by k)
+
+        Raises:
+            ValueError: If data is not loaded or no candidate k is usable
+        """
+        if self.processed_data is None:
+            raise ValueError("Data not loaded. Please load the data first.")
+        X = self.scale_features()
+        candidates = sorted({int(k) for k in k_values if 2 <= k < len(X)})
+        if not candidates:
+            raise ValueError(f"No usable k for {len(X)} students in {list(k_values)}")
+
+        workers = min(workers or os.cpu_count() or 1, os.cpu_count() or 1, len(candidates))
+        if workers <= 1:
+            scores = [score_k(X, k, random_state, sample_size) for k in candidates]
+        else:
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                     initializer=_init_k_worker, initargs=(X,)) as pool:
+                scores = list(pool.map(_score_k_worker, candidates, [random_state] * len(candidates),
+                                       [sample_size] * len(candidates)))
+
+        self.k_selection = {'best_k': choose_k(scores), 'elbow_k': elbow_k(scores), 'scores': scores}
+        print(f"Selected k={self.k_selection['best_k']} (elbow at k={self.k_selection['elbow_k']})")
+        return self.k_selection
+
+    @profiled('chunked clustering')
+    def perform_chunked_clustering(self, n_clusters=3, chunksize=50000, batch_size=4096, epochs=3,
+                                   random_state=83, index_col=0, fill_na_value=0, top_n=10, sample_size=10000,
+                                   previous_model=None):
+        """
+        Cluster a cohort too large for memory by streaming the CSV in chunks.
+
+        The file is read several times, a chunk at a time:
+        1. StandardScaler.partial_fit learns the feature means and scales,
+           and a uniform sample of sample_size rows is kept.
+        2. A full KMeans on the sample seeds the centroids. Then
+           MiniBatchKMeans.partial_fit runs over shuffled mini-batches of
+           every chunk, `epochs` times.
+        3. Every student is assigned a cluster. Per-cluster total score
+           sums, extremes and the top_n students are accumulated, and the
+           clusters are named from their mean totals exactly like
+           perform_clustering does.
+        4. The labelled rows (with Previous_Group when warm-started) are
+           appended to the results CSV.
+
+        Memory use depends on chunksize, not on the cohort size. Only one
+        small cluster id per student is kept between passes.
+        processed_data and X_scaled are not populated. The results land in
+        group_statistics (same layout as print_group_statistics) and
+        results_file instead.
+
+        Args:
+            n_clusters (int): Number of clusters to create
+            chunksize (int): Rows read per chunk
+            batch_size (int): Rows per MiniBatchKMeans update
+            epochs (int): Passes of mini-batch updates over the file
+            random_state (int): Random seed for reproducibility
+            index_col (int): Column to use as index
+            fill_na_value: Value to use for filling NA/NaN values
+            top_n (int): Students listed per group in group_statistics
+            sample_size (int): Rows sampled to seed the centroids
+            previous_model (ClusterModel, optional): Earlier run whose
+                centroids seed the mini-batch updates instead of the sample
+                KMeans, and whose group names and per-student groups are kept
+                (as in perform_clustering)
+
+        Returns:
+            bool: True if clustering was successful, False otherwise
+        """
+        def chunks():
+            for chunk in pd.read_csv(self.data_file, index_col=index_col, chunksize=chunksize):
+                chunk = prepare_marks(chunk, fill_na_value)
+                yield chunk, chunk.columns.drop(ID_COLUMNS)
+
+        try:
+            if not os.path.exists(self.data_file):
+                raise FileNotFoundError(f"Data file not found: {self.data_file}")
+
+            rng = np.random.default_rng(random_state)
+            with self.profiler.stage('scale'):
+                scaler = StandardScaler()
+                sample, sample_keys = None, None
+                for chunk, exam_columns in chunks():
+                    X = chunk[exam_columns].to_numpy(dtype=np.float64)
+                    scaler.partial_fit(X)
+                    # Uniform sample of the whole file: keep the rows with the smallest random keys
+                    keys = rng.random(len(X))
+                    if sample is not None:
+                        X, keys = np.vstack([sample, X]), np.concatenate([sample_keys, keys])
+                    keep = np.argsort(keys)[:sample_size]
+                    sample, sample_keys = X[keep], keys[keep]
+
+            with self.profiler.stage('kmeans'):
+                if previous_model is not None:
+                    self.scaler = scaler
+                    centers = self._warm_start(previous_model, exam_columns)
+                else:
+                    # Seed the mini-batch updates with the best of several full KMeans runs
+                    # on the sample, so the result does not hinge on which rows come first
+                    seed = KMeans(n_clusters=n_clusters, random_state=random_state, n_init=10)
+                    centers = seed.fit(scaler.transform(sample)).cluster_centers_
+                n_clusters = len(centers)
+                kmeans = MiniBatchKMeans(n_clusters=n_clusters, batch_size=batch_size, random_state=random_state,
+                                         init=centers, n_init=1)
+                for _ in range(epochs):
+                    for chunk, exam_columns in chunks():
+                        X = scaler.transform(chunk[exam_columns].to_numpy(dtype=np.float64))
+                        X = X[rng.permutation(len(X))]
+                        for start in range(0, len(X), batch_size):
+                            kmeans.partial_fit(X[start:start + batch_size])
+
+            with self.profiler.stage('assign'):
+                assignments = []
+                counts = np.zeros(n_clusters, dtype=np.int64)
+                sums = np.zeros(n_clusters)
+                lowest = np.full(n_clusters, np.inf)
+                highest = np.full(n_clusters, -np.inf)
+                top = [BoundedTopK(top_n) for _ in range(n_clusters)]
+                seen = 0
+                for chunk, exam_columns in chunks():
+                    cluster = kmeans.predict(scaler.transform(chunk[exam_columns].to_numpy(dtype=np.float64)))
+                    total = chunk[exam_columns].sum(axis=1).to_numpy(dtype=np.float64)
+                    counts += np.bincount(cluster, minlength=n_clusters)
+                    sums += np.bincount(cluster, weights=total, minlength=n_clusters)
+                    np.minimum.at(lowest, cluster, total)
+                    np.maximum.at(highest, cluster, total)
+                    ids, names = chunk['StudentID'].to_numpy(), chunk['Student Name'].to_numpy()
+                    for c in range(n_clusters):
+                        members = np.flatnonzero(cluster == c)
+                        for position in members[top_k_indices(total[members], top_n)]:
+                            top[c].push(total[position], seen + position,
+                                        {'id': ids[position], 'name': names[position], 'total': total[position]})
+                    assignments.append(cluster.astype(np.int16))
+                    seen += len(chunk)
+
+                if previous_model is not None:
+                    self.labels, self.groups = dict(previous_model.labels), list(previous_model.groups)
+                else:
+                    with np.errstate(invalid='ignore', divide='ignore'):
+                        self.labels, self.groups = performance_labels(pd.Series(sums / counts))
+
+            with self.profiler.stage('save'):
+                # Read before writing: the previous results file may be the one about to be replaced
+                previous = previous_model.previous_groups() if previous_model is not None else None
+                self.previous_assignments = (previous_model, previous)
+                self.results_file = os.path.join(self.output_dir, f"student_analysis_{self.timestamp}.csv")
+                for i, (chunk, exam_columns) in enumerate(chunks()):
+                    chunk['Cluster'] = assignments[i]
+                    chunk['Total'] = chunk[exam_columns].sum(axis=1)
+                    chunk['Group'] = chunk['Cluster'].map(self.labels)
+                    if previous is not None:
+                        chunk['Previous_Group'] = previous_group_column(chunk['StudentID'], previous)
+                    chunk.to_csv(self.results_file, mode='w' if i == 0 else 'a', header=i == 0)
+                print(f"Clustering results saved to: {self.results_file}")
+
+            by_group = {label: cluster for cluster, label in self.labels.items()}
+            self.group_statistics = {
+                group: {
+                    'count': int(counts[by_group[group]]),
+                    'avg_score': sums[by_group[group]] / counts[by_group[group]] if counts[by_group[group]] else np.nan,
+                    'min_score': lowest[by_group[group]],
+                    'max_score': highest[by_group[group]],
+                    'students': top[by_group[group]].items()
+                }
+                for group in self.groups
+            }
+            self.scaler, self.kmeans = scaler, kmeans
+            self.model = ClusterModel.from_fitted(scaler, kmeans, list(exam_columns), self.labels, self.groups,
+                                                  source=self.data_file)
+            return True
+        except Exception as e:
+            print(f"Error performing chunked clustering: {e}")
+            return False
+
+    def project_2d(self):
+        """
+        Two-component PCA projection of X_scaled.
+
+        Fitted once per scaled matrix and reused by later plots (another
+        dpi, plot mode or a re-clustering of the same data).
+
+        Returns:
+            tuple: (components, explained_variance_ratio)
+        """
+        if self.pca_components is None:
+            with self.profiler.stage('pca'):
+                self.pca = PCA(n_components=2)
+                self.pca_components = self.pca.fit_transform(self.X_scaled)
+        return self.pca_components, self.pca.explained_variance_ratio_
+
+    @profiled('plot')
+    def visualize_clusters(self, dpi=300, mode='auto', max_points=5000, density_threshold=10000, gridsize=60):
         """
         Visualize clusters using PCA for dimensionality reduction.
 
+        Args:
+            dpi (int): Output resolution; use a low value for previews
+            mode (str): 'scatter' draws every student; 'sample' draws a
+                stratified sample of max_points students (every group keeps
+                its share, and at least a few points); 'density' draws one
+                hexbin panel per group; 'auto' uses scatter up to
+                density_threshold students and density above
+            max_points (int): Points drawn in 'sample' mode
+            density_threshold (int): Cohort size where 'auto' switches to density
+            gridsize (int): Hexagons across in 'density' mode
+
         Returns:
             str: Path to the saved plot image
         """
         try:
             if self.processed_data is None or self.X_scaled is None:
                 raise ValueError("Clustering has not been performed. Please perform clustering first.")
+            if mode not in ('auto', 'scatter', 'sample', 'density'):
+                raise ValueError(f"Unknown plot mode: {mode}")
+            if mode == 'auto':
+                mode = 'scatter' if len(self.X_scaled) <= density_threshold else 'density'
 
-            # Reduce dimensions with PCA
-            pca = PCA(n_components=2)
-            components = pca.fit_transform(self.X_scaled)
+            # Reuse the previous plot when the clustering it shows is unchanged
+            chart_cache = ChartCache(self.output_dir)
+            key = chart_key('student_clusters',
+                            (self.X_scaled, self.processed_data['Group'].to_numpy(), list(self.groups),
+                             mode, max_points, gridsize),
+                            'default', dpi)
+            cached_path = chart_cache.lookup('student_clusters', key)
+            if cached_path is not None:
+                print(f"Cluster visualization unchanged: {cached_path}")
+                return cached_path
+
+            import matplotlib.pyplot as plt
 
-            # Plot the clusters
-            plt.figure(figsize=(10, 8))
+            # Reduce dimensions with PCA
+            components, explained_variance = self.project_2d()
+            groups = self.processed_data['Group'].to_numpy()
             colors = ['g', 'b', 'r', 'c', 'm', 'y', 'k']  # Support for more clusters
+            xlabel = f'PCA 1 ({explained_variance[0]:.2%} variance)'
+            ylabel = f'PCA 2 ({explained_variance[1]:.2%} variance)'
+
+            if mode == 'density':
+                self._plot_density(plt, components, groups, colors, gridsize, xlabel, ylabel)
+            else:
+                title = 'Student Performance Clusters'
+                shown = np.arange(len(components))
+                if mode == 'sample' and len(shown) > max_points:
+                    shown = self._stratified_sample(groups, max_points)
+                    title += f' ({len(shown):,} of {len(components):,} students shown)'
 
-            for i, group in enumerate(self.groups):
-                idx = self.processed_data['Group'] == group
-                plt.scatter(
-                    components[idx, 0],
-                    components[idx, 1],
-                    label=group,
-                    alpha=0.7,
-                    c=colors[i % len(colors)]
-                )
-
-            # Add explained variance information
-            explained_variance = pca.explained_variance_ratio_
-            plt.xlabel(f'PCA 1 ({explained_variance[0]:.2%} variance)')
-            plt.ylabel(f'PCA 2 ({explained_variance[1]:.2%} variance)')
-            plt.title('Student Performance Clusters')
-            plt.legend()
-            plt.grid(alpha=0.3)
+                # Plot the clusters
+                plt.figure(figsize=(10, 8))
+                for i, group in enumerate(self.groups):
+                    idx = shown[groups[shown] == group]
+                    plt.scatter(
+                        components[idx, 0],
+                        components[idx, 1],
+                        label=group,
+                        alpha=0.7,
+                        c=colors[i % len(colors)],
+                        s=None if mode == 'scatter' else 8
+                    )
+
+                # Add explained variance information
+                plt.xlabel(xlabel)
+                plt.ylabel(ylabel)
+                plt.title(title)
+                plt.legend()
+                plt.grid(alpha=0.3)
 
             plot_path = os.path.join(self.output_dir, f"student_clusters_{self.timestamp}.png")
-            plt.savefig(plot_path, bbox_inches='tight', dpi=300)
+            plt.savefig(plot_path, bbox_inches='tight', dpi=dpi)
             plt.close()
+            chart_cache.record('student_clusters', key, plot_path, source=self.data_file)
+            chart_cache.save()
 
             print(f"Cluster visualization saved to: {plot_path}")
             return plot_path
@@ -176,6 +726,36 @@ class ClusterAnalyzer:
             print(f"Error visualizing clusters: {e}")
             return None
 
+    def _stratified_sample(self, groups, max_points, random_state=83):
+        """Row positions of about max_points students, each group keeping its share (at least 20)"""
+        rng = np.random.default_rng(random_state)
+        shown = []
+        for group in self.groups:
+            members = np.flatnonzero(groups == group)
+            take = min(len(members), max(20, round(max_points * len(members) / len(groups))))
+            shown.append(rng.choice(members, take, replace=False))
+        return np.sort(np.concatenate(shown))
+
+    def _plot_density(self, plt, components, groups, colors, gridsize, xlabel, ylabel):
+        """One hexbin panel per group on shared axes; darker means more students"""
+        from matplotlib.colors import LinearSegmentedColormap
+
+        extent = (components[:, 0].min(), components[:, 0].max(), components[:, 1].min(), components[:, 1].max())
+        fig, axes = plt.subplots(1, len(self.groups), figsize=(5 * len(self.groups), 5), sharex=True, sharey=True,
+                                 squeeze=False)
+        for i, (group, ax) in enumerate(zip(self.groups, axes[0])):
+            idx = groups == group
+            cmap = LinearSegmentedColormap.from_list(group, ['white', colors[i % len(colors)]])
+            hexbin = ax.hexbin(components[idx, 0], components[idx, 1], gridsize=gridsize, extent=extent,
+                               cmap=cmap, mincnt=1)
+            fig.colorbar(hexbin, ax=ax, label='Students')
+            ax.set_title(f'{group} ({idx.sum():,} students)')
+            ax.set_xlabel(xlabel)
+            ax.grid(alpha=0.3)
+        axes[0][0].set_ylabel(ylabel)
+        fig.suptitle('Student Performance Clusters (density)')
+
+    @profiled('save')
     def save_results(self):
         """
         Save clustered results to a CSV file.
@@ -189,12 +769,265 @@ class ClusterAnalyzer:
 
             results_path = os.path.join(self.output_dir, f"student_analysis_{self.timestamp}.csv")
             self.processed_data.to_csv(results_path)
+            self.results_file = results_path
             print(f"Clustering results saved to: {results_path}")
             return results_path
         except Exception as e:
             print(f"Error saving results: {e}")
             return None
 
+    @profiled('stability')
+    def assess_stability(self, n_resamples=50, workers=None, threshold=0.8, random_state=83):
+        """
+        Measure how reliably each student and each group is reproduced.
+
+        Scaling and KMeans are rerun on n_resamples bootstrap resamples (see
+        bootstrap_labels) in a 'spawn' process pool. The unscaled marks are
+        placed in one shared memory block that every worker maps instead of
+        receiving a copy.
+
+        Each student's co-assignment frequency (the share of resamples that
+        put them in their own group) is stored in the Stability column of
+        processed_data. Each group's stability is its mean Jaccard
+        similarity with the matching bootstrap cluster, over the students
+        in each resample; below about 0.6 a group is not reproducible.
+
+        Args:
+            n_resamples (int): Bootstrap resamples
+            workers (int, optional): Process count; None uses the CPU count,
+                1 runs in-process
+            threshold (float): Students with a lower frequency are borderline
+            random_state (int): Seed of the first resample
+
+        Returns:
+            dict: replicates, cluster_jaccard (group -> mean Jaccard),
+                borderline_students (count per group) and threshold
+
+        Raises:
+            ValueError: If clustering has not been performed
+        """
+        if self.processed_data is None or 'Cluster' not in self.processed_data.columns or self.kmeans is None:
+            raise ValueError("Clustering has not been performed. Please perform clustering first.")
+
+        marks = self.processed_data[self.exam_columns()].to_numpy(dtype=np.float64)
+        reference = self.processed_data['Cluster'].to_numpy()
+        reference_centroids = self.kmeans.cluster_centers_ * self.scaler.scale_ + self.scaler.mean_
+        reference_scale = self.scaler.scale_
+        n_clusters = len(reference_centroids)
+        seeds = [random_state + i for i in range(n_resamples)]
+
+        agree = np.zeros(len(marks), dtype=np.int32)
+        jaccard = np.zeros((n_resamples, n_clusters))
+
+        def collect(i, labels, in_bag):
+            agree[:] += labels == reference
+            for cluster in range(n_clusters):
+                ours, theirs = reference[in_bag] == cluster, labels[in_bag] == cluster
+                union = np.count_nonzero(ours | theirs)
+                jaccard[i, cluster] = np.count_nonzero(ours & theirs) / union if union else 1.0
+
+        workers = min(workers or os.cpu_count() or 1, os.cpu_count() or 1, n_resamples)
+        if workers <= 1:
+            for i, seed in enumerate(seeds):
+                collect(i, *bootstrap_labels(marks, seed, reference_centroids, reference_scale))
+        else:
+            memory = shared_memory.SharedMemory(create=True, size=marks.nbytes)
+            try:
+                np.ndarray(marks.shape, dtype=marks.dtype, buffer=memory.buf)[:] = marks
+                context = multiprocessing.get_context('spawn')
+                with ProcessPoolExecutor(max_workers=workers, mp_context=context, initializer=_init_stability_worker,
+                                         initargs=(memory.name, marks.shape, marks.dtype, reference_centroids,
+                                                   reference_scale)) as pool:
+                    for i, (labels, in_bag) in enumerate(pool.map(_bootstrap_worker, seeds)):
+                        collect(i, labels, in_bag)
+            finally:
+                memory.close()
+                memory.unlink()
+
+        self.processed_data['Stability'] = agree / n_resamples
+        borderline = self.processed_data[self.processed_data['Stability'] < threshold]
+        self.stability = {
+            'replicates': n_resamples,
+            'threshold': threshold,
+            'cluster_jaccard': {group: float(jaccard[:, cluster].mean())
+                                for group, cluster in sorted(((self.labels[cluster], cluster)
+                                                              for cluster in range(n_clusters)),
+                                                             key=lambda item: self.groups.index(item[0]))},
+            'borderline_students': {group: int((borderline['Group'] == group).sum()) for group in self.groups},
+        }
+        print(f"Cluster stability over {n_resamples} resamples: " +
+              ", ".join(f"{group} {score:.2f}" for group, score in self.stability['cluster_jaccard'].items()))
+        return self.stability
+
+    @profiled('index')
+    def build_student_index(self, id_column='StudentID', name_column='Student Name'):
+        """
+        Build a nearest-neighbour index over the standardized marks.
+
+        Uses the X_scaled matrix and scaler of the clustering, so "similar"
+        means close in the space KMeans works in.
+
+        Returns:
+            StudentIndex: The index (also kept in student_index)
+        """
+        if self.processed_data is None:
+            raise ValueError("Data not loaded. Please load the data first.")
+        X = self.scale_features()
+        self.student_index = StudentIndex(self.processed_data[id_column].to_numpy(),
+                                          self.processed_data[name_column].to_numpy(dtype=object), X,
+                                          list(self.exam_columns()), self.scaler.mean_, self.scaler.scale_)
+        return self.student_index
+
+    def save_student_index(self):
+        """
+        Save the student index next to the results.
+
+        Returns:
+            str: Path to the index file, or None if there is no index
+        """
+        if self.student_index is None:
+            print("Error saving student index: The index has not been built.")
+            return None
+        index_path = self.student_index.save(os.path.join(self.output_dir, f"student_index_{self.timestamp}.npz"))
+        print(f"Student index saved to: {index_path}")
+        return index_path
+
+    def save_model(self):
+        """
+        Save the fitted model (scaler, centroids, group names) next to the results.
+
+        Returns:
+            str: Path to the model file, or None if there is no model
+        """
+        if self.model is None:
+            print("Error saving model: Clustering has not been performed.")
+            return None
+        self.model.results_file = self.results_file
+        model_path = self.model.save(os.path.join(self.output_dir, f"cluster_model_{self.timestamp}.json"))
+        print(f"Cluster model saved to: {model_path}")
+        return model_path
+
+    def load_model(self, model_file):
+        """
+        Load a model saved by save_model, replacing the current one.
+
+        Args:
+            model_file (str): Path to the model file
+
+        Returns:
+            ClusterModel: The loaded model
+
+        Raises:
+            ValueError: If the file is not a supported model
+        """
+        self.model = ClusterModel.load(model_file)
+        self.labels, self.groups = self.model.labels, self.model.groups
+        return self.model
+
+    @profiled('assign')
+    def assign_students(self, students, fill_na_value=0):
+        """
+        Place new or updated students into the existing groups without refitting.
+
+        Args:
+            students (pd.DataFrame or str): Student rows in the result file
+                layout, or the path of a CSV holding them
+            fill_na_value: Value to use for filling NA/NaN values
+
+        Returns:
+            pd.DataFrame: The students with Cluster, Total and Group columns
+
+        Raises:
+            ValueError: If no model has been fitted or loaded
+        """
+        if self.model is None:
+            raise ValueError("No cluster model. Perform clustering or load a model first.")
+        if isinstance(students, str):
+            students = pd.read_csv(students, index_col=0)
+        return self.model.assign(students, fill_na_value)
+
+    def group_transitions(self, previous_model, id_column='StudentID'):
+        """
+        Transition matrix from a previous run's groups to the current ones.
+
+        The previous assignments read by the clustering that used
+        previous_model are reused: with a shared timestamp, this run's
+        results may already have replaced that model's results_file.
+
+        Args:
+            previous_model (ClusterModel): Model of the previous run; its
+                results_file supplies the previous assignments
+            id_column (str): Column identifying a student across runs
+
+        Returns:
+            pd.DataFrame: See transition_matrix, or None when the previous
+                results file is not available
+        """
+        if (self.previous_assignments is not None and self.previous_assignments[0] is previous_model
+                and id_column == 'StudentID'):
+            previous = self.previous_assignments[1]
+        else:
+            previous = previous_model.previous_groups(id_column)
+        if previous is None:
+            return None
+        if self.processed_data is not None and 'Group' in self.processed_data.columns:
+            current = self.processed_data.set_index(id_column)['Group']
+        else:
+            current = pd.read_csv(self.results_file, usecols=[id_column, 'Group']).set_index(id_column)['Group']
+        return transition_matrix(previous, current, self.groups)
+
+    def compute_group_statistics(self, top_n=10, id_column='StudentID', name_column='Student Name'):
+        """
+        Per-group statistics from one grouped aggregation.
+
+        Counts, means, standard deviations and extremes of the Total and of
+        every feature come from a single groupby().agg() call. The top_n
+        students per group are found with partial selection (top_k_indices)
+        instead of sorting each group.
+
+        Args:
+            top_n (int): Students listed per group
+            id_column (str): Name of the ID column
+            name_column (str): Name of the name column
+
+        Returns:
+            dict: group -> {count, avg_score, std_score, min_score, max_score,
+                features: {feature: {mean, std, min, max}},
+                students: [{id, name, total}] best first}, in self.groups order
+        """
+        if self.processed_data is None or 'Group' not in self.processed_data.columns:
+            raise ValueError("Clustering has not been performed. Please perform clustering first.")
+
+        data = self.processed_data
+        features = list(self.exam_columns())
+        aggregated = data.groupby('Group', observed=True)[features + ['Total']].agg(['count', 'mean', 'std',
+                                                                                      'min', 'max'])
+        aggregated = aggregated.reindex(self.groups)
+
+        group_values = data['Group'].to_numpy()
+        totals = data['Total'].to_numpy(dtype=np.float64)
+        ids, names = data[id_column].to_numpy(), data[name_column].to_numpy()
+
+        statistics = {}
+        for group in self.groups:
+            row = aggregated.loc[group]
+            members = np.flatnonzero(group_values == group)
+            top = members[top_k_indices(totals[members], top_n)]
+            statistics[group] = {
+                'count': int(row[('Total', 'count')]) if not pd.isna(row[('Total', 'count')]) else 0,
+                'avg_score': row[('Total', 'mean')],
+                'std_score': row[('Total', 'std')],
+                'min_score': row[('Total', 'min')],
+                'max_score': row[('Total', 'max')],
+                'features': {feature: {stat: row[(feature, stat)] for stat in ('mean', 'std', 'min', 'max')}
+                             for feature in features},
+                'students': [{'id': student_id, 'name': name, 'total': total}
+                             for student_id, name, total in zip(ids[top].tolist(), names[top].tolist(),
+                                                                totals[top].tolist())]
+            }
+        return statistics
+
+    @profiled('statistics')
     def print_group_statistics(self, id_column='StudentID', name_column='Student Name'):
         """
         Print statistics for each group.
@@ -204,57 +1037,45 @@ class ClusterAnalyzer:
             name_column (str): Name of the name column
 
         Returns:
-            dict: Statistics for each group
+            dict: Statistics for each group (see compute_group_statistics)
         """
         if self.processed_data is None:
             raise ValueError("Clustering has not been performed. Please perform clustering first.")
 
-        stats = {}
+        stats = self.compute_group_statistics(10, id_column, name_column)
+        self.group_statistics = stats
         print("\n==== Student Group Statistics ====")
 
-        for group in self.groups:
-            group_df = self.processed_data[self.processed_data['Group'] == group]
-            print(f"\n{group} students ({len(group_df)} total):")
-            print(f"Average total score: {group_df['Total'].mean():.2f}")
-            print(f"Score range: {group_df['Total'].min():.2f} - {group_df['Total'].max():.2f}")
-
-            # Collect statistics
-            stats[group] = {
-                'count': len(group_df),
-                'avg_score': group_df['Total'].mean(),
-                'min_score': group_df['Total'].min(),
-                'max_score': group_df['Total'].max(),
-                'students': []
-            }
+        for group, group_stats in stats.items():
+            print(f"\n{group} students ({group_stats['count']} total):")
+            print(f"Average total score: {group_stats['avg_score']:.2f}")
+            print(f"Score range: {group_stats['min_score']:.2f} - {group_stats['max_score']:.2f}")
 
             # Print student details
             print("\nStudent details:")
-            columns_to_show = [id_column, name_column, 'Total']
-            top_students = group_df[columns_to_show].sort_values('Total', ascending=False).head(10)
-            print(top_students)
-
-            # Add students to stats
-            for _, student in top_students.iterrows():
-                stats[group]['students'].append({
-                    'id': student[id_column],
-                    'name': student[name_column],
-                    'total': student['Total']
-                })
+            print(pd.DataFrame(group_stats['students']).rename(
+                columns={'id': id_column, 'name': name_column, 'total': 'Total'}))
 
-            if len(group_df) > 10:
-                print(f"... and {len(group_df) - 10} more students")
+            if group_stats['count'] > 10:
+                print(f"... and {group_stats['count'] - 10} more students")
 
         return stats
 
-    def generate_cluster_report(self):
+    @profiled('report')
+    def generate_cluster_report(self, statistics=None):
         """
         Generate a detailed report on the clustering results.
 
+        Args:
+            statistics (dict, optional): Group statistics in the
+                compute_group_statistics layout; computed from processed_data
+                when not given (the chunked mode passes its group_statistics)
+
         Returns:
             str: Path to the saved report file
         """
-        if self.processed_data is None:
-            raise ValueError("Clustering has not been performed. Please perform clustering first.")
+        if statistics is None:
+            statistics = self.compute_group_statistics(5)
 
         report_path = os.path.join(self.output_dir, f"cluster_analysis_report_{self.timestamp}.txt")
 
@@ -265,24 +1086,28 @@ class ClusterAnalyzer:
 
             f.write("CLUSTER SUMMARY:\n")
             f.write("-"*40 + "\n")
-            f.write(f"Total Students: {len(self.processed_data)}\n")
+            f.write(f"Total Students: {sum(stats['count'] for stats in statistics.values())}\n")
             f.write(f"Number of Clusters: {len(self.groups)}\n")
             f.write(f"Cluster Labels: {', '.join(self.groups)}\n\n")
 
             # Group statistics
             for group in self.groups:
-                group_df = self.processed_data[self.processed_data['Group'] == group]
+                stats = statistics[group]
                 f.write(f"\n{group.upper()} GROUP STATISTICS:\n")
                 f.write("-"*40 + "\n")
-                f.write(f"Number of Students: {len(group_df)}\n")
-                f.write(f"Average Total Score: {group_df['Total'].mean():.2f}\n")
-                f.write(f"Score Range: {group_df['Total'].min():.2f} - {group_df['Total'].max():.2f}\n")
+                f.write(f"Number of Students: {stats['count']}\n")
+                f.write(f"Average Total Score: {stats['avg_score']:.2f}\n")
+                f.write(f"Score Range: {stats['min_score']:.2f} - {stats['max_score']:.2f}\n")
+                if self.stability is not None:
+                    f.write(f"Stability (mean Jaccard over {self.stability['replicates']} resamples): "
+                            f"{self.stability['cluster_jaccard'][group]:.2f}\n")
+                    f.write(f"Borderline Students (co-assigned under {self.stability['threshold']:.0%}): "
+                            f"{self.stability['borderline_students'][group]}\n")
 
                 # Top 5 students in the group
                 f.write("\nTop 5 Students in this Group:\n")
-                top_students = group_df.sort_values('Total', ascending=False).head(5)
-                for i, (_, student) in enumerate(top_students.iterrows(), 1):
-                    f.write(f"{i}. {student['Student Name']} - Total Score: {student['Total']:.2f}\n")
+                for i, student in enumerate(stats['students'][:5], 1):
+                    f.write(f"{i}. {student['name']} - Total Score: {student['total']:.2f}\n")
 
             f.write("\n" + "="*80 + "\n")
             f.write(f"Report generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
@@ -291,45 +1116,130 @@ class ClusterAnalyzer:
         print(f"Cluster analysis report saved to: {report_path}")
         return report_path
 
-    def run_full_analysis(self, n_clusters=3):
+    def save_transitions(self, transitions):
+        """
+        Save a transition matrix next to the results.
+
+        Returns:
+            str: Path to the CSV file
+        """
+        transitions_path = os.path.join(self.output_dir, f"cluster_transitions_{self.timestamp}.csv")
+        transitions.to_csv(transitions_path, index_label='Previous Group')
+        print(f"Group transitions saved to: {transitions_path}")
+        return transitions_path
+
+    def run_full_analysis(self, n_clusters=3, mode='full', chunksize=50000, k_values=DEFAULT_K_VALUES,
+                          workers=None, previous_model=None, plot_mode='auto', dpi=300, stability=0):
         """
         Run the complete clustering workflow.
 
         Args:
-            n_clusters (int): Number of clusters to create
+            n_clusters (int or str): Number of clusters to create, or 'auto'
+                to pick it from k_values with evaluate_k ('full' mode only)
+            mode (str): 'full' clusters the whole cohort in memory; 'minibatch'
+                streams the file in chunks (see perform_chunked_clustering)
+                and skips the PCA plot, which needs every student in memory
+            chunksize (int): Rows per chunk in 'minibatch' mode
+            k_values (iterable): Candidate cluster counts for n_clusters='auto'
+            workers (int, optional): Processes used to score the candidates
+            previous_model (ClusterModel or str, optional): Model (or model
+                file) of an earlier run to warm-start from; group names stay
+                on the same centroids and the transitions from that run's
+                groups are reported
+            plot_mode (str): Cluster plot mode (see visualize_clusters)
+            dpi (int): Cluster plot resolution
+            stability (int): Bootstrap resamples for assess_stability
+                ('full' mode only); 0 skips it
 
         Returns:
-            dict: Paths to generated files and statistics
+            dict: Paths to generated files and statistics, the number of
+                clusters used, for n_clusters='auto' the k_selection, and for
+                a warm start the transitions ({previous: {current: count}}),
+                and the stability summary when requested
         """
         results = {
             'success': False,
             'cluster_plot': None,
             'csv_file': None,
             'report_file': None,
-            'statistics': None
+            'statistics': None,
+            'model_file': None,
+            'index_file': None,
+            'n_clusters': n_clusters,
+            'k_selection': None,
+            'kmeans_iterations': None,
+            'transitions': None,
+            'transitions_file': None,
+            'stability': None,
+            'profile': None
         }
 
+        if mode not in ('full', 'minibatch'):
+            raise ValueError(f"Unknown clustering mode: {mode}")
+        if n_clusters == 'auto' and mode != 'full':
+            raise ValueError("n_clusters='auto' needs mode='full'")
+        if stability and mode != 'full':
+            raise ValueError("stability needs mode='full'")
+        if n_clusters == 'auto' and previous_model is not None:
+            raise ValueError("n_clusters='auto' cannot be combined with a previous model")
+
         try:
-            # Step 1: Load and preprocess data
-            if not self.load_data():
-                return results
+            if isinstance(previous_model, str):
+                previous_model = ClusterModel.load(previous_model)
+
+            if mode == 'minibatch':
+                if not self.perform_chunked_clustering(n_clusters=n_clusters, chunksize=chunksize,
+                                                       previous_model=previous_model):
+                    return results
+                results['csv_file'] = self.results_file
+                results['model_file'] = self.save_model()
+                results['report_file'] = self.generate_cluster_report(self.group_statistics)
+                results['statistics'] = self.group_statistics
+            else:
+                # Step 1: Load and preprocess data
+                if not self.load_data():
+                    return results
+
+                # Step 2: Pick the number of clusters, reusing the scaled matrix
+                if n_clusters == 'auto':
+                    results['k_selection'] = self.evaluate_k(k_values, workers=workers)
+                    n_clusters = results['k_selection']['best_k']
+
+                # Step 3: Perform clustering
+                if not self.perform_clustering(n_clusters=n_clusters, previous_model=previous_model):
+                    return results
+
+                # Optional: bootstrap stability, stored with the results
+                if stability:
+                    results['stability'] = self.assess_stability(stability, workers=workers)
+
+                # Step 4: Visualize clusters
+                results['cluster_plot'] = self.visualize_clusters(dpi=dpi, mode=plot_mode)
 
-            # Step 2: Perform clustering
-            if not self.perform_clustering(n_clusters=n_clusters):
-                return results
+                # Step 5: Save results to CSV
+                results['csv_file'] = self.save_results()
+                results['model_file'] = self.save_model()
+                self.build_student_index()
+                results['index_file'] = self.save_student_index()
 
-            # Step 3: Visualize clusters
-            results['cluster_plot'] = self.visualize_clusters()
+                # Step 6: Calculate statistics
+                results['statistics'] = self.print_group_statistics()
 
-            # Step 4: Save results to CSV
-            results['csv_file'] = self.save_results()
+                # Step 7: Generate report from the same statistics
+                results['report_file'] = self.generate_cluster_report(results['statistics'])
 
-            # Step 5: Generate report
-            results['report_file'] = self.generate_cluster_report()
+            results['n_clusters'] = len(self.groups)
+            results['kmeans_iterations'] = getattr(self.kmeans, 'n_iter_', None)
 
-            # Step 6: Calculate statistics
-            results['statistics'] = self.print_group_statistics()
+            # Compare with the previous run's assignments
+            if previous_model is not None:
+                transitions = self.group_transitions(previous_model)
+                if transitions is not None:
+                    results['transitions'] = transitions.to_dict(orient='index')
+                    results['transitions_file'] = self.save_transitions(transitions)
 
+            if self.profiler.enabled:
+                results['profile'] = self.profiler.to_dict()
             results['success'] = True
             return results
         except Exception as e:
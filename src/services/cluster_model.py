@@ -0,0 +1,209 @@
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Bump when the model file layout changes
+MODEL_VERSION = 1
+
+
+class ClusterModel:
+    """
+    A fitted clustering: scaler statistics, centroids and group names.
+
+    Saved as a small JSON file next to the clustering results, it places
+    late registrations and re-takes into the existing groups without
+    refitting or reloading the rest of the cohort. Assigning is one
+    standardization and one distance computation against the centroids.
+
+    The next term's clustering can start from the same centroids (see
+    seed_centroids), which keeps each group name on the same centroid, and
+    compare its assignments with the ones in results_file.
+    """
+
+    def __init__(self, features, mean, scale, centroids, labels, groups, source=None, created=None,
+                 results_file=None):
+        self.features = list(features)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.centroids = np.asarray(centroids, dtype=np.float64)
+        # cluster id -> group name, and the group names best first
+        self.labels = {int(cluster): label for cluster, label in labels.items()}
+        self.groups = list(groups)
+        self.source = source
+        self.created = created or datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        # Per-student results CSV of the run that fitted the model
+        self.results_file = results_file
+
+        if self.centroids.shape[1] != len(self.features) or len(self.mean) != len(self.features):
+            raise ValueError("Model features, scaler and centroids disagree in size")
+
+    @classmethod
+    def from_fitted(cls, scaler, kmeans, features, labels, groups, source=None, results_file=None):
+        """
+        Build a model from a fitted StandardScaler and (MiniBatch)KMeans.
+
+        Args:
+            scaler (StandardScaler): Scaler fitted on the feature columns
+            kmeans (KMeans): Model fitted on the scaled features
+            features (list): Feature column names, in fitting order
+            labels (dict): cluster id -> group name
+            groups (list): Group names, best first
+            source (str, optional): Input file the model was fitted on
+            results_file (str, optional): Results CSV of the fitting run
+
+        Returns:
+            ClusterModel: The model
+        """
+        return cls(features, scaler.mean_, scaler.scale_, kmeans.cluster_centers_, labels, groups, source=source,
+                   results_file=results_file)
+
+    def transform(self, frame):
+        """
+        Standardize the feature columns of a frame with the stored scaler.
+
+        Args:
+            frame (pd.DataFrame): Prepared marks (see cluster_analyzer.prepare_marks)
+
+        Returns:
+            np.ndarray: Scaled feature matrix
+
+        Raises:
+            KeyError: If a feature column is missing
+        """
+        missing = [feature for feature in self.features if feature not in frame.columns]
+        if missing:
+            raise KeyError(f"Missing feature columns: {', '.join(missing)}")
+        X = frame[self.features].to_numpy(dtype=np.float64)
+        return (X - self.mean) / self.scale
+
+    def predict(self, X_scaled):
+        """
+        Index of the nearest centroid for every row.
+
+        Args:
+            X_scaled (np.ndarray): Scaled feature matrix
+
+        Returns:
+            np.ndarray: Cluster ids
+        """
+        # |x - c|^2 = |x|^2 - 2 x.c + |c|^2; |x|^2 is the same for every centroid
+        distances = (self.centroids ** 2).sum(axis=1) - 2 * X_scaled @ self.centroids.T
+        return distances.argmin(axis=1)
+
+    def seed_centroids(self, mean, scale):
+        """
+        The centroids expressed in another scaler's space.
+
+        Used as KMeans init when the next cohort is standardized with its
+        own mean and scale: the centroids are mapped back to marks and
+        re-standardized.
+
+        Args:
+            mean (np.ndarray): The new scaler's mean_
+            scale (np.ndarray): The new scaler's scale_
+
+        Returns:
+            np.ndarray: Centroids, one row per cluster id
+        """
+        marks = self.centroids * self.scale + self.mean
+        return (marks - np.asarray(mean, dtype=np.float64)) / np.asarray(scale, dtype=np.float64)
+
+    def previous_groups(self, id_column='StudentID'):
+        """
+        Group of every student in the fitting run's results CSV.
+
+        Returns:
+            pd.Series: Group names indexed by student ID, or None when the
+                results file is unknown or gone
+        """
+        if not self.results_file or not os.path.exists(self.results_file):
+            return None
+        assignments = pd.read_csv(self.results_file, usecols=[id_column, 'Group'])
+        return assignments.set_index(id_column)['Group']
+
+    def assign(self, frame, fill_na_value=0):
+        """
+        Place students into the existing groups.
+
+        Args:
+            frame (pd.DataFrame): Student rows, either raw results (CT1..CT4,
+                Mid-Term, ...) or already prepared marks
+            fill_na_value: Value to use for filling NA/NaN values
+
+        Returns:
+            pd.DataFrame: A copy of the prepared rows with Cluster, Total and
+                Group columns, as in the clustering results CSV
+        """
+        from src.services.cluster_analyzer import prepare_marks
+
+        if all(feature in frame.columns for feature in self.features):
+            prepared = frame.copy()
+            prepared[self.features] = prepared[self.features].fillna(fill_na_value)
+        else:
+            prepared = prepare_marks(frame.copy(), fill_na_value)
+
+        prepared['Cluster'] = self.predict(self.transform(prepared))
+        prepared['Total'] = prepared[self.features].sum(axis=1)
+        prepared['Group'] = prepared['Cluster'].map(self.labels)
+        return prepared
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: JSON-serializable model, tagged with MODEL_VERSION
+        """
+        return {
+            'version': MODEL_VERSION,
+            'created': self.created,
+            'source': self.source,
+            'features': self.features,
+            'scaler': {'mean': self.mean.tolist(), 'scale': self.scale.tolist()},
+            'centroids': self.centroids.tolist(),
+            'labels': {str(cluster): label for cluster, label in self.labels.items()},
+            'groups': self.groups,
+            'results_file': self.results_file,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Rebuild a model from to_dict output.
+
+        Raises:
+            ValueError: If the model was written by a different MODEL_VERSION
+        """
+        if data.get('version') != MODEL_VERSION:
+            raise ValueError(f"Unsupported cluster model version {data.get('version')} (expected {MODEL_VERSION})")
+        return cls(data['features'], data['scaler']['mean'], data['scaler']['scale'], data['centroids'],
+                   data['labels'], data['groups'], source=data.get('source'), created=data.get('created'),
+                   results_file=data.get('results_file'))
+
+    def save(self, file_path):
+        """Write the model atomically and return its path"""
+        data = self.to_dict()
+        # Stored relative to the model, so an output folder can be moved as a whole
+        if self.results_file:
+            data['results_file'] = os.path.relpath(self.results_file, os.path.dirname(os.path.abspath(file_path)))
+        tmp_path = file_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, file_path)
+        return file_path
+
+    @classmethod
+    def load(cls, file_path):
+        """
+        Read a model saved with save().
+
+        Raises:
+            ValueError: If the file is not a supported model
+        """
+        with open(file_path, 'r') as f:
+            model = cls.from_dict(json.load(f))
+        if model.results_file:
+            model.results_file = os.path.join(os.path.dirname(os.path.abspath(file_path)), model.results_file)
+        return model
+
@@ -1,4 +1,4 @@
-import pandas as pd
+from src.services.ingest_cache import read_table
 
 class DataProcessor:
     def __init__(self, file_path):
@@ -6,12 +6,7 @@ class DataProcessor:
         self.data = None
 
     def load_data(self):
-        if self.file_path.endswith('.csv'):
-            self.data = pd.read_csv(self.file_path)
-        elif self.file_path.endswith(('.xls', '.xlsx')):
-            self.data = pd.read_excel(self.file_path)
-        else:
-            raise ValueError("Unsupported file format. Please provide a CSV or Excel file.")
+        self.data = read_table(self.file_path)
 
     def get_data_summary(self):
         if self.data is not None:
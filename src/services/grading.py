@@ -0,0 +1,114 @@
+import json
+import numpy as np
+import pandas as pd
+
+
+class GradeScale:
+    """
+    Threshold table that maps percentages to labels.
+
+    A scale is a list of (minimum percentage, label) bands plus a fallback
+    label for anything below the lowest band. The whole column is binned in
+    one `np.searchsorted` call and returned as an ordered categorical, worst
+    label first, so a grade column costs one byte per row.
+    """
+
+    def __init__(self, name, bands, fallback):
+        """
+        Args:
+            name (str): Scale name, used in reports and config files
+            bands (list): (min_percentage, label) pairs, in any order
+            fallback (str): Label for percentages below every band
+        """
+        bands = sorted(((float(low), str(label)) for low, label in bands), key=lambda band: band[0])
+        cutoffs = [low for low, _ in bands]
+        if len(set(cutoffs)) != len(cutoffs):
+            raise ValueError(f"Grade scale '{name}' has duplicate thresholds.")
+
+        self.name = name
+        self.fallback = str(fallback)
+        self.cutoffs = np.array(cutoffs, dtype=np.float64)
+        self.labels = [self.fallback] + [label for _, label in bands]
+        if len(set(self.labels)) != len(self.labels):
+            raise ValueError(f"Grade scale '{name}' has duplicate labels.")
+
+    def apply(self, percentages):
+        """
+        Bin a column of percentages.
+
+        Args:
+            percentages (pd.Series | array-like): Percentages to grade
+
+        Returns:
+            pd.Series | pd.Categorical: Ordered categorical of labels; a Series
+            (keeping the index) when a Series was passed in
+        """
+        values = np.asarray(percentages, dtype=np.float64)
+        codes = np.searchsorted(self.cutoffs, values, side='right')
+        # NaN sorts past every cutoff; the old if/elif chain gave it the fallback
+        codes[np.isnan(values)] = 0
+        grades = pd.Categorical.from_codes(codes, categories=self.labels, ordered=True)
+        if isinstance(percentages, pd.Series):
+            return pd.Series(grades, index=percentages.index, name=percentages.name)
+        return grades
+
+    def to_dict(self):
+        """Return the scale in the config file layout"""
+        return {
+            'name': self.name,
+            'bands': [{'min': float(low), 'label': label}
+                      for low, label in zip(self.cutoffs[::-1], self.labels[:0:-1])],
+            'fallback': self.fallback
+        }
+
+    @classmethod
+    def from_dict(cls, config):
+        """Build a scale from the config file layout"""
+        return cls(config.get('name', 'custom'),
+                   [(band['min'], band['label']) for band in config['bands']],
+                   config['fallback'])
+
+    def __eq__(self, other):
+        return isinstance(other, GradeScale) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return f"GradeScale({self.name!r}, {len(self.cutoffs)} bands)"
+
+
+LETTER_GRADE_SCALE = GradeScale('letter', [
+    (80, 'A+'), (75, 'A'), (70, 'A-'), (65, 'B+'), (60, 'B'),
+    (55, 'B-'), (50, 'C+'), (45, 'C'), (40, 'D')
+], fallback='F')
+
+CATEGORY_SCALE = GradeScale('category', [
+    (80, 'Excellent'), (65, 'Good'), (50, 'Average'), (40, 'Below Average')
+], fallback='Poor')
+
+
+def load_grading_config(file_path):
+    """
+    Load grade and category scales from a JSON config file.
+
+    The file may define either or both of `grade_scale` and `category_scale`;
+    anything it leaves out falls back to the built-in scales. Example:
+
+        {"grade_scale": {"name": "pass-fail",
+                         "bands": [{"min": 50, "label": "Pass"}],
+                         "fallback": "Fail"}}
+
+    Args:
+        file_path (str): Path to the JSON config
+
+    Returns:
+        tuple: (grade_scale, category_scale)
+    """
+    with open(file_path, 'r') as f:
+        config = json.load(f)
+
+    grade_scale = LETTER_GRADE_SCALE
+    category_scale = CATEGORY_SCALE
+    if 'grade_scale' in config:
+        grade_scale = GradeScale.from_dict(config['grade_scale'])
+    if 'category_scale' in config:
+        category_scale = GradeScale.from_dict(config['category_scale'])
+    return grade_scale, category_scale
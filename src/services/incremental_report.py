@@ -0,0 +1,167 @@
+import numpy as np
+
+from src.services.report_stats import EXAM_COMPONENTS, AnalysisReport, performer_records, top_k_indices
+from src.services.streaming_stats import LabelCounter, RunningStats, ValueCounter
+
+
+class RankReserve:
+    """
+    Candidate rows for a top-k (or bottom-k) list that survives edits.
+
+    Keeps the best `k * reserve` positions from the last full scan. Every
+    row outside the reserve ranked no better than the reserve's cut-off, so
+    as long as the k-th best candidate is still strictly better than that
+    cut-off, the top k can be read from the candidates alone. Edited rows
+    join the candidates; only when edits push the list down to the cut-off
+    is the column scanned again.
+    """
+
+    def __init__(self, k, largest=True, reserve=4):
+        self.k = k
+        self.largest = largest
+        self.size = max(k * reserve, k)
+        self.candidates = set()
+        self.cutoff = np.inf
+        self.rows = 0
+
+    def _keys(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        return -values if self.largest else values
+
+    def rebuild(self, values):
+        """Full scan of the percentage column"""
+        values = np.asarray(values, dtype=np.float64)
+        positions = top_k_indices(values, self.size, largest=self.largest)
+        self.candidates = set(positions.tolist())
+        self.rows = len(values)
+        outside = np.count_nonzero(~np.isnan(values)) > len(positions)
+        self.cutoff = self._keys(values[positions[-1]]) if outside and len(positions) else np.inf
+
+    def positions(self, frame, changed=()):
+        """
+        Current top-k positions, best first.
+
+        Args:
+            frame (pd.DataFrame): Scored frame
+            changed (iterable): Positions edited since the last call
+
+        Returns:
+            np.ndarray: Up to k positions
+        """
+        self.candidates.update(int(position) for position in changed)
+        if len(self.candidates) > 4 * self.size:
+            self.rebuild(frame['Percentage'].to_numpy(dtype=np.float64))
+
+        candidates = np.fromiter(sorted(self.candidates), dtype=np.int64, count=len(self.candidates))
+        keys = self._keys(frame['Percentage'].iloc[candidates].to_numpy(dtype=np.float64))
+        valid = ~np.isnan(keys)
+        candidates, keys = candidates[valid], keys[valid]
+        order = np.lexsort((candidates, keys))[:self.k]
+
+        if np.isfinite(self.cutoff) and (len(order) < self.k or not keys[order[-1]] < self.cutoff):
+            self.rebuild(frame['Percentage'].to_numpy(dtype=np.float64))
+            return self.positions(frame)
+        return candidates[order]
+
+
+class IncrementalReport:
+    """
+    The `generate_detailed_report` aggregates for an in-memory frame, kept
+    up to date as individual rows change.
+
+    Built with one full pass over the scored and graded frame. After that,
+    `apply` takes the old version of the edited rows out of every running
+    total and puts the new version in, so the cost of an edit depends on
+    the number of edited rows, not on the size of the cohort. Extremes come
+    from value-frequency tables, which (unlike a running min/max) can drop
+    a value again.
+    """
+
+    def __init__(self, frame, top_n=5, components=EXAM_COMPONENTS):
+        self.top_n = top_n
+        self.present = [(label, column) for label, column in components if column in frame.columns]
+        self.columns = [column for _, column in self.present]
+        self.component_stats = RunningStats(len(self.columns))
+        self.component_values = [ValueCounter() for _ in self.columns]
+        self.percentage_stats = RunningStats(1)
+        self.percentages = ValueCounter()
+        self.grades = LabelCounter()
+        self.categories = LabelCounter()
+        self.top = RankReserve(top_n, largest=True)
+        self.bottom = RankReserve(top_n, largest=False)
+        self.rows = len(frame)
+
+        self._add(frame)
+        percentages = frame['Percentage'].to_numpy(dtype=np.float64)
+        self.top.rebuild(percentages)
+        self.bottom.rebuild(percentages)
+        self._changed = []
+
+    def _add(self, rows):
+        marks = rows[self.columns].to_numpy(dtype=np.float64)
+        self.component_stats.update(marks)
+        for i, counter in enumerate(self.component_values):
+            counter.update(marks[:, i])
+        percentages = rows['Percentage'].to_numpy(dtype=np.float64)
+        self.percentage_stats.update(percentages)
+        self.percentages.update(percentages)
+        self.grades.update(rows['Grade'])
+        self.categories.update(rows['Category'])
+
+    def _remove(self, rows):
+        marks = rows[self.columns].to_numpy(dtype=np.float64)
+        self.component_stats.remove(marks)
+        for i, counter in enumerate(self.component_values):
+            counter.remove(marks[:, i])
+        percentages = rows['Percentage'].to_numpy(dtype=np.float64)
+        self.percentage_stats.remove(percentages)
+        self.percentages.remove(percentages)
+        self.grades.remove(rows['Grade'])
+        self.categories.remove(rows['Category'])
+
+    def apply(self, old_rows, new_rows, positions):
+        """
+        Replace edited rows in the aggregates.
+
+        Args:
+            old_rows (pd.DataFrame): The rows as they were before the edit
+            new_rows (pd.DataFrame): The same rows after rescoring and grading
+            positions (array-like): Their positions in the full frame
+        """
+        self._remove(old_rows)
+        self._add(new_rows)
+        self._changed.extend(int(position) for position in positions)
+
+    def report(self, frame):
+        """
+        Args:
+            frame (pd.DataFrame): The full, current frame (only the candidate
+                rows for the performer lists are read from it)
+
+        Returns:
+            AnalysisReport: Same layout as build_report
+        """
+        changed, self._changed = self._changed, []
+        report = AnalysisReport()
+        report['total_students'] = self.rows
+        report['average_percentage'] = float(self.percentage_stats.averages()[0])
+        report['highest_percentage'] = float(self.percentages.max())
+        report['lowest_percentage'] = float(self.percentages.min())
+        report['median_percentage'] = float(self.percentages.median())
+        report['category_distribution'] = self.categories.distribution()
+        report['grade_distribution'] = self.grades.distribution()
+        report['top_performers'] = performer_records(frame, self.top.positions(frame, changed))
+        report['students_needing_attention'] = performer_records(frame, self.bottom.positions(frame, changed))
+
+        exam_analysis = {}
+        if self.rows:
+            averages = self.component_stats.averages()
+            for i, (label, _) in enumerate(self.present):
+                exam_analysis[label] = {
+                    'average': float(averages[i]),
+                    'highest': float(self.component_values[i].max()),
+                    'lowest': float(self.component_values[i].min()),
+                    'students_with_zero': int(self.component_stats.zeros[i])
+                }
+        report['exam_analysis'] = exam_analysis
+        return report
@@ -0,0 +1,212 @@
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+# Parsed input files are kept as one .npy per column plus a meta.json, in a
+# directory named after the file's path, mtime and size. Loading a sidecar is
+# a handful of np.load calls instead of a CSV parse or an openpyxl pass.
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_CACHE_DIR = os.path.join(ROOT_DIR, 'output', '.cache', 'ingest')
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Bump when the sidecar layout changes
+SIDECAR_VERSION = 1
+
+
+class UnsupportedColumn(Exception):
+    """Raised for columns the sidecar format cannot store faithfully"""
+
+
+def parse_file(file_path):
+    """
+    Parse a CSV or Excel file with pandas.
+
+    Args:
+        file_path (str): Input file
+
+    Returns:
+        pd.DataFrame: Parsed data
+    """
+    if file_path.endswith('.csv'):
+        return pd.read_csv(file_path)
+    elif file_path.endswith(('.xls', '.xlsx')):
+        return pd.read_excel(file_path)
+    raise ValueError("Unsupported file format. Please provide a CSV or Excel file.")
+
+
+def sidecar_key(file_path):
+    """
+    Key for a file's sidecar: absolute path, mtime and size.
+
+    Args:
+        file_path (str): Input file
+
+    Returns:
+        str: Hex key
+    """
+    stat = os.stat(file_path)
+    identity = f"{SIDECAR_VERSION}|{os.path.abspath(file_path)}|{stat.st_mtime_ns}|{stat.st_size}"
+    return hashlib.sha256(identity.encode()).hexdigest()[:32]
+
+
+def read_table(file_path, cache_dir=None, max_bytes=DEFAULT_MAX_BYTES):
+    """
+    Read a CSV or Excel file, going through the columnar sidecar cache.
+
+    The first read parses the file and writes the sidecar; later reads of the
+    same unchanged file load the sidecar instead. Frames with columns the
+    sidecar cannot store (mixed-type object columns, for instance) are simply
+    returned uncached.
+
+    Args:
+        file_path (str): Input file
+        cache_dir (str, optional): Sidecar directory, DEFAULT_CACHE_DIR if None
+        max_bytes (int): Size budget for the whole cache directory
+
+    Returns:
+        pd.DataFrame: The data
+    """
+    if not file_path.endswith(('.csv', '.xls', '.xlsx')):
+        raise ValueError("Unsupported file format. Please provide a CSV or Excel file.")
+
+    cache_dir = cache_dir or DEFAULT_CACHE_DIR
+    sidecar_dir = os.path.join(cache_dir, sidecar_key(file_path))
+    meta_path = os.path.join(sidecar_dir, 'meta.json')
+
+    if os.path.exists(meta_path):
+        try:
+            frame = load_sidecar(sidecar_dir)
+            os.utime(meta_path)  # mark as recently used for eviction
+            return frame
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Ignoring unreadable sidecar for {file_path}: {e}")
+            shutil.rmtree(sidecar_dir, ignore_errors=True)
+
+    frame = parse_file(file_path)
+    try:
+        write_sidecar(frame, sidecar_dir)
+        evict(cache_dir, max_bytes, keep=sidecar_dir)
+    except UnsupportedColumn:
+        shutil.rmtree(sidecar_dir, ignore_errors=True)
+    except OSError as e:
+        print(f"Could not write sidecar for {file_path}: {e}")
+        shutil.rmtree(sidecar_dir, ignore_errors=True)
+    return frame
+
+
+def _is_string_column(values):
+    return all(isinstance(value, str) or value is None or (isinstance(value, float) and np.isnan(value))
+               for value in values)
+
+
+def write_sidecar(frame, sidecar_dir):
+    """
+    Store a frame as typed per-column .npy files plus metadata.
+
+    Args:
+        frame (pd.DataFrame): Frame with a default RangeIndex
+        sidecar_dir (str): Directory to create
+
+    Raises:
+        UnsupportedColumn: If a column cannot be stored faithfully
+    """
+    if not isinstance(frame.index, pd.RangeIndex) or frame.index.start != 0 or frame.index.step != 1:
+        raise UnsupportedColumn("only default-indexed frames are cached")
+
+    tmp_dir = sidecar_dir + '.tmp'
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+    columns = []
+    try:
+        for i, (name, series) in enumerate(frame.items()):
+            if not isinstance(name, (str, int)):
+                raise UnsupportedColumn(f"column name {name!r}")
+            kind = series.dtype.kind
+            entry = {'name': name, 'file': f"col{i}.npy", 'dtype': str(series.dtype)}
+            if kind in 'biuf':
+                np.save(os.path.join(tmp_dir, entry['file']), series.to_numpy())
+                entry['kind'] = 'numeric'
+            elif kind == 'M' and series.dt.tz is None:
+                np.save(os.path.join(tmp_dir, entry['file']), series.to_numpy().view(np.int64))
+                entry['kind'] = 'datetime'
+            elif kind == 'O' and _is_string_column(series.to_numpy()):
+                missing = series.isna().to_numpy()
+                np.save(os.path.join(tmp_dir, entry['file']), series.fillna('').to_numpy().astype(str))
+                np.save(os.path.join(tmp_dir, f"col{i}_missing.npy"), missing)
+                entry['kind'] = 'string'
+            else:
+                raise UnsupportedColumn(f"column {name!r} of dtype {series.dtype}")
+            columns.append(entry)
+
+        with open(os.path.join(tmp_dir, 'meta.json'), 'w') as f:
+            json.dump({'version': SIDECAR_VERSION, 'rows': len(frame), 'columns': columns}, f)
+    except Exception:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    shutil.rmtree(sidecar_dir, ignore_errors=True)
+    os.replace(tmp_dir, sidecar_dir)
+
+
+def load_sidecar(sidecar_dir):
+    """
+    Rebuild a frame written by write_sidecar.
+
+    Args:
+        sidecar_dir (str): Sidecar directory
+
+    Returns:
+        pd.DataFrame: The stored frame
+    """
+    with open(os.path.join(sidecar_dir, 'meta.json'), 'r') as f:
+        meta = json.load(f)
+    if meta.get('version') != SIDECAR_VERSION:
+        raise ValueError(f"sidecar version {meta.get('version')}")
+
+    data = {}
+    for entry in meta['columns']:
+        path = os.path.join(sidecar_dir, entry['file'])
+        if entry['kind'] == 'numeric':
+            data[entry['name']] = np.load(path)
+        elif entry['kind'] == 'datetime':
+            data[entry['name']] = np.load(path).view(entry['dtype'])
+        else:
+            values = np.load(path).astype(object)
+            values[np.load(path.replace('.npy', '_missing.npy'))] = np.nan
+            data[entry['name']] = values
+    return pd.DataFrame(data, columns=[entry['name'] for entry in meta['columns']])
+
+
+def _dir_size(path):
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def evict(cache_dir, max_bytes, keep=None):
+    """
+    Delete least recently used sidecars until the cache fits in max_bytes.
+
+    Args:
+        cache_dir (str): Sidecar directory
+        max_bytes (int): Size budget
+        keep (str, optional): Sidecar that must survive (the one just written)
+    """
+    entries = []
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, name)
+        meta_path = os.path.join(path, 'meta.json')
+        if os.path.isdir(path) and os.path.exists(meta_path):
+            entries.append((os.path.getmtime(meta_path), path, _dir_size(path)))
+
+    total = sum(size for _, _, size in entries)
+    for _, path, size in sorted(entries):
+        if total <= max_bytes:
+            break
+        if keep is not None and os.path.samefile(path, keep):
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        total -= size
@@ -0,0 +1,125 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+
+from src.services.analysis_cache import frame_fingerprint
+
+# Fitted models are stored as joblib files plus one registry.json index that
+# records, per model, what it was trained on. A model is found again by its
+# training key: same data, same features, same estimator settings and same
+# scikit-learn version.
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_REGISTRY_DIR = os.path.join(ROOT_DIR, 'output', '.cache', 'models')
+INDEX_NAME = 'registry.json'
+
+# Bump when the registry layout changes
+REGISTRY_VERSION = 1
+
+
+def training_key(estimator, X, y, features):
+    """
+    Key identifying a fit: training data, features, estimator settings and library version.
+
+    Args:
+        estimator: Unfitted (or fitted) scikit-learn estimator
+        X (pd.DataFrame): Training features
+        y (pd.Series): Training target
+        features (list): Feature names, in order
+
+    Returns:
+        tuple: (key, metadata) where metadata holds the pieces of the key
+    """
+    import pandas as pd
+    import sklearn
+
+    data_hash = frame_fingerprint(pd.concat([X[list(features)], pd.Series(y, index=X.index, name='__target__')],
+                                            axis=1))
+    metadata = {
+        'data_hash': data_hash,
+        'features': list(features),
+        'estimator': type(estimator).__name__,
+        'params': {name: repr(value) for name, value in sorted(estimator.get_params().items())},
+        'sklearn_version': sklearn.__version__,
+    }
+    key = hashlib.sha256(json.dumps([REGISTRY_VERSION, metadata], sort_keys=True).encode()).hexdigest()
+    return key, metadata
+
+
+class ModelRegistry:
+    """
+    On-disk store of fitted models keyed by training_key.
+
+    Training with unchanged data, features and settings becomes a lookup,
+    and every stored model carries the data hash, feature list and
+    scikit-learn version it was fitted with.
+    """
+
+    def __init__(self, registry_dir=None):
+        self.registry_dir = registry_dir or DEFAULT_REGISTRY_DIR
+        self.index_path = os.path.join(self.registry_dir, INDEX_NAME)
+        self.entries = {}
+        if os.path.exists(self.index_path):
+            try:
+                with open(self.index_path, 'r') as f:
+                    self.entries = json.load(f).get('models', {})
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable model registry: {e}")
+
+    def lookup(self, key):
+        """
+        Return the model stored under a key, or None.
+
+        Args:
+            key (str): Key from training_key
+
+        Returns:
+            Fitted estimator, or None when missing or unreadable
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        path = os.path.join(self.registry_dir, entry['file'])
+        if not os.path.exists(path):
+            return None
+        import joblib
+        try:
+            return joblib.load(path)
+        except Exception as e:
+            print(f"Ignoring unreadable registered model {entry['file']}: {e}")
+            return None
+
+    def register(self, key, estimator, metadata):
+        """
+        Store a fitted model and record what it was trained on.
+
+        Args:
+            key (str): Key from training_key
+            estimator: Fitted estimator
+            metadata (dict): Metadata from training_key
+
+        Returns:
+            str: Path to the model file
+        """
+        import joblib
+        os.makedirs(self.registry_dir, exist_ok=True)
+        filename = f"{metadata['estimator']}_{key[:16]}.joblib"
+        path = os.path.join(self.registry_dir, filename)
+        tmp_path = path + '.tmp'
+        joblib.dump(estimator, tmp_path)
+        os.replace(tmp_path, path)
+        self.entries[key] = dict(metadata, file=filename, created=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        self.save()
+        return path
+
+    def metadata(self, key):
+        """What the model under a key was trained on, or None"""
+        return self.entries.get(key)
+
+    def save(self):
+        """Write the index atomically"""
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'version': REGISTRY_VERSION, 'models': self.entries}, f, indent=2)
+        os.replace(tmp_path, self.index_path)
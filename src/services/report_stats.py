@@ -0,0 +1,210 @@
+import numpy as np
+import pandas as pd
+
+# (report label, source column) in the order the report lists them
+EXAM_COMPONENTS = [
+    ('CT1', 'CT1'),
+    ('CT2', 'CT2'),
+    ('CT3', 'CT3'),
+    ('CT4', 'CT4'),
+    ('Best_3_CT_Avg', 'Best_3_CT_Avg'),
+    ('Mid-Term_Original', 'Mid-Term'),
+    ('Mid-Term', 'Midterm_Scaled'),
+    ('Presentation', 'Presentation'),
+    ('Attendance', 'Attendance'),
+]
+
+PERFORMER_COLUMNS = ['Student Name', 'Percentage', 'Grade']
+
+
+class AnalysisReport(dict):
+    """
+    Result of `build_report`.
+
+    It is the same dict that `save_report_to_file`, `print_report_to_terminal`
+    and the GUI have always read, with attribute access for the top-level
+    fields and a `to_dict` that returns plain JSON-friendly Python types.
+    """
+
+    @property
+    def total_students(self):
+        return self['total_students']
+
+    @property
+    def average_percentage(self):
+        return self['average_percentage']
+
+    @property
+    def highest_percentage(self):
+        return self['highest_percentage']
+
+    @property
+    def lowest_percentage(self):
+        return self['lowest_percentage']
+
+    @property
+    def median_percentage(self):
+        return self['median_percentage']
+
+    @property
+    def category_distribution(self):
+        return self['category_distribution']
+
+    @property
+    def grade_distribution(self):
+        return self['grade_distribution']
+
+    @property
+    def top_performers(self):
+        return self['top_performers']
+
+    @property
+    def students_needing_attention(self):
+        return self['students_needing_attention']
+
+    @property
+    def exam_analysis(self):
+        return self['exam_analysis']
+
+    def to_dict(self):
+        """Return a deep copy made of plain dicts, lists and Python scalars"""
+        return _to_builtin(dict(self))
+
+
+def _to_builtin(value):
+    if isinstance(value, dict):
+        return {str(key): _to_builtin(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_to_builtin(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def top_k_indices(values, k, largest=True):
+    """
+    Positions of the k largest (or smallest) values without a full sort.
+
+    Uses `np.argpartition` to find the cut-off and only sorts the handful of
+    candidates. NaN values are skipped, and ties are broken by position,
+    which matches `DataFrame.nlargest`/`nsmallest` with keep='first'.
+
+    Args:
+        values (array-like): 1-D numeric values
+        k (int): Number of positions to return
+        largest (bool): True for the top k, False for the bottom k
+
+    Returns:
+        np.ndarray: Up to k positions, best first
+    """
+    values = np.asarray(values, dtype=np.float64)
+    positions = np.flatnonzero(~np.isnan(values))
+    keys = -values[positions] if largest else values[positions]
+    k = min(k, len(positions))
+    if k == 0:
+        return positions[:0]
+
+    cutoff = keys[np.argpartition(keys, k - 1)[k - 1]]
+    candidates = np.flatnonzero(keys <= cutoff)
+    order = np.argsort(keys[candidates], kind='stable')[:k]
+    return positions[candidates[order]]
+
+
+def label_distribution(labels):
+    """
+    Count labels in descending order, leaving out labels that never occur.
+
+    Categorical columns are counted from their codes with one `np.bincount`;
+    ties keep the category order, like `Series.value_counts`.
+
+    Args:
+        labels (pd.Series): Grade or category column
+
+    Returns:
+        dict: label -> count
+    """
+    if isinstance(labels.dtype, pd.CategoricalDtype):
+        codes = labels.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(labels.cat.categories))
+        order = np.argsort(-counts, kind='stable')
+        categories = labels.cat.categories
+        return {categories[i]: int(counts[i]) for i in order if counts[i] > 0}
+    return {label: int(count) for label, count in labels.value_counts().items()}
+
+
+def component_statistics(frame, components=EXAM_COMPONENTS):
+    """
+    Average, highest, lowest and zero-count for every exam component.
+
+    All components are stacked into one marks matrix and reduced column-wise,
+    so each statistic is one vectorized call instead of one pass per column.
+
+    Args:
+        frame (pd.DataFrame): Scored results
+        components (list): (report label, source column) pairs
+
+    Returns:
+        dict: report label -> statistics dict
+    """
+    present = [(label, column) for label, column in components if column in frame.columns]
+    if not present or len(frame) == 0:
+        return {}
+
+    marks = frame[[column for _, column in present]].to_numpy(dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        averages = np.nanmean(marks, axis=0)
+        highest = np.nanmax(marks, axis=0)
+        lowest = np.nanmin(marks, axis=0)
+    zeros = (marks == 0).sum(axis=0)
+
+    return {
+        label: {
+            'average': float(averages[i]),
+            'highest': float(highest[i]),
+            'lowest': float(lowest[i]),
+            'students_with_zero': int(zeros[i])
+        }
+        for i, (label, _) in enumerate(present)
+    }
+
+
+def performer_records(frame, positions):
+    """Top performer / needing-attention entries for the rows at `positions`"""
+    rows = frame.iloc[positions]
+    return [
+        {'Student Name': name, 'Percentage': float(percentage), 'Grade': str(grade)}
+        for name, percentage, grade in zip(rows['Student Name'], rows['Percentage'], rows['Grade'])
+    ]
+
+
+def build_report(frame, top_n=5):
+    """
+    Build the detailed analysis report for a scored and graded frame.
+
+    Args:
+        frame (pd.DataFrame): Output of `ResultAnalyzer.categorize_students`
+        top_n (int): Size of the top performer and needing-attention lists
+
+    Returns:
+        AnalysisReport: The report
+    """
+    percentages = frame['Percentage'].to_numpy(dtype=np.float64)
+    valid = percentages[~np.isnan(percentages)]
+    if len(valid):
+        average, highest, lowest = valid.mean(), valid.max(), valid.min()
+        median = np.median(valid)
+    else:
+        average = highest = lowest = median = np.nan
+
+    report = AnalysisReport()
+    report['total_students'] = len(frame)
+    report['average_percentage'] = float(average)
+    report['highest_percentage'] = float(highest)
+    report['lowest_percentage'] = float(lowest)
+    report['median_percentage'] = float(median)
+    report['category_distribution'] = label_distribution(frame['Category'])
+    report['grade_distribution'] = label_distribution(frame['Grade'])
+    report['top_performers'] = performer_records(frame, top_k_indices(percentages, top_n, largest=True))
+    report['students_needing_attention'] = performer_records(frame, top_k_indices(percentages, top_n, largest=False))
+    report['exam_analysis'] = component_statistics(frame)
+    return report
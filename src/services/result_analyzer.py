@@ -1,87 +1,85 @@
 import pandas as pd
 import numpy as np
 from datetime import datetime
-import matplotlib.pyplot as plt
 import os
+from src.services.scoring import MARK_COLUMNS, clean_marks, compute_scores
+from src.services.ingest_cache import read_table
+from src.services.schema import compact_frame, memory_report, memory_usage
+from src.services.grading import LETTER_GRADE_SCALE, CATEGORY_SCALE
+from src.services.report_stats import build_report
+from src.services.streaming_stats import StreamingReport
+from src.services.incremental_report import IncrementalReport
+from src.services.chart_renderer import render_charts
+from src.services.chart_cache import ChartCache
+from src.utils.profiling import NULL_PROFILER, profiled
+from src.services.analysis_cache import (AnalysisCache, DEFAULT_ANALYSIS_CACHE, config_fingerprint,
+                                         file_fingerprint, frame_fingerprint)
+
+# Bump when the cached (data, processed_data, report) layout changes
+ANALYSIS_CACHE_VERSION = 1
 
 class ResultAnalyzer:
-    def __init__(self, data_file):
+    def __init__(self, data_file, grade_scale=None, category_scale=None, cache_dir=None, compact=False,
+                 output_dir=None, profiler=None):
         self.data_file = os.path.normpath(data_file)  # Normalize path
         self.data = None
         self.processed_data = None
+        # Grading schemes; see src.services.grading.load_grading_config for custom scales
+        self.grade_scale = grade_scale or LETTER_GRADE_SCALE
+        self.category_scale = category_scale or CATEGORY_SCALE
+        # Finished analyses keyed on input content + grading config; pass cache_dir to persist them
+        self.cache = AnalysisCache(cache_dir) if cache_dir else DEFAULT_ANALYSIS_CACHE
+        self._report_memo = None
+        self._incremental = None
+        # Store marks as float32, IDs as small ints and names/grades as categoricals
+        self.compact = compact
+        self.memory_report = None
+        # Per-stage timing and peak memory; pass a src.utils.profiling.StageProfiler to collect them
+        self.profiler = profiler or NULL_PROFILER
         # Use os.path.abspath to get absolute path and normalize it
         root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        self.output_dir = os.path.join(root_dir, 'output')
+        self.output_dir = output_dir or os.path.join(root_dir, 'output')
         os.makedirs(self.output_dir, exist_ok=True)
 
+    @profiled('load')
     def load_data(self):
-        """Load data from CSV or Excel file"""
+        """Load data from CSV or Excel file (through the columnar sidecar cache)"""
         try:
-            if self.data_file.endswith('.csv'):
-                self.data = pd.read_csv(self.data_file)
-            elif self.data_file.endswith(('.xls', '.xlsx')):
-                self.data = pd.read_excel(self.data_file)
-            else:
-                raise ValueError("Unsupported file format. Please provide a CSV or Excel file.")
+            self.data = read_table(self.data_file)
             print(f"Data loaded successfully from {self.data_file}")
             return True
         except Exception as e:
             print(f"Error loading data: {e}")
             return False
 
+    @profiled('preprocess')
     def preprocess_data(self):
         """Clean and preprocess the data"""
         if self.data is None:
             raise ValueError("Data not loaded. Please load the data first.")
         
-        self.processed_data = self.data.copy()
-
-        
-        mark_columns = ['CT1', 'CT2', 'Mid-Term', 'CT3', 'CT4', 'Presentation', 'Attendance']
-        for col in mark_columns:
-            if col in self.processed_data.columns:
-                self.processed_data[col] = pd.to_numeric(self.processed_data[col], errors='coerce').fillna(0)
+        self.processed_data = clean_marks(self.data.copy())
+        if self.compact:
+            compact_frame(self.processed_data)
+            self.memory_report = memory_report(memory_usage(self.data), self.processed_data)
+            print(f"Compact schema: {self.memory_report['before_bytes'] / 1024:.1f} KiB -> "
+                  f"{self.memory_report['after_bytes'] / 1024:.1f} KiB")
         
         return self.processed_data
 
+    @profiled('score')
     def calculate_total_and_percentage(self):
         """Calculate total marks and percentage for each student"""
         if self.processed_data is None:
             self.preprocess_data()
         
-        # Scale Mid-Term from 40 to 20
-        self.processed_data['Midterm_Scaled'] = self.processed_data['Mid-Term'] / 2
-        
-        ct_columns = ['CT1', 'CT2', 'CT3', 'CT4']
-        ct_scores = []
-        
-        for index, row in self.processed_data.iterrows():
-            scores = [row[col] for col in ct_columns if col in self.processed_data.columns and pd.notna(row[col])]
-            scores.sort(reverse=True)
-            best_3_avg = sum(scores[:3]) / 3 if len(scores) >= 3 else (sum(scores) / len(scores) if scores else 0)
-            ct_scores.append(best_3_avg)
-        
-        self.processed_data['Best_3_CT_Avg'] = ct_scores
-        
-        # Ensure all required columns exist before calculation
-        for col in ['Midterm_Scaled', 'Best_3_CT_Avg', 'Presentation', 'Attendance']:
-            if col not in self.processed_data.columns:
-                if col == 'Attendance':
-                    self.processed_data[col] = 8  # Default value
-                else:
-                    self.processed_data[col] = 0  # Default value
-        
-        self.processed_data['Total_Obtained'] = (
-            self.processed_data['Midterm_Scaled'] +  # 20 marks
-            self.processed_data['Best_3_CT_Avg'] +   # 10 marks
-            self.processed_data['Presentation'] +    # 10 marks
-            self.processed_data['Attendance']        # 10 marks
-        )
-        
-        self.processed_data['Percentage'] = (self.processed_data['Total_Obtained'] / 50) * 100
+        compute_scores(self.processed_data)
+        if self.compact:
+            compact_frame(self.processed_data)
         
         return self.processed_data
 
+    @profiled('categorize')
     def categorize_students(self):
         """Categorize students based on their performance"""
         if self.processed_data is None:
@@ -89,117 +87,182 @@ class ResultAnalyzer:
         if 'Percentage' not in self.processed_data.columns:
             self.calculate_total_and_percentage()
         
-        def get_grade(percentage):
-            if percentage >= 80:
-                return 'A+'
-            elif percentage >= 75:
-                return 'A'
-            elif percentage >= 70:
-                return 'A-'
-            elif percentage >= 65:
-                return 'B+'
-            elif percentage >= 60:
-                return 'B'
-            elif percentage >= 55:
-                return 'B-'
-            elif percentage >= 50:
-                return 'C+'
-            elif percentage >= 45:
-                return 'C'
-            elif percentage >= 40:
-                return 'D'
-            else:
-                return 'F'
-        
-        def get_category(percentage):
-            if percentage >= 80:
-                return 'Excellent'
-            elif percentage >= 65:
-                return 'Good'
-            elif percentage >= 50:
-                return 'Average'
-            elif percentage >= 40:
-                return 'Below Average'
-            else:
-                return 'Poor'
-        
-        self.processed_data['Grade'] = self.processed_data['Percentage'].apply(get_grade)
-        self.processed_data['Category'] = self.processed_data['Percentage'].apply(get_category)
+        self.processed_data['Grade'] = self.grade_scale.apply(self.processed_data['Percentage'])
+        self.processed_data['Category'] = self.category_scale.apply(self.processed_data['Percentage'])
         
         return self.processed_data
 
+    def run_analysis(self):
+        """
+        Load, score and categorize the data, reusing a cached analysis when possible.
+
+        The cache key is the input file's content hash plus the grading config,
+        so an unchanged file skips parsing and scoring entirely.
+
+        Returns:
+            bool: True if the analysis is available, False if loading failed
+        """
+        try:
+            key = self.cache_key()
+        except OSError as e:
+            print(f"Error loading data: {e}")
+            return False
+
+        with self.profiler.stage('cache lookup'):
+            cached = self.cache.get(key)
+        if cached is not None:
+            self.data, self.processed_data, report = cached
+            self._report_memo = (frame_fingerprint(self.processed_data), self.grading_fingerprint(), report)
+            print(f"Loaded cached analysis for {self.data_file}")
+            return True
+
+        if not self.load_data():
+            return False
+        self.preprocess_data()
+        self.calculate_total_and_percentage()
+        self.categorize_students()
+        self.cache.put(key, (self.data, self.processed_data, self.generate_detailed_report()))
+        return True
+
+    def cache_key(self):
+        """Fingerprint of the input file content and the grading config"""
+        digest = file_fingerprint(self.data_file)
+        layout = 'compact' if self.compact else 'full'
+        return f"v{ANALYSIS_CACHE_VERSION}_{digest[:32]}_{self.grading_fingerprint()[:16]}_{layout}"
+
+    def grading_fingerprint(self):
+        """Fingerprint of the grade and category scales in use"""
+        return config_fingerprint(self.grade_scale, self.category_scale)
+
+    @profiled('report')
     def generate_detailed_report(self):
-        """Generate a comprehensive analysis report"""
+        """Generate a comprehensive analysis report (memoized until the data or grading changes)"""
         if self.processed_data is None:
             self.categorize_students()
         
-        report = {}
-        
-        report['total_students'] = len(self.processed_data)
-        report['average_percentage'] = self.processed_data['Percentage'].mean()
-        report['highest_percentage'] = self.processed_data['Percentage'].max()
-        report['lowest_percentage'] = self.processed_data['Percentage'].min()
-        report['median_percentage'] = self.processed_data['Percentage'].median()
-        
-        category_distribution = self.processed_data['Category'].value_counts().to_dict()
-        report['category_distribution'] = category_distribution
-        
-        grade_distribution = self.processed_data['Grade'].value_counts().to_dict()
-        report['grade_distribution'] = grade_distribution
-        
-        top_performers = self.processed_data.nlargest(5, 'Percentage')[['Student Name', 'Percentage', 'Grade']].to_dict('records')
-        report['top_performers'] = top_performers
-        
-        bottom_performers = self.processed_data.nsmallest(5, 'Percentage')[['Student Name', 'Percentage', 'Grade']].to_dict('records')
-        report['students_needing_attention'] = bottom_performers
-        
-        exam_analysis = {}
-        
-        mark_columns = ['CT1', 'CT2', 'CT3', 'CT4']
-        for col in mark_columns:
-            if col in self.processed_data.columns:
-                exam_analysis[col] = {
-                    'average': self.processed_data[col].mean(),
-                    'highest': self.processed_data[col].max(),
-                    'lowest': self.processed_data[col].min(),
-                    'students_with_zero': (self.processed_data[col] == 0).sum()
-                }
-        
-        exam_analysis['Best_3_CT_Avg'] = {
-            'average': self.processed_data['Best_3_CT_Avg'].mean(),
-            'highest': self.processed_data['Best_3_CT_Avg'].max(),
-            'lowest': self.processed_data['Best_3_CT_Avg'].min(),
-            'students_with_zero': (self.processed_data['Best_3_CT_Avg'] == 0).sum()
-        }
-        
-        exam_analysis['Mid-Term_Original'] = {
-            'average': self.processed_data['Mid-Term'].mean(),
-            'highest': self.processed_data['Mid-Term'].max(),
-            'lowest': self.processed_data['Mid-Term'].min(),
-            'students_with_zero': (self.processed_data['Mid-Term'] == 0).sum()
-        }
-        
-        exam_analysis['Mid-Term'] = {
-            'average': self.processed_data['Midterm_Scaled'].mean(),
-            'highest': self.processed_data['Midterm_Scaled'].max(),
-            'lowest': self.processed_data['Midterm_Scaled'].min(),
-            'students_with_zero': (self.processed_data['Midterm_Scaled'] == 0).sum()
-        }
-        
-        # Presentation and Attendance
-        for col in ['Presentation', 'Attendance']:
-            if col in self.processed_data.columns:
-                exam_analysis[col] = {
-                    'average': self.processed_data[col].mean(),
-                    'highest': self.processed_data[col].max(),
-                    'lowest': self.processed_data[col].min(),
-                    'students_with_zero': (self.processed_data[col] == 0).sum()
-                }
-        
-        report['exam_analysis'] = exam_analysis
-        
+        memo_key = (frame_fingerprint(self.processed_data), self.grading_fingerprint())
+        if self._report_memo is not None and self._report_memo[:2] == memo_key:
+            return self._report_memo[2]
+
+        report = build_report(self.processed_data)
+        self._report_memo = memo_key + (report,)
         return report
 
+    @profiled('update')
+    def update_marks(self, changes):
+        """
+        Apply corrected marks for a few students without rerunning the analysis.
+
+        Only the edited rows are rescored and regraded. The report aggregates
+        (averages, extremes, median, distributions, top/bottom lists) are
+        adjusted by taking the old rows out and putting the new ones in, see
+        src.services.incremental_report. The edits are applied to self.data
+        and self.processed_data; the input file is not touched.
+
+        Args:
+            changes (dict | pd.DataFrame): {StudentID: {column: mark}}, or a
+                frame with a StudentID column and the corrected mark columns.
+                NaN means "unchanged"; enter an absent mark as 0. When a
+                student is listed more than once, the later marks win.
+
+        Returns:
+            AnalysisReport: The updated report
+        """
+        if self.processed_data is None or 'Grade' not in self.processed_data.columns:
+            self.categorize_students()
+
+        if isinstance(changes, pd.DataFrame):
+            changes = changes.set_index('StudentID')
+        else:
+            changes = pd.DataFrame.from_dict(changes, orient='index')
+        unknown = [col for col in changes.columns if col not in MARK_COLUMNS or col not in self.data.columns]
+        if unknown:
+            raise ValueError(f"Cannot update non-mark column(s): {', '.join(map(str, unknown))}")
+
+        positions = self._student_positions(changes.index)
+        if len(np.unique(positions)) < len(positions):
+            # One row per student, or the report would take the old row out twice
+            changes = changes.groupby(positions, sort=False).last()
+            positions = changes.index.to_numpy()
+        grading = self.grading_fingerprint()
+        state = self._incremental
+        if state is None or state[0] is not self.processed_data or state[1] != grading:
+            state = (self.processed_data, grading, IncrementalReport(self.processed_data))
+            self._incremental = state
+
+        old_rows = self.processed_data.iloc[positions].copy()
+        for col in changes.columns:
+            edited = changes[col].notna().to_numpy()
+            marks = pd.to_numeric(changes[col][edited], errors='coerce').fillna(0).to_numpy()
+            for frame in (self.data, self.processed_data):
+                if frame[col].dtype.kind != 'f':
+                    frame[col] = frame[col].astype(np.float64)
+                frame.iloc[positions[edited], frame.columns.get_loc(col)] = marks.astype(frame[col].dtype)
+
+        rows = compute_scores(self.processed_data.iloc[positions].copy())
+        rows['Grade'] = self.grade_scale.apply(rows['Percentage'])
+        rows['Category'] = self.category_scale.apply(rows['Percentage'])
+        for col in ['Midterm_Scaled', 'Best_3_CT_Avg', 'Total_Obtained', 'Percentage', 'Grade', 'Category']:
+            values = rows[col].to_numpy()
+            if not isinstance(self.processed_data[col].dtype, pd.CategoricalDtype):
+                values = values.astype(self.processed_data[col].dtype)
+            self.processed_data.iloc[positions, self.processed_data.columns.get_loc(col)] = values
+
+        state[2].apply(old_rows, self.processed_data.iloc[positions], positions)
+        report = state[2].report(self.processed_data)
+        self._report_memo = (frame_fingerprint(self.processed_data), grading, report)
+        return report
+
+    def _student_positions(self, student_ids):
+        """Row positions of the given StudentIDs"""
+        index = pd.Index(self.processed_data['StudentID'])
+        if not index.is_unique:
+            raise ValueError("StudentID values are not unique; cannot update by StudentID.")
+        wanted = pd.Index(student_ids)
+        if index.dtype.kind in 'iuf' and wanted.dtype.kind not in 'iuf':
+            wanted = pd.Index(pd.to_numeric(wanted, errors='coerce'))
+        positions = index.get_indexer(wanted)
+        if (positions < 0).any():
+            missing = [str(student) for student, position in zip(student_ids, positions) if position < 0]
+            raise KeyError(f"Unknown StudentID(s): {', '.join(missing)}")
+        return positions
+
+    @profiled('stream report')
+    def generate_streaming_report(self, chunksize=100000):
+        """
+        Build the detailed report by streaming the input in chunks.
+
+        Each chunk is cleaned, scored and graded on its own and folded into
+        running aggregates (see src.services.streaming_stats), so memory stays
+        flat regardless of file size. The result has the same layout as
+        generate_detailed_report. Neither self.data nor self.processed_data
+        is populated.
+
+        Args:
+            chunksize (int): Rows per chunk
+
+        Returns:
+            AnalysisReport: The report, or None if the file could not be read
+        """
+        if not self.data_file.endswith('.csv'):
+            print("Error loading data: streaming mode supports CSV files only.")
+            return None
+
+        stream = StreamingReport()
+        try:
+            for chunk in pd.read_csv(self.data_file, chunksize=chunksize):
+                compute_scores(clean_marks(chunk))
+                chunk['Grade'] = self.grade_scale.apply(chunk['Percentage'])
+                chunk['Category'] = self.category_scale.apply(chunk['Percentage'])
+                stream.update(chunk)
+        except Exception as e:
+            print(f"Error loading data: {e}")
+            return None
+
+        print(f"Streamed {stream.rows} rows from {self.data_file}")
+        return stream.report()
+
+    @profiled('save')
     def save_report_to_file(self, filename=None):
         """Save the detailed report to a text file"""
         if filename is None:
@@ -383,13 +446,29 @@ class ResultAnalyzer:
     def generate_report(self):
         """Legacy method - use generate_detailed_report() instead"""
         if self.processed_data is not None:
-            report = self.processed_data.groupby('Category').size().reset_index(name='Count')
+            # Observed labels only, alphabetically, as when Category held plain strings
+            counts = self.processed_data.groupby('Category', observed=True, sort=False).size()
+            report = counts.sort_index(key=lambda labels: labels.astype(str)).reset_index(name='Count')
+            report['Category'] = report['Category'].astype(str)
             return report
         else:
             raise ValueError("Data not loaded. Please load the data first.")
 
-    def generate_graphs(self):
-        """Generate various graphs and charts for analysis"""
+    @profiled('charts')
+    def generate_graphs(self, workers=None, dpi=300, use_cache=True):
+        """
+        Generate various graphs and charts for analysis.
+
+        Args:
+            workers (int, optional): Render charts in a process pool of this size;
+                None or 1 renders them one after another in this process
+            dpi (int): Resolution of the saved PNGs
+            use_cache (bool): Skip charts whose inputs match the output
+                directory's chart manifest
+
+        Returns:
+            str: The output directory
+        """
         if self.processed_data is None:
             self.categorize_students()
         
@@ -398,152 +477,74 @@ class ResultAnalyzer:
         # Create output directory if it doesn't exist
         os.makedirs(self.output_dir, exist_ok=True)
         
-        # Set style for better-looking graphs
-        plt.style.use('default')  # Using default style instead of seaborn
-        
-        # Generate all visualizations
-        self._create_grade_distribution(report)
-        self._create_performance_analysis()
-        self._create_assessment_breakdown()
-        # self._create_attendance_analysis()
-        self._create_comparative_analysis()
-        # self._create_grade_progression()
-        self._create_exam_wise_analysis()
-        self._basic_stat_graph()
+        # Generate all visualizations (default style instead of seaborn)
+        cache = ChartCache(self.output_dir) if use_cache else None
+        render_charts(self._chart_jobs(report), self.output_dir, workers=workers, dpi=dpi,
+                      style='default', cache=cache, source=self.data_file, profiler=self.profiler)
         return self.output_dir
 
-    def _basic_stat_graph(self):
-        # Create bar chart for basic statistics
-        plt.figure(figsize=(10, 6))
-        report = self.generate_detailed_report()
-
-        categories = ['Average', 'Highest', 'Lowest', 'Median']
-        percentage_values = [report['average_percentage'], report['highest_percentage'],
-                  report['lowest_percentage'], report['median_percentage']]
-        total_marks = {
-            'Average': self.processed_data['Total_Obtained'].mean(),
-            'Highest': self.processed_data['Total_Obtained'].max(),
-            'Lowest': self.processed_data['Total_Obtained'].min(),
-            'Median': self.processed_data['Total_Obtained'].median()
+    def _chart_jobs(self, report):
+        """Build the (chart name, payload) list that generate_graphs renders"""
+        return [
+            ('grade_distribution', self._grade_distribution_data(report)),
+            ('performance_distribution', self._performance_data()),
+            ('assessment_distribution', self._assessment_data()),
+            ('component_distribution', self._component_data()),
+            ('exam_analysis', self._exam_analysis_data(report)),
+            ('basic_statistics', self._basic_stat_data(report)),
+        ]
+
+    def _basic_stat_data(self, report):
+        """Average/highest/lowest/median of total marks and percentage"""
+        total = self.processed_data['Total_Obtained']
+        return {
+            'categories': ['Average', 'Highest', 'Lowest', 'Median'],
+            'total_marks': [total.mean(), total.max(), total.min(), total.median()],
+            'percentages': [report['average_percentage'], report['highest_percentage'],
+                            report['lowest_percentage'], report['median_percentage']]
         }
-        # Extract values from total_marks in the same order as categories
-        total_marks_values = [total_marks[cat] for cat in categories]
-
-        # Create a grouped bar chart for percentage and total marks
-        x = np.arange(len(categories))
-        width = 0.35  # Width of the bars
-        bar1 = plt.bar(x - width/2, total_marks_values, width, label='Total Marks', color='#2196F3')
-        bar2 = plt.bar(x + width/2, percentage_values, width, label='Percentage', color='#4CAF50')
-        plt.xticks(x, categories)
-        plt.title('Basic Statistics of Student Performance', pad=20, fontsize=14)
-        plt.xlabel('Statistics')
-        plt.ylabel('Marks / Percentage')
-        plt.legend()
-        for bar in bar1:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width() / 2, height + 0.1, f'{height:.2f}',
-                     ha='center', va='bottom', fontsize=9, color='#2196F3')
-
-        for bar in bar2:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width() / 2, height + 0.1, f'{height:.2f}',
-                     ha='center', va='bottom', fontsize=9, color='#4CAF50')
-
-        plt.savefig(os.path.join(self.output_dir, 'basic_statistics.png'),
-                   bbox_inches='tight', dpi=300)
-        plt.close()
-
 
-    def _create_grade_distribution(self, report):
-        # Create pie chart for grade distribution
-        plt.figure(figsize=(10, 8))
-        grades = list(report['grade_distribution'].keys())
-        values = list(report['grade_distribution'].values())
-        # colors = plt.cm.Pastel1(np.linspace(0, 1, len(grades)))
-        plt.pie(values, labels=grades, autopct='%1.1f%%')
-        plt.title('Grade Distribution', pad=20, fontsize=14)
-        plt.savefig(os.path.join(self.output_dir, 'grade_distribution.png'), 
-                   bbox_inches='tight', dpi=300)
-        plt.close()
+    def _grade_distribution_data(self, report):
+        """Grade labels and counts for the pie chart"""
+        return {
+            'grades': list(report['grade_distribution'].keys()),
+            'values': list(report['grade_distribution'].values())
+        }
 
-    def _create_exam_wise_analysis(self):
-        """Create bar chart for exam-wise analysis with visible lowest marks"""
-        plt.figure(figsize=(12, 6))
-        exam_analysis = self.generate_detailed_report()['exam_analysis']
-
-        exams = list(exam_analysis.keys())
-        exams.remove('Mid-Term_Original')  # Exclude original mid-term for clarity
-        averages = [exam_analysis[subj]['average'] for subj in exams]
-        highest = [exam_analysis[subj]['highest'] for subj in exams]
-        lowest = [exam_analysis[subj]['lowest'] for subj in exams]
-        x = np.arange(len(exams))
-        width = 0.25
-        bars1 = plt.bar(x - width, averages, width, label='Average', color='#2196F3')
-        bars2 = plt.bar(x, highest, width, label='Highest', color='#4CAF50')
-        bars3 = plt.bar(x + width, lowest, width, label='Lowest', color='#FF9800')
-
-        plt.xticks(x, exams)
-        plt.title('Exam-wise Analysis', pad=20, fontsize=14)
-        plt.xlabel('Exams')
-        plt.ylabel('Marks')
-        plt.legend()
-        plt.ylim(-1, max(highest) + 2)  # Set y-axis lower limit to -1
-
-        # Add value labels for lowest marks
-        for bar in bars3:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width() / 2, height + 0.1, f'{height:.1f}',
-                     ha='center', va='bottom', fontsize=9, color='#FF9800')
-        for bar in bars1:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width() / 2, height + 0.1, f'{height:.1f}',
-                     ha='center', va='bottom', fontsize=9, color='#2196F3')
-        for bar in bars2:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width() / 2, height + 0.1, f'{height:.1f}',
-                     ha='center', va='bottom', fontsize=9, color='#4CAF50')
-
-        plt.savefig(os.path.join(self.output_dir, 'exam_analysis.png'),
-                    bbox_inches='tight', dpi=300)
-        plt.close()
+    def _exam_analysis_data(self, report):
+        """Per-exam average/highest/lowest, without the unscaled mid-term"""
+        exam_analysis = report['exam_analysis']
+        exams = [exam for exam in exam_analysis if exam != 'Mid-Term_Original']
+        return {
+            'exams': exams,
+            'averages': [exam_analysis[exam]['average'] for exam in exams],
+            'highest': [exam_analysis[exam]['highest'] for exam in exams],
+            'lowest': [exam_analysis[exam]['lowest'] for exam in exams]
+        }
 
-    def _create_performance_analysis(self):
-        """Create line graph for student performance distribution"""
-        plt.figure(figsize=(12, 6))
-        sorted_data = self.processed_data.sort_values('Percentage', ascending=False)
-        plt.plot(range(len(sorted_data)), sorted_data['Percentage'], 
-                'b-', linewidth=2, color='#2196F3')
-        plt.fill_between(range(len(sorted_data)), sorted_data['Percentage'], 
-                        alpha=0.3, color='#2196F3')
-        plt.title('Overall Performance Distribution', pad=20, fontsize=14)
-        plt.xlabel('Student Rank')
-        plt.ylabel('Percentage')
-        plt.grid(True, alpha=0.3)
-        plt.savefig(os.path.join(self.output_dir, 'performance_distribution.png'), 
-                   bbox_inches='tight', dpi=300)
-        plt.close()
+    def _performance_data(self):
+        """Percentages sorted from best to worst"""
+        percentages = self.processed_data['Percentage'].to_numpy(dtype=np.float64)
+        return {'percentages': np.sort(percentages)[::-1]}
 
-    def _create_assessment_breakdown(self):
-        """Create box plot for assessment score distribution"""
-        plt.figure(figsize=(12, 6))
+    def _assessment_data(self):
+        """Box plot statistics per assessment, so workers never see the raw marks"""
+        from matplotlib import cbook
         components = ['CT1', 'CT2', 'CT3', 'CT4', 'Mid-Term']
-        box_data = [self.processed_data[comp] for comp in components]
-        
-        bp = plt.boxplot(box_data, labels=components, patch_artist=True)
-        
-        # Customize box plot colors
-        for box in bp['boxes']:
-            box.set(facecolor='#4CAF50', alpha=0.7)
-        
-        plt.title('Assessment Score Distribution', pad=20, fontsize=14)
-        plt.ylabel('Marks')
-        plt.grid(True, alpha=0.3)
-        plt.savefig(os.path.join(self.output_dir, 'assessment_distribution.png'), 
-                   bbox_inches='tight', dpi=300)
-        plt.close()
+        box_data = [self.processed_data[comp].to_numpy(dtype=np.float64) for comp in components]
+        return {'box_stats': cbook.boxplot_stats(box_data, labels=components)}
+
+    def _component_data(self):
+        """Per-student score components for the stacked bar chart"""
+        components = ['Best_3_CT_Avg', 'Midterm_Scaled', 'Presentation', 'Attendance']
+        return {
+            'students': len(self.processed_data),
+            'components': [(comp, self.processed_data[comp].to_numpy(dtype=np.float64)) for comp in components]
+        }
 
     def _create_attendance_analysis(self):
         """Create scatter plot for attendance vs performance correlation"""
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(10, 6))
         plt.scatter(self.processed_data['Attendance'], 
                    self.processed_data['Percentage'],
@@ -557,33 +558,9 @@ class ResultAnalyzer:
                    bbox_inches='tight', dpi=300)
         plt.close()
 
-    def _create_comparative_analysis(self):
-        """Create stacked bar chart for component-wise score distribution"""
-        plt.figure(figsize=(12, 6))
-        components = ['Best_3_CT_Avg', 'Midterm_Scaled', 'Presentation', 'Attendance']
-        colors = ['#2196F3', '#4CAF50', '#FFC107', '#FF5722']
-        
-        bottom = np.zeros(len(self.processed_data))
-        for component, color in zip(components, colors):
-            plt.bar(range(len(self.processed_data)), 
-                   self.processed_data[component], 
-                   bottom=bottom, 
-                   label=component,
-                   alpha=0.7,
-                   color=color)
-            bottom += self.processed_data[component]
-        
-        plt.title('Score Component Distribution', pad=20, fontsize=14)
-        plt.xlabel('Student Index')
-        plt.ylabel('Marks')
-        plt.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
-        plt.tight_layout()
-        plt.savefig(os.path.join(self.output_dir, 'component_distribution.png'), 
-                   bbox_inches='tight', dpi=300)
-        plt.close()
-
     def _create_grade_progression(self):
         """Create line chart showing grade progression across assessments"""
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(12, 6))
         assessments = ['CT1', 'CT2', 'CT3', 'CT4', 'Mid-Term']
         for _, student in self.processed_data.iterrows():
@@ -600,6 +577,7 @@ class ResultAnalyzer:
 
     def _create_ct_performance_box(self):
         """Create box plot for CT performance distribution"""
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(10, 6))
         ct_data = [self.processed_data[f'CT{i}'] for i in range(1, 5)]
         plt.boxplot(ct_data, labels=[f'CT{i}' for i in range(1, 5)])
@@ -611,6 +589,7 @@ class ResultAnalyzer:
 
     def _create_student_performance_line(self):
         """Create line chart of overall student performance"""
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(15, 6))
         sorted_data = self.processed_data.sort_values('Percentage', ascending=False)
         plt.plot(range(len(sorted_data)), sorted_data['Percentage'], marker='o')
@@ -624,6 +603,7 @@ class ResultAnalyzer:
 
     def _create_component_contribution_stacked(self):
         """Create stacked bar chart showing contribution of each component"""
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(12, 6))
         components = ['Best_3_CT_Avg', 'Midterm_Scaled', 'Presentation', 'Attendance']
         
@@ -645,6 +625,7 @@ class ResultAnalyzer:
 
     def _create_top_bottom_comparison(self, report):
         """Create comparative bar chart for top and bottom performers"""
+        import matplotlib.pyplot as plt
         plt.figure(figsize=(12, 6))
         
         # Get top and bottom 5 students
@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+
+# Declared storage types for the result.csv layout and the columns the
+# analyzers derive from it:
+#   'id'    -> smallest fixed-width integer that holds every value
+#   'mark'  -> float32 (marks are whole, half or third marks out of <= 50)
+#   'label' -> categorical
+RESULT_SCHEMA = {
+    'Sl. No': 'id',
+    'StudentID': 'id',
+    'Student Name': 'label',
+    'CT1': 'mark',
+    'CT2': 'mark',
+    'CT3': 'mark',
+    'CT4': 'mark',
+    'Mid-Term': 'mark',
+    'Presentation': 'mark',
+    'Attendance': 'mark',
+    'Midterm_Scaled': 'mark',
+    'Best_3_CT_Avg': 'mark',
+    'CT_Avg': 'mark',
+    'Total_Obtained': 'mark',
+    'Total': 'mark',
+    'Percentage': 'mark',
+    'Grade': 'label',
+    'Category': 'label',
+    'Group': 'label',
+}
+
+
+def memory_usage(frame):
+    """Deep memory use of a frame in bytes, index included"""
+    return int(frame.memory_usage(index=True, deep=True).sum())
+
+
+_UNSIGNED = [np.uint8, np.uint16, np.uint32, np.uint64]
+_SIGNED = [np.int8, np.int16, np.int32, np.int64]
+
+
+def _compact_id(series):
+    if series.isna().any():
+        return series
+    numbers = pd.to_numeric(series, errors='coerce')
+    if numbers.isna().any() or not np.all(np.mod(numbers, 1) == 0):
+        return series
+    numbers = numbers.astype(np.int64)
+    if len(numbers) == 0:
+        return numbers
+    low, high = numbers.min(), numbers.max()
+    candidates = _UNSIGNED if low >= 0 else _SIGNED
+    for dtype in candidates:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return numbers.astype(dtype)
+    return numbers
+
+
+def _compact_mark(series):
+    numbers = pd.to_numeric(series, errors='coerce')
+    if numbers.isna().sum() > series.isna().sum():
+        return series  # not really numeric; leave it alone
+    return numbers.astype(np.float32)
+
+
+def _compact_label(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    return series.astype('category')
+
+
+_CONVERTERS = {'id': _compact_id, 'mark': _compact_mark, 'label': _compact_label}
+
+
+def compact_frame(frame, schema=RESULT_SCHEMA):
+    """
+    Convert the columns named in the schema to their compact storage types.
+
+    Columns the schema does not mention, and values that do not fit the
+    declared kind (non-integral IDs, text in a mark column), are left as they
+    are.
+
+    Args:
+        frame (pd.DataFrame): Frame to convert; modified in place
+        schema (dict): column -> 'id' | 'mark' | 'label'
+
+    Returns:
+        pd.DataFrame: The same frame
+    """
+    for column, kind in schema.items():
+        if column in frame.columns:
+            frame[column] = _CONVERTERS[kind](frame[column])
+    if frame.index.name in schema and schema[frame.index.name] == 'id':
+        index = _compact_id(frame.index.to_series())
+        frame.index = pd.Index(index.to_numpy(), name=frame.index.name)
+    return frame
+
+
+def memory_report(before_bytes, frame):
+    """
+    Summarize a compaction.
+
+    Args:
+        before_bytes (int): memory_usage before compacting
+        frame (pd.DataFrame): The compacted frame
+
+    Returns:
+        dict: before_bytes, after_bytes and reduction (before / after)
+    """
+    after_bytes = memory_usage(frame)
+    return {
+        'before_bytes': before_bytes,
+        'after_bytes': after_bytes,
+        'reduction': before_bytes / after_bytes if after_bytes else float('nan')
+    }
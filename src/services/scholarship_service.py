@@ -1,5 +1,6 @@
 from sklearn.tree import DecisionTreeClassifier
-import pandas as pd
+from src.services.ingest_cache import read_table
+from src.models.scholarship_model import score_batch
 
 class ScholarshipService:
     def __init__(self, model):
@@ -12,11 +13,23 @@ class ScholarshipService:
         prediction = self.model.predict([student_data])
         return prediction
 
+    def score_batch(self, students, chunksize=None):
+        """
+        Score a whole intake in vectorized calls instead of one predict per student.
+
+        Args:
+            students: DataFrame, 2-D array or list of rows, or an iterable of
+                DataFrame chunks
+            chunksize (int, optional): Rows per call for very large intakes
+
+        Returns:
+            pd.DataFrame: 'prediction' and 'probability_<class>' columns
+        """
+        return score_batch(self.model, students, chunksize)
+
     def load_data(self, file_path):
-        if file_path.endswith('.csv'):
-            return pd.read_csv(file_path)
-        elif file_path.endswith('.xlsx'):
-            return pd.read_excel(file_path)
+        if file_path.endswith(('.csv', '.xlsx')):
+            return read_table(file_path)
         else:
             raise ValueError("Unsupported file format. Please provide a CSV or Excel file.")
 
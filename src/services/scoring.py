@@ -0,0 +1,88 @@
+import numpy as np
+import pandas as pd
+
+CT_COLUMNS = ['CT1', 'CT2', 'CT3', 'CT4']
+MARK_COLUMNS = ['CT1', 'CT2', 'Mid-Term', 'CT3', 'CT4', 'Presentation', 'Attendance']
+TOTAL_MARKS = 50
+
+
+def clean_marks(frame):
+    """
+    Coerce the mark columns to numbers, treating blanks and junk as 0.
+
+    Args:
+        frame (pd.DataFrame): Raw results; modified in place
+
+    Returns:
+        pd.DataFrame: The same frame
+    """
+    for col in MARK_COLUMNS:
+        if col in frame.columns:
+            frame[col] = pd.to_numeric(frame[col], errors='coerce').fillna(0)
+    return frame
+
+
+def best_ct_average(frame, ct_columns=CT_COLUMNS, best_of=3):
+    """
+    Average of the best `best_of` class tests for every row at once.
+
+    Missing (NaN) marks are skipped. A student with fewer than `best_of`
+    valid marks gets the mean of the marks they do have, and a student with
+    none gets 0, exactly like the old per-row loop.
+
+    Args:
+        frame (pd.DataFrame): Frame holding the CT columns
+        ct_columns (list): Candidate CT columns; absent ones are ignored
+        best_of (int): Number of top marks to average
+
+    Returns:
+        np.ndarray: Best-of average per row (float64)
+    """
+    columns = [col for col in ct_columns if col in frame.columns]
+    if not columns:
+        return np.zeros(len(frame))
+
+    marks = frame[columns].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+    valid = ~np.isnan(marks)
+    counts = valid.sum(axis=1)
+
+    # NaN sorts last, so push missing marks to -inf and take the tail
+    ranked = np.sort(np.where(valid, marks, -np.inf), axis=1)
+    top = ranked[:, -min(best_of, ranked.shape[1]):]
+    top_sum = np.where(np.isinf(top), 0.0, top).sum(axis=1)
+
+    divisor = np.minimum(counts, best_of)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        average = top_sum / divisor
+    return np.where(counts == 0, 0.0, average)
+
+
+def compute_scores(frame):
+    """
+    Add Midterm_Scaled, Best_3_CT_Avg, Total_Obtained and Percentage columns.
+
+    Presentation defaults to 0 and Attendance to 8 when the column is absent.
+
+    Args:
+        frame (pd.DataFrame): Preprocessed marks; modified in place
+
+    Returns:
+        pd.DataFrame: The same frame with the score columns added
+    """
+    # Scale Mid-Term from 40 to 20
+    frame['Midterm_Scaled'] = frame['Mid-Term'] / 2
+    frame['Best_3_CT_Avg'] = best_ct_average(frame)
+
+    if 'Presentation' not in frame.columns:
+        frame['Presentation'] = 0
+    if 'Attendance' not in frame.columns:
+        frame['Attendance'] = 8
+
+    frame['Total_Obtained'] = (
+        frame['Midterm_Scaled'] +  # 20 marks
+        frame['Best_3_CT_Avg'] +   # 10 marks
+        frame['Presentation'] +    # 10 marks
+        frame['Attendance']        # 10 marks
+    )
+    frame['Percentage'] = (frame['Total_Obtained'] / TOTAL_MARKS) * 100
+    return frame
@@ -0,0 +1,286 @@
+import heapq
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from src.services.report_stats import EXAM_COMPONENTS, AnalysisReport, top_k_indices
+
+
+class RunningStats:
+    """
+    Online count, mean, variance, min, max and zero count for several columns.
+
+    Each chunk is reduced column-wise with numpy and folded into the running
+    totals with the parallel form of Welford's algorithm (Chan et al.), so
+    memory does not grow with the number of rows. NaN values are skipped.
+    """
+
+    def __init__(self, n_columns):
+        self.count = np.zeros(n_columns, dtype=np.int64)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+        self.zeros = np.zeros(n_columns, dtype=np.int64)
+
+    def update(self, values):
+        """
+        Fold a chunk into the running statistics.
+
+        Args:
+            values (np.ndarray): rows x columns array
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 1:
+            values = values[:, None]
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0)
+        if not count.any():
+            return
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, np.nansum(values, axis=0) / count, 0.0)
+            m2 = np.nansum((values - mean) ** 2, axis=0)
+            self.min = np.fmin(self.min, np.nanmin(np.where(valid, values, np.inf), axis=0))
+            self.max = np.fmax(self.max, np.nanmax(np.where(valid, values, -np.inf), axis=0))
+        self.zeros += (values == 0).sum(axis=0)
+
+        total = self.count + count
+        delta = mean - self.mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self.mean = np.where(total > 0, self.mean + delta * count / total, 0.0)
+            self.m2 = self.m2 + m2 + np.where(total > 0, delta ** 2 * self.count * count / total, 0.0)
+        self.count = total
+
+    def remove(self, values):
+        """
+        Take a chunk that was previously added back out (reverse Chan merge).
+
+        min and max cannot be recovered this way; callers that remove values
+        should track extremes with a ValueCounter.
+
+        Args:
+            values (np.ndarray): rows x columns array
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.ndim == 1:
+            values = values[:, None]
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, np.nansum(values, axis=0) / count, 0.0)
+            m2 = np.nansum((values - mean) ** 2, axis=0)
+            remaining = self.count - count
+            rest_mean = np.where(remaining > 0, (self.count * self.mean - count * mean) / remaining, 0.0)
+            delta = mean - rest_mean
+            rest_m2 = self.m2 - m2 - np.where(self.count > 0, delta ** 2 * remaining * count / self.count, 0.0)
+        self.zeros -= (values == 0).sum(axis=0)
+        self.mean = rest_mean
+        self.m2 = np.where(remaining > 1, np.maximum(rest_m2, 0.0), 0.0)
+        self.count = remaining
+
+    def variance(self, ddof=1):
+        """Per-column variance (sample variance by default)"""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self.count > ddof, self.m2 / (self.count - ddof), np.nan)
+
+    def averages(self):
+        """Per-column mean, NaN for columns that never saw a value"""
+        return np.where(self.count > 0, self.mean, np.nan)
+
+    def extremes(self):
+        """(min, max) per column, NaN for columns that never saw a value"""
+        seen = self.count > 0
+        return np.where(seen, self.min, np.nan), np.where(seen, self.max, np.nan)
+
+
+class ValueCounter:
+    """
+    Exact frequency table of the values in a column.
+
+    Marks come in a handful of steps (whole and half marks, thirds from the CT
+    average), so the table stays small however many students are added, and
+    gives an exact median without holding the column in memory.
+    """
+
+    def __init__(self):
+        self.counts = Counter()
+
+    def update(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        unique, counts = np.unique(values, return_counts=True)
+        self.counts.update(dict(zip(unique.tolist(), counts.tolist())))
+
+    def remove(self, values):
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        unique, counts = np.unique(values, return_counts=True)
+        self.counts.subtract(dict(zip(unique.tolist(), counts.tolist())))
+        for value in unique.tolist():
+            if self.counts[value] <= 0:
+                del self.counts[value]
+
+    def total(self):
+        return sum(self.counts.values())
+
+    def min(self):
+        return min(self.counts) if self.counts else np.nan
+
+    def max(self):
+        return max(self.counts) if self.counts else np.nan
+
+    def median(self):
+        """Median with the same even-count averaging as np.median"""
+        n = self.total()
+        if n == 0:
+            return np.nan
+        keys = sorted(self.counts)
+        cumulative = np.cumsum([self.counts[key] for key in keys])
+        lower = keys[int(np.searchsorted(cumulative, (n - 1) // 2, side='right'))]
+        upper = keys[int(np.searchsorted(cumulative, n // 2, side='right'))]
+        return (lower + upper) / 2
+
+
+class LabelCounter:
+    """Running counts for a grade or category column"""
+
+    def __init__(self):
+        self.labels = []
+        self.counts = Counter()
+
+    def update(self, labels):
+        if isinstance(labels.dtype, pd.CategoricalDtype):
+            for label in labels.cat.categories:
+                if label not in self.counts:
+                    self.labels.append(label)
+                    self.counts[label] = 0
+            codes = labels.cat.codes.to_numpy()
+            counts = np.bincount(codes[codes >= 0], minlength=len(labels.cat.categories))
+            for label, count in zip(labels.cat.categories, counts):
+                self.counts[label] += int(count)
+        else:
+            for label, count in labels.value_counts(sort=False).items():
+                if label not in self.counts:
+                    self.labels.append(label)
+                self.counts[label] += int(count)
+
+    def remove(self, labels):
+        for label, count in labels.astype(object).value_counts(sort=False).items():
+            self.counts[label] -= int(count)
+
+    def distribution(self):
+        """Counts in descending order, ties in label order, zeros left out"""
+        ordered = sorted(self.labels, key=lambda label: -self.counts[label])
+        return {label: self.counts[label] for label in ordered if self.counts[label] > 0}
+
+
+class BoundedTopK:
+    """
+    The k best rows seen so far, in a heap of at most k entries.
+
+    Ties are broken by arrival order, matching `nlargest`/`nsmallest` with
+    keep='first'.
+    """
+
+    def __init__(self, k, largest=True):
+        self.k = k
+        self.largest = largest
+        self._heap = []  # root is the weakest kept entry
+
+    def push(self, value, position, record):
+        value = float(value)
+        if np.isnan(value):
+            return
+        key = value if self.largest else -value
+        entry = (key, -position, record)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self):
+        """Kept records, best first"""
+        return [record for _, _, record in sorted(self._heap, key=lambda entry: entry[:2], reverse=True)]
+
+
+class StreamingReport:
+    """
+    Builds the `generate_detailed_report` dict from a stream of scored chunks.
+
+    Feed it chunks that have been through clean_marks, compute_scores and the
+    grade scales; `report()` can be called at any time.
+    """
+
+    def __init__(self, top_n=5, components=EXAM_COMPONENTS):
+        self.top_n = top_n
+        self.components = components
+        self.present = None
+        self.component_stats = None
+        self.percentage_stats = RunningStats(1)
+        self.percentages = ValueCounter()
+        self.grades = LabelCounter()
+        self.categories = LabelCounter()
+        self.top = BoundedTopK(top_n, largest=True)
+        self.bottom = BoundedTopK(top_n, largest=False)
+        self.rows = 0
+
+    def update(self, chunk):
+        """
+        Fold one scored and graded chunk into the report.
+
+        Args:
+            chunk (pd.DataFrame): Chunk with Percentage, Grade and Category
+        """
+        if self.present is None:
+            self.present = [(label, column) for label, column in self.components if column in chunk.columns]
+            self.component_stats = RunningStats(len(self.present))
+
+        if self.present:
+            self.component_stats.update(chunk[[column for _, column in self.present]].to_numpy(dtype=np.float64))
+        percentages = chunk['Percentage'].to_numpy(dtype=np.float64)
+        self.percentage_stats.update(percentages)
+        self.percentages.update(percentages)
+        self.grades.update(chunk['Grade'])
+        self.categories.update(chunk['Category'])
+
+        for heap, largest in [(self.top, True), (self.bottom, False)]:
+            for position in top_k_indices(percentages, self.top_n, largest=largest):
+                row = chunk.iloc[position]
+                heap.push(percentages[position], self.rows + position,
+                          {'Student Name': row['Student Name'], 'Percentage': float(row['Percentage']),
+                           'Grade': str(row['Grade'])})
+        self.rows += len(chunk)
+
+    def report(self):
+        """
+        Returns:
+            AnalysisReport: Same layout as ResultAnalyzer.generate_detailed_report
+        """
+        lowest, highest = self.percentage_stats.extremes()
+        report = AnalysisReport()
+        report['total_students'] = self.rows
+        report['average_percentage'] = float(self.percentage_stats.averages()[0])
+        report['highest_percentage'] = float(highest[0])
+        report['lowest_percentage'] = float(lowest[0])
+        report['median_percentage'] = float(self.percentages.median())
+        report['category_distribution'] = self.categories.distribution()
+        report['grade_distribution'] = self.grades.distribution()
+        report['top_performers'] = self.top.items()
+        report['students_needing_attention'] = self.bottom.items()
+
+        exam_analysis = {}
+        if self.present:
+            averages = self.component_stats.averages()
+            lows, highs = self.component_stats.extremes()
+            for i, (label, _) in enumerate(self.present):
+                exam_analysis[label] = {
+                    'average': float(averages[i]),
+                    'highest': float(highs[i]),
+                    'lowest': float(lows[i]),
+                    'students_with_zero': int(self.component_stats.zeros[i])
+                }
+        report['exam_analysis'] = exam_analysis
+        return report
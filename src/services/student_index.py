@@ -0,0 +1,206 @@
+import json
+
+import numpy as np
+
+# Bump when the saved index layout changes
+INDEX_VERSION = 1
+
+
+def _id_array(ids):
+    """Student IDs as an array np.load can read back without pickles (object IDs become strings)"""
+    ids = np.asarray(ids)
+    return ids.astype(str) if ids.dtype == object else ids
+
+
+class StudentIndex:
+    """
+    Nearest-neighbour index of students over standardized marks.
+
+    Answers "which students have a profile like this one?" for a StudentID
+    or a mark vector. Distances are Euclidean in the clustering's
+    standardized space, so every feature weighs the same as it does for
+    KMeans.
+
+    The bulk of the students sit in a KD-tree. Changes do not rebuild it:
+    added or updated students go to a small delta buffer that is searched
+    by brute force, and removed or superseded tree rows are tombstoned.
+    Once the delta buffer or the tombstones reach rebuild_fraction of the
+    tree, everything is folded into a fresh tree.
+    """
+
+    def __init__(self, ids, names, X_scaled, features, mean, scale, leaf_size=40, rebuild_fraction=0.1):
+        self.features = list(features)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.leaf_size = leaf_size
+        self.rebuild_fraction = rebuild_fraction
+        self._build(_id_array(ids), np.asarray(names, dtype=object), np.asarray(X_scaled, dtype=np.float64))
+
+    def _build(self, ids, names, matrix):
+        from sklearn.neighbors import KDTree
+
+        self.ids, self.names, self.matrix = ids, names, matrix
+        self.tree = KDTree(matrix, leaf_size=self.leaf_size) if len(matrix) else None
+        self.rows = {student_id: row for row, student_id in enumerate(ids.tolist())}
+        self.dead = np.zeros(len(ids), dtype=bool)
+        self.tombstones = 0
+        # StudentID -> (name, standardized marks) added or updated since the build
+        self.delta = {}
+
+    def __len__(self):
+        return len(self.rows) - self.tombstones + len(self.delta)
+
+    def __contains__(self, student_id):
+        return student_id in self.delta or (student_id in self.rows and not self.dead[self.rows[student_id]])
+
+    def standardize(self, marks):
+        """
+        Standardize raw marks with the clustering's scaler.
+
+        Args:
+            marks (array-like, dict or pd.Series): One mark vector in
+                `features` order, or a mapping from feature name to mark
+
+        Returns:
+            np.ndarray: The standardized vector
+        """
+        if hasattr(marks, 'keys'):
+            marks = [marks[feature] for feature in self.features]
+        marks = np.asarray(marks, dtype=np.float64)
+        if marks.shape != (len(self.features),):
+            raise ValueError(f"Expected {len(self.features)} marks ({', '.join(self.features)})")
+        return (marks - self.mean) / self.scale
+
+    def vector(self, student_id):
+        """Standardized marks of an indexed student"""
+        if student_id in self.delta:
+            return self.delta[student_id][1]
+        if student_id not in self:
+            raise KeyError(f"Unknown StudentID: {student_id}")
+        return self.matrix[self.rows[student_id]]
+
+    def query(self, student_id=None, marks=None, k=5):
+        """
+        The k students closest to a student or to a mark vector.
+
+        Args:
+            student_id: Indexed student to search around (not returned)
+            marks: Raw marks to search around (see standardize)
+            k (int): Number of neighbours
+
+        Returns:
+            list: {'id', 'name', 'distance'} dicts, nearest first
+
+        Raises:
+            KeyError: If student_id is not indexed
+            ValueError: Unless exactly one of student_id and marks is given
+        """
+        if (student_id is None) == (marks is None):
+            raise ValueError("Give either student_id or marks")
+        point = self.vector(student_id) if student_id is not None else self.standardize(marks)
+        wanted = k + (student_id is not None)
+
+        found = []
+        if self.tree is not None:
+            # Ask for enough extra neighbours to cover any tombstoned rows
+            count = min(wanted + self.tombstones, len(self.ids))
+            distances, rows = self.tree.query(point[None, :], k=count)
+            found = [(distance, self.ids[row].item(), self.names[row])
+                     for distance, row in zip(distances[0], rows[0]) if not self.dead[row]]
+        for delta_id, (name, vector) in self.delta.items():
+            found.append((float(np.sqrt(((vector - point) ** 2).sum())), delta_id, name))
+
+        found.sort(key=lambda item: item[0])
+        neighbours = [{'id': found_id, 'name': name, 'distance': float(distance)}
+                      for distance, found_id, name in found if found_id != student_id]
+        return neighbours[:k]
+
+    def upsert(self, ids, names, marks):
+        """
+        Add students or replace their marks.
+
+        Args:
+            ids (list): Student IDs
+            names (list): Student names
+            marks (np.ndarray or pd.DataFrame): Raw marks, one row per
+                student (a DataFrame is read in `features` order)
+        """
+        if hasattr(marks, 'columns'):
+            marks = marks[self.features]
+        scaled = (np.asarray(marks, dtype=np.float64) - self.mean) / self.scale
+        for student_id, name, vector in zip(ids, names, scaled):
+            self._bury(student_id)
+            self.delta[student_id] = (name, vector)
+        self._maybe_rebuild()
+
+    def remove(self, ids):
+        """
+        Drop students from the index.
+
+        Raises:
+            KeyError: If a student is not indexed
+        """
+        for student_id in ids:
+            if student_id not in self:
+                raise KeyError(f"Unknown StudentID: {student_id}")
+            self.delta.pop(student_id, None)
+            self._bury(student_id)
+        self._maybe_rebuild()
+
+    def _bury(self, student_id):
+        row = self.rows.get(student_id)
+        if row is not None and not self.dead[row]:
+            self.dead[row] = True
+            self.tombstones += 1
+
+    def _maybe_rebuild(self):
+        limit = max(1, self.rebuild_fraction * len(self.ids))
+        if len(self.delta) > limit or self.tombstones > limit:
+            self.rebuild()
+
+    def rebuild(self):
+        """Fold the delta buffer into a new tree and forget the tombstones"""
+        alive = ~self.dead
+        ids = self.ids[alive]
+        if self.delta:
+            # Let numpy pick the dtype: casting to the tree's would truncate longer string IDs
+            ids = _id_array(ids.tolist() + list(self.delta))
+        names = np.concatenate([self.names[alive], np.array([name for name, _ in self.delta.values()], dtype=object)])
+        vectors = [vector for _, vector in self.delta.values()]
+        matrix = np.vstack([self.matrix[alive]] + vectors) if vectors else self.matrix[alive]
+        self._build(ids, names, matrix)
+
+    def save(self, file_path):
+        """
+        Save the index (delta buffer folded in) as a .npz file.
+
+        The tree itself is not stored: building it from the matrix on load
+        takes milliseconds and keeps the file free of pickles.
+
+        Returns:
+            str: Path to the saved file
+        """
+        if self.delta or self.tombstones:
+            self.rebuild()
+        meta = {'version': INDEX_VERSION, 'features': self.features, 'leaf_size': self.leaf_size,
+                'rebuild_fraction': self.rebuild_fraction}
+        with open(file_path, 'wb') as f:
+            np.savez(f, ids=self.ids, names=self.names.astype(str), matrix=self.matrix, mean=self.mean,
+                     scale=self.scale, meta=np.array(json.dumps(meta)))
+        return file_path
+
+    @classmethod
+    def load(cls, file_path):
+        """
+        Load an index saved with save().
+
+        Raises:
+            ValueError: If the file was written by a different INDEX_VERSION
+        """
+        with np.load(file_path, allow_pickle=False) as data:
+            meta = json.loads(data['meta'].item())
+            if meta.get('version') != INDEX_VERSION:
+                raise ValueError(f"Unsupported student index version {meta.get('version')} "
+                                 f"(expected {INDEX_VERSION})")
+            return cls(data['ids'], data['names'].astype(object), data['matrix'], meta['features'], data['mean'],
+                       data['scale'], leaf_size=meta['leaf_size'], rebuild_fraction=meta['rebuild_fraction'])
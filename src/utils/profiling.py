@@ -0,0 +1,125 @@
+import functools
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class StageProfiler:
+    """
+    Wall time and peak memory per pipeline stage.
+
+    Wrap each stage in `with profiler.stage('load'):`. Stages may nest (a
+    stage started inside another records it as its parent). Memory is
+    traced with tracemalloc while a stage is open; peak_bytes is the
+    highest traced allocation above what was allocated when the stage
+    started. tracemalloc slows allocation-heavy code down, so pass
+    track_memory=False when only timings are wanted.
+
+    A disabled profiler (the analyzers' default) does nothing and costs
+    nothing.
+    """
+
+    def __init__(self, name='analysis', track_memory=True, enabled=True):
+        self.name = name
+        self.track_memory = track_memory
+        self.enabled = enabled
+        self.stages = []
+        self._open = []  # [record, start_bytes, peak_bytes] per open stage
+        self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name):
+        """Time (and trace memory for) the enclosed block as one stage"""
+        if not self.enabled:
+            yield
+            return
+
+        record = {'name': name, 'parent': self._open[-1][0]['name'] if self._open else None,
+                  'seconds': None, 'peak_bytes': None}
+        self.stages.append(record)
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            self._fold_peak()
+            tracemalloc.reset_peak()
+        entry = [record, tracemalloc.get_traced_memory()[0] if self.track_memory else 0, 0]
+        self._open.append(entry)
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record['seconds'] = time.perf_counter() - start
+            if self.track_memory:
+                self._fold_peak()
+                record['peak_bytes'] = max(entry[2] - entry[1], 0)
+            self._open.pop()
+            if not self._open and self._started_tracing:
+                tracemalloc.stop()
+                self._started_tracing = False
+
+    def _fold_peak(self):
+        # reset_peak is shared by every open stage, so hand the current peak
+        # to all of them before any stage resets it
+        peak = tracemalloc.get_traced_memory()[1]
+        for entry in self._open:
+            entry[2] = max(entry[2], peak)
+
+    def total_seconds(self):
+        """Time spent in top-level stages"""
+        return sum(stage['seconds'] or 0 for stage in self.stages if stage['parent'] is None)
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: name, created, total_seconds and the list of stages
+                ({name, parent, seconds, peak_bytes}) in start order
+        """
+        return {
+            'name': self.name,
+            'created': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'total_seconds': self.total_seconds(),
+            'stages': [dict(stage) for stage in self.stages],
+        }
+
+    def save_json(self, file_path):
+        """Write to_dict() to a JSON file and return its path"""
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        with open(file_path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return file_path
+
+    def summary(self, limit=4):
+        """One line for a status bar: total time and the slowest top-level stages"""
+        top = sorted((stage for stage in self.stages if stage['parent'] is None and stage['seconds'] is not None),
+                     key=lambda stage: -stage['seconds'])[:limit]
+        parts = []
+        for stage in top:
+            part = f"{stage['name']} {stage['seconds']:.2f}s"
+            if stage['peak_bytes'] is not None:
+                part += f" ({stage['peak_bytes'] / 2**20:.1f} MiB)"
+            parts.append(part)
+        return f"{self.total_seconds():.2f}s total: " + ", ".join(parts)
+
+    def reset(self):
+        """Forget recorded stages"""
+        self.stages = []
+
+
+# Shared no-op profiler used when none is given
+NULL_PROFILER = StageProfiler(enabled=False)
+
+
+def profiled(stage_name):
+    """Method decorator: run the method as a stage of `self.profiler`"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.profiler.stage(stage_name):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
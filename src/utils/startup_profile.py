@@ -0,0 +1,174 @@
+"""
+Cold-start profile of the desktop app.
+
+Every measurement runs in a fresh interpreter, so nothing is already
+imported or cached in memory:
+
+    python -m src.utils.startup_profile                  # import cost of src.main
+    python -m src.utils.startup_profile --first-paint    # also time to first idle frame
+    python -m src.utils.startup_profile --budget 1.5 --json output/startup.json
+
+The import table comes from `python -X importtime` and is summed per
+top-level package (customtkinter, PIL, pandas, ...). With --budget the
+exit status is 1 when the total import time goes over the budget, so the
+profile can gate a CI job.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Packages that should only load once an analysis actually runs
+HEAVY_MODULES = ['pandas', 'numpy', 'matplotlib', 'sklearn', 'scipy']
+
+_FIRST_PAINT_SCRIPT = """
+import time
+start = time.perf_counter()
+import customtkinter as ctk
+from {module} import {window}
+root = ctk.CTk()
+{window}(root)
+
+def painted():
+    print(time.perf_counter() - start)
+    root.destroy()
+
+root.after_idle(painted)
+root.mainloop()
+"""
+
+
+def _run(code, *flags):
+    return subprocess.run([sys.executable, *flags, '-c', code], cwd=PROJECT_ROOT,
+                          capture_output=True, text=True)
+
+
+def import_times(module):
+    """
+    Per-module import time of `module` in a fresh interpreter.
+
+    Args:
+        module (str): Dotted module name, e.g. 'src.main'
+
+    Returns:
+        list: One dict per imported module with name, self_us and
+            cumulative_us, in import order
+
+    Raises:
+        ImportError: If the module cannot be imported
+    """
+    result = _run(f"import {module}", '-X', 'importtime')
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else module)
+
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        rows.append({'name': name.strip(), 'self_us': int(self_us), 'cumulative_us': int(cumulative_us)})
+    return rows
+
+
+def package_totals(rows):
+    """
+    Sum the self time of every module per top-level package.
+
+    Args:
+        rows (list): Output of import_times
+
+    Returns:
+        dict: package -> seconds, most expensive first
+    """
+    totals = {}
+    for row in rows:
+        package = row['name'].split('.')[0]
+        totals[package] = totals.get(package, 0) + row['self_us']
+    return {package: us / 1e6 for package, us in sorted(totals.items(), key=lambda item: -item[1])}
+
+
+def loaded_heavy_modules(module):
+    """Which of HEAVY_MODULES are already in sys.modules after importing `module`"""
+    result = _run(f"import sys, {module}; print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    if result.returncode != 0:
+        raise ImportError(result.stderr.strip().splitlines()[-1] if result.stderr.strip() else module)
+    output = result.stdout.strip().splitlines()
+    return [name for name in output[-1].split(',') if name] if output else []
+
+
+def first_paint(module='src.gui.teachers_menu', window='TeachersMenu'):
+    """
+    Seconds from interpreter start-up to the window's first idle frame.
+
+    Returns:
+        float: Seconds, or None when no display is available
+    """
+    result = _run(_FIRST_PAINT_SCRIPT.format(module=module, window=window))
+    if result.returncode != 0:
+        return None
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def profile(module='src.main', paint=False):
+    """
+    Collect the full start-up profile.
+
+    Args:
+        module (str): Entry module to import
+        paint (bool): Also measure first paint (opens a window briefly)
+
+    Returns:
+        dict: total_import_seconds, packages, slowest_modules, heavy_modules_loaded
+            and first_paint_seconds
+    """
+    rows = import_times(module)
+    total_us = sum(row['self_us'] for row in rows)
+    return {
+        'module': module,
+        'total_import_seconds': total_us / 1e6,
+        'packages': package_totals(rows),
+        'slowest_modules': sorted(rows, key=lambda row: -row['cumulative_us'])[:15],
+        'heavy_modules_loaded': loaded_heavy_modules(module),
+        'first_paint_seconds': first_paint() if paint else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the desktop app's cold-start cost")
+    parser.add_argument('--module', default='src.main', help="entry module to import (default: src.main)")
+    parser.add_argument('--first-paint', action='store_true', help="also time the first idle frame of the window")
+    parser.add_argument('--budget', type=float, help="fail when the total import time exceeds this many seconds")
+    parser.add_argument('--json', help="write the profile to this file")
+    args = parser.parse_args(argv)
+
+    try:
+        result = profile(args.module, paint=args.first_paint)
+    except ImportError as e:
+        print(f"Could not import {args.module}: {e}")
+        return 2
+
+    print(f"Import time for {args.module}: {result['total_import_seconds']:.3f}s")
+    for package, seconds in list(result['packages'].items())[:10]:
+        print(f"  {package:<24} {seconds:8.3f}s")
+    if result['heavy_modules_loaded']:
+        print(f"Loaded at start-up (should be deferred): {', '.join(result['heavy_modules_loaded'])}")
+    if args.first_paint:
+        paint = result['first_paint_seconds']
+        print(f"First paint: {paint:.3f}s" if paint is not None else "First paint: no display available")
+
+    if args.json:
+        os.makedirs(os.path.dirname(os.path.abspath(args.json)), exist_ok=True)
+        with open(args.json, 'w') as f:
+            json.dump(result, f, indent=2)
+
+    if args.budget is not None and result['total_import_seconds'] > args.budget:
+        print(f"Over budget: {result['total_import_seconds']:.3f}s > {args.budget:.3f}s")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
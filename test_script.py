@@ -15,6 +15,7 @@ from sklearn.preprocessing import StandardScaler
 from sklearn.decomposition import PCA
 import os
 from datetime import datetime
+from src.services.scoring import best_ct_average
 
 
 def load_data(file_path, index_col=0, fill_na_value=0):
@@ -43,14 +44,7 @@ def load_data(file_path, index_col=0, fill_na_value=0):
     ct_columns = ['CT1', 'CT2', 'CT3', 'CT4']
     valid_ct_cols = [col for col in ct_columns if col in df.columns]
 
-    ct_scores = []
-    for index, row in df.iterrows():
-        scores = [row[col] for col in valid_ct_cols if pd.notna(row[col])]
-        scores.sort(reverse=True)
-        best_3_avg = sum(scores[:3]) / 3 if len(scores) >= 3 else (sum(scores) / len(scores) if scores else 0)
-        ct_scores.append(best_3_avg)
-
-    df['CT_Avg'] = ct_scores
+    df['CT_Avg'] = best_ct_average(df, valid_ct_cols)
 
     # Delete individual CT columns after calculating the average
     for col in valid_ct_cols:
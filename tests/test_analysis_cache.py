@@ -0,0 +1,103 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import pandas as pd
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.services.analysis_cache import AnalysisCache, frame_fingerprint
+from src.services.grading import GradeScale
+from src.services.result_analyzer import ResultAnalyzer
+
+
+class TestAnalysisCache(unittest.TestCase):
+    """Test cases for report memoization and the analysis cache"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.data_file = os.path.join(self.temp_dir, 'result.csv')
+        shutil.copy(os.path.join(os.path.dirname(__file__), '..', 'data', 'result.csv'), self.data_file)
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+
+    def tearDown(self):
+        """Clean up after each test method"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_report_is_memoized(self):
+        """Repeat report calls reuse the first result"""
+        analyzer = ResultAnalyzer(self.data_file, cache_dir=self.cache_dir)
+        self.assertTrue(analyzer.run_analysis())
+        self.assertIs(analyzer.generate_detailed_report(), analyzer.generate_detailed_report())
+
+    def test_mutation_invalidates_report(self):
+        """Editing processed data or grading rebuilds the report"""
+        analyzer = ResultAnalyzer(self.data_file, cache_dir=self.cache_dir)
+        analyzer.run_analysis()
+        first = analyzer.generate_detailed_report()
+
+        analyzer.processed_data.loc[0, 'Percentage'] = 100.0
+        second = analyzer.generate_detailed_report()
+        self.assertIsNot(first, second)
+        self.assertEqual(second['highest_percentage'], 100.0)
+
+        analyzer.grade_scale = GradeScale('pass-fail', [(50, 'Pass')], 'Fail')
+        analyzer.categorize_students()
+        self.assertEqual(set(analyzer.generate_detailed_report()['grade_distribution']), {'Pass', 'Fail'})
+
+    def test_disk_cache_is_reused_across_instances(self):
+        """A fresh analyzer restores the analysis without parsing the file"""
+        ResultAnalyzer(self.data_file, cache_dir=self.cache_dir).run_analysis()
+
+        analyzer = ResultAnalyzer(self.data_file, cache_dir=self.cache_dir)
+        analyzer.cache._memory.clear()
+        analyzer.load_data = lambda: self.fail("cached analysis should not reload the file")
+        self.assertTrue(analyzer.run_analysis())
+        self.assertEqual(len(analyzer.processed_data), 81)
+
+    def test_key_tracks_file_content_and_grading(self):
+        """Cache key changes with the file content and with the grading scales"""
+        analyzer = ResultAnalyzer(self.data_file, cache_dir=self.cache_dir)
+        key = analyzer.cache_key()
+
+        custom = ResultAnalyzer(self.data_file, grade_scale=GradeScale('pass-fail', [(50, 'Pass')], 'Fail'))
+        self.assertNotEqual(custom.cache_key(), key)
+
+        with open(self.data_file, 'a') as f:
+            f.write("82,1,NEW STUDENT,1,1,1,1,1,1,1\n")
+        self.assertNotEqual(analyzer.cache_key(), key)
+
+    def test_cache_returns_copies(self):
+        """Values handed out by the cache are independent copies"""
+        cache = AnalysisCache()
+        frame = pd.DataFrame({'a': [1, 2]})
+        cache.put('k', frame)
+        copy = cache.get('k')
+        copy.loc[0, 'a'] = 99
+        self.assertEqual(frame_fingerprint(cache.get('k')), frame_fingerprint(frame))
+
+    def test_disk_layer_is_bounded(self):
+        """Least recently used pickles are deleted once the budget is exceeded"""
+        cache = AnalysisCache(self.cache_dir, max_bytes=2500)
+        for i, key in enumerate(['a', 'b', 'c']):
+            cache.put(key, b'x' * 1000)
+            os.utime(cache._path(key), (i, i))
+        cache.put('d', b'x' * 1000)
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ['analysis_c.pkl', 'analysis_d.pkl'])
+
+    def test_unreadable_pickle_is_a_miss(self):
+        """A truncated pickle on disk is ignored and removed"""
+        cache = AnalysisCache(self.cache_dir)
+        cache.put('k', pd.DataFrame({'a': [1, 2]}))
+        with open(cache._path('k'), 'r+b') as f:
+            f.truncate(10)
+        fresh = AnalysisCache(self.cache_dir)
+        self.assertIsNone(fresh.get('k'))
+        self.assertFalse(os.path.exists(fresh._path('k')))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+import pandas as pd
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.services.batch_runner import course_names, find_result_files, run_batch
+
+
+class TestBatchRunner(unittest.TestCase):
+    """Test cases for multi-course batch analysis"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.source_dir = os.path.join(self.temp_dir, 'courses')
+        self.output_dir = os.path.join(self.temp_dir, 'out')
+        os.makedirs(os.path.join(self.source_dir, 'section_b'))
+
+        result_csv = os.path.join(os.path.dirname(__file__), '..', 'data', 'result.csv')
+        data = pd.read_csv(result_csv)
+        data.to_csv(os.path.join(self.source_dir, 'CSE101.csv'), index=False)
+        data.head(30).to_csv(os.path.join(self.source_dir, 'section_b', 'CSE101.csv'), index=False)
+        # Missing the Mid-Term column, so scoring fails
+        data.drop(columns=['Mid-Term']).to_csv(os.path.join(self.source_dir, 'broken.csv'), index=False)
+        with open(os.path.join(self.source_dir, 'notes.txt'), 'w') as f:
+            f.write("not a result file")
+
+    def tearDown(self):
+        """Clean up after each test method"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_find_result_files(self):
+        """Directories are searched recursively and non-result files skipped"""
+        files = find_result_files(self.source_dir)
+        self.assertEqual(len(files), 3)
+        self.assertEqual(find_result_files(os.path.join(self.source_dir, '*.csv')),
+                         sorted([os.path.join(self.source_dir, 'CSE101.csv'), os.path.join(self.source_dir, 'broken.csv')]))
+        self.assertEqual(course_names(['a/x.csv', 'b/x.csv', 'c/y.xlsx']), ['x', 'x_2', 'y'])
+
+    def test_batch_keeps_going_past_failures(self):
+        """Good files are reported and merged even when one file fails"""
+        results = run_batch(self.source_dir, self.output_dir, workers=1)
+        statuses = {row['course']: row['status'] for row in results['courses']}
+        self.assertEqual(statuses, {'CSE101': 'ok', 'CSE101_2': 'ok', 'broken': 'failed'})
+
+        summary = results['summary']
+        self.assertEqual(summary['total_students'], 81 + 30)
+        self.assertEqual(sum(summary['grade_distribution'].values()), 81 + 30)
+        self.assertEqual(len(summary['failed_files']), 1)
+
+        with open(results['summary_json']) as f:
+            self.assertEqual(json.load(f)['courses_failed'], 1)
+        self.assertEqual(len(pd.read_csv(results['summary_csv'])), 3)
+        self.assertTrue(os.path.exists(os.path.join(self.output_dir, 'CSE101', 'result_analysis_report.json')))
+
+    def test_pooled_batch(self):
+        """A process pool produces the same per-course results"""
+        serial = run_batch(self.source_dir, os.path.join(self.output_dir, 'serial'), workers=1)
+        pooled = run_batch(self.source_dir, os.path.join(self.output_dir, 'pooled'), workers=2)
+        self.assertEqual([(row['course'], row['status']) for row in pooled['courses']],
+                         [(row['course'], row['status']) for row in serial['courses']])
+        self.assertEqual(pooled['summary']['total_students'], serial['summary']['total_students'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import sys
+import os
+import contextlib
+import io
+import numpy as np
+import pandas as pd
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from benchmarks.cohort import MARK_LAYOUT, generate_cohort
+from benchmarks.run_benchmarks import RESULT_SCHEMA_VERSION, compare, run_suite
+from src.services import ingest_cache
+
+
+class TestBenchmarks(unittest.TestCase):
+    """Test cases for the synthetic cohort generator and benchmark runner"""
+
+    def test_cohort_shape(self):
+        """Cohorts have the result.csv columns, unique IDs, blanks and absentees"""
+        cohort = generate_cohort(5000, seed=1)
+        expected = pd.read_csv(os.path.join(project_root, 'data', 'result.csv'), encoding='utf-8-sig')
+        self.assertEqual(list(cohort.columns), list(expected.columns))
+        self.assertTrue(cohort['StudentID'].is_unique)
+        self.assertGreater(cohort['CT1'].isna().sum(), 0)
+        self.assertGreater((cohort['CT1'] == 0).sum(), 0)
+        for column, (maximum, _) in MARK_LAYOUT.items():
+            self.assertLessEqual(cohort[column].max(), maximum)
+        pd.testing.assert_frame_equal(cohort, generate_cohort(5000, seed=1))
+        # Skewed towards high marks like the real course
+        self.assertGreater(np.nanmedian(cohort['Mid-Term']), 20)
+
+    def test_suite_and_compare(self):
+        """A small suite produces comparable result documents"""
+        default_cache_dir = ingest_cache.DEFAULT_CACHE_DIR
+        with contextlib.redirect_stdout(io.StringIO()):
+            document = run_suite([300], ['result_analyzer', 'report_writing'], repeat=2)
+        self.assertEqual(ingest_cache.DEFAULT_CACHE_DIR, default_cache_dir)
+        self.assertEqual(document['schema_version'], RESULT_SCHEMA_VERSION)
+        self.assertEqual([(r['benchmark'], r['rows']) for r in document['results']],
+                         [('result_analyzer', 300), ('report_writing', 300)])
+        self.assertIn('load', [stage['name'] for stage in document['results'][0]['stages']])
+        rows = compare(document, document)
+        self.assertEqual([row['ratio'] for row in rows], [1.0, 1.0])
+
+if __name__ == "__main__":
+    unittest.main()
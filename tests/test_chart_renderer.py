@@ -0,0 +1,70 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.services import chart_renderer
+from src.services.chart_cache import ChartCache, MANIFEST_NAME
+from src.services.chart_renderer import CHARTS
+from src.services.result_analyzer import ResultAnalyzer
+
+
+class TestChartRenderer(unittest.TestCase):
+    """Test cases for serial and pooled chart rendering"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        dataset_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'result.csv')
+        self.analyzer = ResultAnalyzer(dataset_path)
+        self.analyzer.load_data()
+        self.analyzer.categorize_students()
+        self.analyzer.output_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up after each test method"""
+        shutil.rmtree(self.analyzer.output_dir)
+
+    def _expected_files(self):
+        return sorted([filename for _, filename in CHARTS.values()] + [MANIFEST_NAME])
+
+    def test_serial_rendering(self):
+        """All charts are written when rendering in-process"""
+        self.analyzer.generate_graphs(dpi=50)
+        self.assertEqual(sorted(os.listdir(self.analyzer.output_dir)), self._expected_files())
+
+    def test_pooled_rendering(self):
+        """A process pool writes the same set of charts"""
+        self.analyzer.generate_graphs(workers=2, dpi=50)
+        self.assertEqual(sorted(os.listdir(self.analyzer.output_dir)), self._expected_files())
+
+    def test_unchanged_charts_are_reused(self):
+        """Only charts whose inputs changed are redrawn"""
+        self.analyzer.generate_graphs(dpi=50)
+        drawn = []
+        original = chart_renderer.render_chart
+        chart_renderer.render_chart = lambda name, *args: drawn.append(name) or original(name, *args)
+        try:
+            self.analyzer.generate_graphs(dpi=50)
+            self.assertEqual(drawn, [])
+
+            self.analyzer.processed_data.loc[0, 'Attendance'] = 0
+            self.analyzer.generate_graphs(dpi=50)
+            self.assertIn('component_distribution', drawn)
+            self.assertNotIn('assessment_distribution', drawn)
+
+            drawn.clear()
+            self.analyzer.generate_graphs(dpi=60)
+            self.assertEqual(len(drawn), len(CHARTS))
+        finally:
+            chart_renderer.render_chart = original
+
+        current = ChartCache(self.analyzer.output_dir).current_files()
+        self.assertEqual(len(current), len(CHARTS))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+import sys
+import os
+import io
+import json
+import shutil
+import subprocess
+import tempfile
+import contextlib
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.cli import EXIT_FAILED, EXIT_OK, EXIT_USAGE, main
+
+
+class TestCli(unittest.TestCase):
+    """Test cases for the headless command-line entry point"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.dataset_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'result.csv')
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up after each test method"""
+        shutil.rmtree(self.temp_dir)
+
+    def run_cli(self, *argv):
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            code = main(list(argv))
+        return code, stdout.getvalue()
+
+    def test_analyze_writes_reports(self):
+        """analyze writes the text and JSON reports and lists them on stdout"""
+        code, stdout = self.run_cli('analyze', self.dataset_path, '-o', self.temp_dir)
+        self.assertEqual(code, EXIT_OK)
+        self.assertEqual(len(stdout.split()), 2)
+        with open(os.path.join(self.temp_dir, 'result_analysis_report.json')) as f:
+            self.assertEqual(json.load(f)['total_students'], 81)
+
+    def test_report_json_on_stdout(self):
+        """report --format json prints only the JSON report"""
+        code, stdout = self.run_cli('report', self.dataset_path, '--format', 'json', '-o', self.temp_dir)
+        self.assertEqual(code, EXIT_OK)
+        self.assertEqual(json.loads(stdout)['total_students'], 81)
+
+        profile = os.path.join(self.temp_dir, 'profile.json')
+        code, stdout = self.run_cli('report', self.dataset_path, '--format', 'json', '-o', self.temp_dir,
+                                    '--profile', profile)
+        self.assertEqual(code, EXIT_OK)
+        self.assertEqual(json.loads(stdout)['total_students'], 81)
+        self.assertTrue(os.path.exists(profile))
+
+    def test_grading_config(self):
+        """A custom grading config changes the grade distribution"""
+        config = os.path.join(self.temp_dir, 'grading.json')
+        with open(config, 'w') as f:
+            json.dump({'grade_scale': {'name': 'pass-fail', 'bands': [{'min': 50, 'label': 'Pass'}],
+                                       'fallback': 'Fail'}}, f)
+        code, stdout = self.run_cli('report', self.dataset_path, '--format', 'json', '--grading', config,
+                                    '-o', self.temp_dir)
+        self.assertEqual(code, EXIT_OK)
+        self.assertEqual(set(json.loads(stdout)['grade_distribution']), {'Pass', 'Fail'})
+
+    def test_cluster_auto(self):
+        """cluster --clusters auto also writes the scores of every candidate k"""
+        code, stdout = self.run_cli('cluster', self.dataset_path, '-o', self.temp_dir, '--clusters', 'auto',
+                                    '--max-clusters', '4', '--workers', '1')
+        self.assertEqual(code, EXIT_OK)
+        selection_file = [path for path in stdout.split() if 'k_selection' in path][0]
+        with open(selection_file) as f:
+            self.assertEqual([score['k'] for score in json.load(f)['scores']], [2, 3, 4])
+        with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+            main(['cluster', self.dataset_path, '--clusters', 'some'])
+
+    def test_assign_with_saved_model(self):
+        """cluster saves a model that assign uses for new students"""
+        code, stdout = self.run_cli('cluster', self.dataset_path, '-o', self.temp_dir)
+        self.assertEqual(code, EXIT_OK)
+        model = [path for path in stdout.split() if 'cluster_model' in path][0]
+        code, stdout = self.run_cli('assign', self.dataset_path, '--model', model, '-o', self.temp_dir)
+        self.assertEqual(code, EXIT_OK)
+        with open(stdout.strip()) as f:
+            self.assertEqual(len(f.readlines()), 82)
+        self.assertEqual(self.run_cli('assign', self.dataset_path, '--model', 'missing.json')[0], EXIT_USAGE)
+
+    def test_similar_students(self):
+        """similar reads the index written by cluster and prints the neighbours"""
+        code, stdout = self.run_cli('cluster', self.dataset_path, '-o', self.temp_dir)
+        index = [path for path in stdout.split() if 'student_index' in path][0]
+        code, stdout = self.run_cli('similar', index, '--student', '23524202070', '-k', '3')
+        self.assertEqual(code, EXIT_OK)
+        neighbours = json.loads(stdout)
+        self.assertEqual(len(neighbours), 3)
+        self.assertNotIn(23524202070, [neighbour['id'] for neighbour in neighbours])
+        self.assertEqual(self.run_cli('similar', index, '--student', '1')[0], EXIT_USAGE)
+
+    def test_exit_codes(self):
+        """Missing input is a usage error and unreadable input a failure"""
+        self.assertEqual(self.run_cli('report', 'missing.csv')[0], EXIT_USAGE)
+        broken = os.path.join(self.temp_dir, 'broken.csv')
+        with open(broken, 'w') as f:
+            f.write("StudentID,Student Name\n1,A\n")
+        self.assertEqual(self.run_cli('analyze', broken, '-o', self.temp_dir)[0], EXIT_FAILED)
+
+    def test_no_gui_imports(self):
+        """The CLI never imports tkinter or customtkinter"""
+        code = ("import sys; from src.cli import main; main(['report', 'data/result.csv', '--format', 'json', "
+                f"'-o', {self.temp_dir!r}]); print([m for m in ('tkinter', 'customtkinter') if m in sys.modules],"
+                " file=sys.stderr)")
+        result = subprocess.run([sys.executable, '-c', code], cwd=project_root, capture_output=True, text=True)
+        self.assertEqual(result.returncode, 0)
+        self.assertEqual(result.stderr.strip().splitlines()[-1], '[]')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,276 @@
+import unittest
+import sys
+import os
+import io
+import shutil
+import tempfile
+import contextlib
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans
+from sklearn.preprocessing import StandardScaler
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from benchmarks.cohort import write_cohort
+from src.services.cluster_analyzer import (ClusterAnalyzer, choose_k, elbow_k, performance_labels,
+                                           previous_group_column, transition_matrix)
+from src.services.cluster_model import ClusterModel
+
+
+class TestClusterAnalyzer(unittest.TestCase):
+    """Test cases for ClusterAnalyzer"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up a synthetic cohort shared by the tests"""
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.dataset_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'result.csv')
+        cls.cohort_path = write_cohort(os.path.join(cls.temp_dir, 'cohort.csv'), 20000, seed=50000)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up after the tests"""
+        shutil.rmtree(cls.temp_dir)
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.output_dir = tempfile.mkdtemp(dir=self.temp_dir)
+
+    def quiet(self):
+        return contextlib.redirect_stdout(io.StringIO())
+
+    def test_performance_labels(self):
+        """Clusters are named by mean total, best first"""
+        labels, groups = performance_labels(pd.Series({0: 40.0, 1: 70.0, 2: 55.0}))
+        self.assertEqual(labels, {1: 'Good', 2: 'Average', 0: 'Struggling'})
+        self.assertEqual(groups, ['Good', 'Average', 'Struggling'])
+        labels, groups = performance_labels(pd.Series({0: 40.0, 1: 70.0}))
+        self.assertEqual(groups, ['Group 1', 'Group 2'])
+
+    def test_chunked_clustering_matches_full_kmeans(self):
+        """Streaming mini-batch clustering finds the groups a well-initialized KMeans finds"""
+        full = ClusterAnalyzer(self.cohort_path, output_dir=self.output_dir)
+        chunked = ClusterAnalyzer(self.cohort_path, output_dir=self.output_dir)
+        with self.quiet():
+            self.assertTrue(full.load_data())
+            self.assertTrue(chunked.perform_chunked_clustering(chunksize=3000))
+
+        marks = full.processed_data.drop(columns=['StudentID', 'Student Name'])
+        reference = KMeans(n_clusters=3, random_state=83, n_init=10).fit_predict(StandardScaler().fit_transform(marks))
+        totals = pd.Series(marks.sum(axis=1).to_numpy())
+        labels, _ = performance_labels(totals.groupby(reference).mean())
+        expected = pd.Series(reference).map(labels).to_numpy()
+
+        written = pd.read_csv(chunked.results_file, index_col=0)
+        self.assertEqual(len(written), 20000)
+        self.assertGreater((written['Group'].to_numpy() == expected).mean(), 0.97)
+        self.assertEqual(list(chunked.group_statistics), ['Good', 'Average', 'Struggling'])
+        self.assertEqual(sum(stats['count'] for stats in chunked.group_statistics.values()), 20000)
+        good = written[written['Group'] == 'Good']
+        self.assertAlmostEqual(chunked.group_statistics['Good']['avg_score'], good['Total'].mean())
+        self.assertEqual(chunked.group_statistics['Good']['students'][0]['total'], good['Total'].max())
+
+    def test_minibatch_full_analysis(self):
+        """run_full_analysis in minibatch mode writes the CSV, report and statistics"""
+        analyzer = ClusterAnalyzer(self.dataset_path, output_dir=self.output_dir)
+        with self.quiet():
+            results = analyzer.run_full_analysis(mode='minibatch', chunksize=25)
+        self.assertTrue(results['success'])
+        self.assertIsNone(results['cluster_plot'])
+        self.assertEqual(len(pd.read_csv(results['csv_file'])), 81)
+        with open(results['report_file']) as f:
+            self.assertIn("Total Students: 81", f.read())
+        with self.assertRaises(ValueError):
+            analyzer.run_full_analysis(mode='bogus')
+
+    def test_choose_k_and_elbow(self):
+        """Best silhouette wins, near-ties go to Calinski-Harabasz; the elbow is the sharpest bend"""
+        scores = [{'k': 2, 'inertia': 100.0, 'silhouette': 0.50, 'calinski_harabasz': 10.0},
+                  {'k': 3, 'inertia': 40.0, 'silhouette': 0.495, 'calinski_harabasz': 30.0},
+                  {'k': 4, 'inertia': 35.0, 'silhouette': 0.30, 'calinski_harabasz': 20.0},
+                  {'k': 5, 'inertia': 32.0, 'silhouette': float('nan'), 'calinski_harabasz': float('nan')}]
+        self.assertEqual(choose_k(scores), 3)
+        self.assertEqual(elbow_k(scores), 3)
+        with self.assertRaises(ValueError):
+            choose_k(scores[3:])
+
+    def test_auto_k_scales_once(self):
+        """n_clusters='auto' scores every candidate in a pool and clusters with the chosen k"""
+        analyzer = ClusterAnalyzer(self.dataset_path, output_dir=self.output_dir)
+        with self.quiet():
+            results = analyzer.run_full_analysis(n_clusters='auto', k_values=range(1, 6), workers=2)
+        self.assertTrue(results['success'])
+        selection = results['k_selection']
+        self.assertEqual([score['k'] for score in selection['scores']], [2, 3, 4, 5])
+        self.assertEqual(results['n_clusters'], selection['best_k'])
+        self.assertEqual(analyzer.processed_data['Cluster'].nunique(), selection['best_k'])
+        # The inertia reported for the chosen k is the one of the final clustering
+        best = next(score for score in selection['scores'] if score['k'] == selection['best_k'])
+        self.assertAlmostEqual(best['inertia'], analyzer.kmeans.inertia_)
+        with self.assertRaises(ValueError):
+            analyzer.run_full_analysis(n_clusters='auto', mode='minibatch')
+
+    def test_saved_model_assigns_like_the_fit(self):
+        """A reloaded model puts raw result rows into the groups the clustering gave them"""
+        analyzer = ClusterAnalyzer(self.dataset_path, output_dir=self.output_dir)
+        with self.quiet():
+            results = analyzer.run_full_analysis()
+        model = ClusterModel.load(results['model_file'])
+        self.assertEqual(model.groups, list(analyzer.groups))
+
+        raw = pd.read_csv(self.dataset_path, index_col=0).sample(20, random_state=1)
+        late = ClusterAnalyzer(self.dataset_path, output_dir=self.output_dir)
+        late.load_model(results['model_file'])
+        assigned = late.assign_students(raw)
+        expected = analyzer.processed_data.loc[raw.index]
+        self.assertEqual(list(assigned['Group']), list(expected['Group']))
+        self.assertTrue(np.allclose(assigned['Total'], expected['Total']))
+        # Prepared rows are accepted as they are
+        self.assertEqual(list(model.assign(expected)['Cluster']), list(expected['Cluster']))
+
+    def test_model_version_is_checked(self):
+        """Models written by another layout version are rejected"""
+        model = ClusterModel(['a', 'b'], [0, 0], [1, 1], [[0, 0], [1, 1]], {0: 'Low', 1: 'High'}, ['High', 'Low'])
+        data = model.to_dict()
+        self.assertEqual(ClusterModel.from_dict(data).labels, {0: 'Low', 1: 'High'})
+        data['version'] += 1
+        with self.assertRaises(ValueError):
+            ClusterModel.from_dict(data)
+        with self.assertRaises(ValueError):
+            ClusterAnalyzer(self.dataset_path, output_dir=self.output_dir).assign_students(self.dataset_path)
+
+    def test_transition_matrix(self):
+        """Students are counted by previous and current group, with New and Left for the unmatched"""
+        previous = pd.Series({1: 'Good', 2: 'Average', 3: 'Average', 4: 'Struggling'})
+        current = pd.Series({1: 'Average', 2: 'Average', 3: 'Good', 5: 'Good'})
+        matrix = transition_matrix(previous, current, ['Good', 'Average', 'Struggling'])
+        self.assertEqual(list(matrix.index), ['Good', 'Average', 'Struggling', 'New'])
+        self.assertEqual(list(matrix.columns), ['Good', 'Average', 'Struggling', 'Left'])
+        self.assertEqual(matrix.loc['Good', 'Average'], 1)
+        self.assertEqual(matrix.loc['Average', 'Good'], 1)
+        self.assertEqual(matrix.loc['Struggling', 'Left'], 1)
+        self.assertEqual(matrix.loc['New', 'Good'], 1)
+        self.assertEqual(matrix.to_numpy().sum(), 5)
+        self.assertEqual(previous_group_column(pd.Series([3, 5]), previous).tolist(), ['Average', 'New'])
+
+    def test_warm_start_keeps_group_identities(self):
+        """A warm start from the previous model converges fast and keeps each name on its centroid"""
+        with self.quiet():
+            first = ClusterAnalyzer(self.dataset_path, output_dir=self.output_dir)
+            previous = first.run_full_analysis()
+            again = ClusterAnalyzer(self.dataset_path, output_dir=tempfile.mkdtemp(dir=self.temp_dir))
+            results = again.run_full_analysis(previous_model=previous['model_file'])
+        self.assertTrue(results['success'])
+        self.assertEqual(again.groups, first.groups)
+        self.assertLessEqual(results['kmeans_iterations'], 2)
+        # Same data: every student stays in their group
+        transitions = pd.read_csv(results['transitions_file'], index_col=0)
+        for group in first.groups:
+            self.assertEqual(transitions.loc[group, group], previous['statistics'][group]['count'])
+        self.assertEqual(transitions.loc['New'].sum() + transitions['Left'].sum(), 0)
+        saved = pd.read_csv(results['csv_file'])
+        self.assertEqual(saved['Previous_Group'].tolist(), saved['Group'].tolist())
+        self.assertNotIn('Previous_Group', list(again.exam_columns()))
+
+        # The chunked mode warm-starts the same way
+        with self.quiet():
+            chunked = ClusterAnalyzer(self.dataset_path, output_dir=tempfile.mkdtemp(dir=self.temp_dir))
+            results = chunked.run_full_analysis(mode='minibatch', chunksize=30, previous_model=previous['model_file'])
+        self.assertEqual(chunked.groups, first.groups)
+        self.assertGreater(sum(results['transitions'][group][group] for group in first.groups), 75)
+        saved = pd.read_csv(results['csv_file'])
+        expected = pd.read_csv(previous['csv_file']).set_index('StudentID')['Group']
+        self.assertEqual(saved['Previous_Group'].tolist(), expected.loc[saved['StudentID']].tolist())
+        with self.assertRaises(ValueError):
+            again.run_full_analysis(n_clusters='auto', previous_model=previous['model_file'])
+
+    def test_transitions_survive_a_shared_timestamp(self):
+        """A run writing over the previous run's results still compares against the previous groups"""
+        term2_path = os.path.join(self.output_dir, 'term2.csv')
+        term2 = pd.read_csv(self.dataset_path, index_col=0)
+        term2.loc[term2.index[::2], 'Mid-Term'] = 0
+        term2.to_csv(term2_path)
+        with self.quiet():
+            first = ClusterAnalyzer(self.dataset_path, output_dir=self.output_dir)
+            previous = first.run_full_analysis()
+            again = ClusterAnalyzer(term2_path, output_dir=self.output_dir)
+            again.timestamp = first.timestamp
+            results = again.run_full_analysis(previous_model=previous['model_file'])
+        self.assertEqual(results['csv_file'], previous['csv_file'])
+        saved = pd.read_csv(results['csv_file'])
+        moved = (saved['Previous_Group'] != saved['Group']).sum()
+        self.assertGreater(moved, 0)
+        transitions = pd.DataFrame(results['transitions']).T
+        stayed = sum(transitions.loc[group, group] for group in first.groups)
+        self.assertEqual(len(saved) - stayed, moved)
+
+    def test_plot_modes_reuse_the_projection(self):
+        """Every plot mode renders from one PCA fit, at the requested dpi"""
+        from PIL import Image
+        analyzer = ClusterAnalyzer(self.dataset_path, output_dir=self.output_dir)
+        with self.quiet():
+            analyzer.load_data()
+            analyzer.perform_clustering()
+            path = analyzer.visualize_clusters(dpi=50, mode='sample', max_points=30)
+            components = analyzer.pca_components
+            small = Image.open(path).size
+            for mode in ('density', 'scatter', 'auto'):
+                self.assertIsNotNone(analyzer.visualize_clusters(dpi=100, mode=mode))
+            self.assertIsNone(analyzer.visualize_clusters(mode='bogus'))
+        self.assertIs(analyzer.pca_components, components)
+        self.assertGreater(Image.open(path).size[0], small[0])
+        # Each group keeps at least a few points in a sample
+        shown = analyzer._stratified_sample(analyzer.processed_data['Group'].to_numpy(), 30)
+        self.assertEqual(set(analyzer.processed_data['Group'].to_numpy()[shown]), set(analyzer.groups))
+
+    def test_bootstrap_stability(self):
+        """Pool and in-process stability agree, and the column lands in the results"""
+        analyzer = ClusterAnalyzer(self.dataset_path, output_dir=self.output_dir)
+        with self.quiet():
+            results = analyzer.run_full_analysis(stability=6, workers=2)
+            pooled = analyzer.processed_data['Stability'].copy()
+            serial = analyzer.assess_stability(6, workers=1)
+        self.assertTrue(results['success'])
+        self.assertEqual(results['stability'], serial)
+        self.assertTrue(pooled.equals(analyzer.processed_data['Stability']))
+        self.assertEqual(list(serial['cluster_jaccard']), list(analyzer.groups))
+        for score in serial['cluster_jaccard'].values():
+            self.assertTrue(0 < score <= 1)
+        self.assertTrue(pooled.between(0, 1).all())
+        self.assertIn('Stability', pd.read_csv(results['csv_file']).columns)
+        with open(results['report_file']) as f:
+            self.assertIn("Stability (mean Jaccard over 6 resamples)", f.read())
+        # Reclustering drops the stale column; stability stays out of the features
+        with self.quiet():
+            analyzer.perform_clustering()
+        self.assertNotIn('Stability', analyzer.processed_data.columns)
+        self.assertIsNone(analyzer.stability)
+
+    def test_group_statistics_match_per_group_filters(self):
+        """The grouped aggregation agrees with filtering and sorting each group"""
+        analyzer = ClusterAnalyzer(self.dataset_path, output_dir=self.output_dir)
+        with self.quiet():
+            results = analyzer.run_full_analysis()
+        self.assertIs(results['statistics'], analyzer.group_statistics)
+        self.assertEqual(list(results['statistics']), list(analyzer.groups))
+        for group, stats in results['statistics'].items():
+            group_df = analyzer.processed_data[analyzer.processed_data['Group'] == group]
+            self.assertEqual(stats['count'], len(group_df))
+            self.assertAlmostEqual(stats['avg_score'], group_df['Total'].mean())
+            self.assertAlmostEqual(stats['std_score'], group_df['Total'].std())
+            self.assertEqual(stats['min_score'], group_df['Total'].min())
+            self.assertEqual(stats['max_score'], group_df['Total'].max())
+            self.assertAlmostEqual(stats['features']['CT_Avg']['mean'], group_df['CT_Avg'].mean())
+            self.assertEqual([student['total'] for student in stats['students']],
+                             group_df['Total'].nlargest(10).tolist())
+            top = group_df.loc[group_df['Total'].nlargest(10).index]
+            self.assertEqual([student['id'] for student in stats['students']], top['StudentID'].tolist())
+            self.assertEqual(set(stats['students'][0]), {'id', 'name', 'total'})
+        with open(results['report_file']) as f:
+            self.assertEqual(f.read().count("Top 5 Students in this Group"), len(analyzer.groups))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+import sys
+import os
+import json
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.services.grading import GradeScale, LETTER_GRADE_SCALE, CATEGORY_SCALE, load_grading_config
+from src.services.result_analyzer import ResultAnalyzer
+
+
+def legacy_grade(percentage):
+    """The if/elif chain the letter scale replaced"""
+    for low, grade in [(80, 'A+'), (75, 'A'), (70, 'A-'), (65, 'B+'), (60, 'B'),
+                       (55, 'B-'), (50, 'C+'), (45, 'C'), (40, 'D')]:
+        if percentage >= low:
+            return grade
+    return 'F'
+
+
+def legacy_category(percentage):
+    """The if/elif chain the category scale replaced"""
+    for low, category in [(80, 'Excellent'), (65, 'Good'), (50, 'Average'), (40, 'Below Average')]:
+        if percentage >= low:
+            return category
+    return 'Poor'
+
+
+class TestGrading(unittest.TestCase):
+    """Test cases for threshold-table grade scales"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.percentages = pd.Series([100, 80, 79.99, 75, 64.5, 50, 45, 40, 39.99, 0, -5, np.nan])
+
+    def test_letter_scale_matches_legacy(self):
+        """Letter grades match the old per-value function, boundaries included"""
+        grades = LETTER_GRADE_SCALE.apply(self.percentages)
+        self.assertEqual(list(grades), [legacy_grade(p) for p in self.percentages])
+
+    def test_category_scale_matches_legacy(self):
+        """Categories match the old per-value function, boundaries included"""
+        categories = CATEGORY_SCALE.apply(self.percentages)
+        self.assertEqual(list(categories), [legacy_category(p) for p in self.percentages])
+
+    def test_output_is_ordered_categorical(self):
+        """Grades come back as an ordered categorical with one-byte codes"""
+        grades = LETTER_GRADE_SCALE.apply(self.percentages)
+        self.assertIsInstance(grades.dtype, pd.CategoricalDtype)
+        self.assertTrue(grades.cat.ordered)
+        self.assertEqual(grades.cat.codes.dtype, np.int8)
+        self.assertTrue(grades.index.equals(self.percentages.index))
+
+    def test_custom_scale_from_config(self):
+        """Custom scales load from a JSON config and round-trip"""
+        config = {'grade_scale': {'name': 'pass-fail', 'bands': [{'min': 50, 'label': 'Pass'}], 'fallback': 'Fail'}}
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            json.dump(config, f)
+        try:
+            grade_scale, category_scale = load_grading_config(f.name)
+        finally:
+            os.unlink(f.name)
+
+        self.assertEqual(list(grade_scale.apply(pd.Series([49.9, 50]))), ['Fail', 'Pass'])
+        self.assertEqual(category_scale, CATEGORY_SCALE)
+        self.assertEqual(GradeScale.from_dict(grade_scale.to_dict()), grade_scale)
+
+    def test_duplicate_thresholds_rejected(self):
+        """Ambiguous scales are rejected"""
+        with self.assertRaises(ValueError):
+            GradeScale('bad', [(50, 'Pass'), (50, 'Also Pass')], 'Fail')
+
+    def test_report_omits_empty_grades(self):
+        """Report distributions only list grades that occur"""
+        analyzer = ResultAnalyzer(os.path.join(os.path.dirname(__file__), '..', 'data', 'result.csv'))
+        self.assertTrue(analyzer.load_data())
+        analyzer.categorize_students()
+        report = analyzer.generate_detailed_report()
+        self.assertTrue(all(count > 0 for count in report['grade_distribution'].values()))
+        self.assertEqual(sum(report['grade_distribution'].values()), report['total_students'])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.services.result_analyzer import ResultAnalyzer
+from src.services.streaming_stats import RunningStats
+
+
+class TestIncrementalReport(unittest.TestCase):
+    """Test cases for updating marks without a full recompute"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.dataset_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'result.csv')
+        self.analyzer = ResultAnalyzer(self.dataset_path)
+        self.analyzer.load_data()
+        self.analyzer.categorize_students()
+        self.analyzer.generate_detailed_report()
+
+    def full_report(self, data, compact=False):
+        reference = ResultAnalyzer(self.dataset_path, compact=compact)
+        reference.data = data.copy()
+        reference.categorize_students()
+        return reference.generate_detailed_report()
+
+    def assertReportsEqual(self, report, expected):
+        self.assertEqual(list(report.keys()), list(expected.keys()))
+        for key in ['total_students', 'average_percentage', 'highest_percentage',
+                    'lowest_percentage', 'median_percentage']:
+            self.assertAlmostEqual(report[key], expected[key], places=4)
+        self.assertEqual(list(report['category_distribution'].items()), list(expected['category_distribution'].items()))
+        self.assertEqual(list(report['grade_distribution'].items()), list(expected['grade_distribution'].items()))
+        self.assertEqual([s['Student Name'] for s in report['top_performers']],
+                         [s['Student Name'] for s in expected['top_performers']])
+        self.assertEqual([s['Student Name'] for s in report['students_needing_attention']],
+                         [s['Student Name'] for s in expected['students_needing_attention']])
+        for label, stats in expected['exam_analysis'].items():
+            for name, value in stats.items():
+                self.assertAlmostEqual(report['exam_analysis'][label][name], value, places=4)
+
+    def test_single_edit_matches_full_recompute(self):
+        """Correcting one CT mark gives the same report as rerunning everything"""
+        student = self.analyzer.processed_data['StudentID'].iloc[10]
+        report = self.analyzer.update_marks({student: {'CT3': 10}})
+        self.assertEqual(self.analyzer.data['CT3'].iloc[10], 10)
+        self.assertReportsEqual(report, self.full_report(self.analyzer.data))
+        self.assertIs(self.analyzer.generate_detailed_report(), report)
+
+    def test_repeated_student_is_applied_once(self):
+        """A student listed twice gets the later marks and is counted once"""
+        student = self.analyzer.processed_data['StudentID'].iloc[10]
+        changes = pd.DataFrame({'StudentID': [student, student], 'Mid-Term': [10, 12], 'CT1': [5, np.nan]})
+        report = self.analyzer.update_marks(changes)
+        self.assertEqual(self.analyzer.data['Mid-Term'].iloc[10], 12)
+        self.assertEqual(self.analyzer.data['CT1'].iloc[10], 5)
+        self.assertReportsEqual(report, self.full_report(self.analyzer.data))
+
+    def test_demoting_top_performers(self):
+        """Top performers whose marks drop are replaced from the rest of the cohort"""
+        for _ in range(3):
+            top = self.analyzer.processed_data.nlargest(5, 'Percentage')['StudentID']
+            changes = pd.DataFrame({'StudentID': top.to_numpy(), 'Mid-Term': 0, 'CT1': 0, 'CT2': 0, 'CT3': 0})
+            report = self.analyzer.update_marks(changes)
+            self.assertReportsEqual(report, self.full_report(self.analyzer.data))
+
+    def test_compact_frame_updates(self):
+        """Edits on the compact schema keep the compact dtypes"""
+        analyzer = ResultAnalyzer(self.dataset_path, compact=True)
+        analyzer.load_data()
+        analyzer.categorize_students()
+        students = analyzer.processed_data['StudentID'].iloc[[0, 40, 80]]
+        report = analyzer.update_marks({int(s): {'Mid-Term': 40, 'Attendance': 10} for s in students})
+        self.assertEqual(analyzer.processed_data['Percentage'].dtype, np.float32)
+        self.assertReportsEqual(report, self.full_report(analyzer.data, compact=True))
+
+    def test_bad_updates_are_rejected(self):
+        """Unknown students and non-mark columns raise before anything changes"""
+        before = self.analyzer.processed_data.copy()
+        with self.assertRaises(KeyError):
+            self.analyzer.update_marks({1: {'CT1': 5}})
+        student = self.analyzer.processed_data['StudentID'].iloc[0]
+        with self.assertRaises(ValueError):
+            self.analyzer.update_marks({student: {'Percentage': 100}})
+        pd.testing.assert_frame_equal(self.analyzer.processed_data, before)
+
+    def test_running_stats_remove(self):
+        """Removing a chunk restores the statistics of the rest"""
+        rng = np.random.default_rng(3)
+        values = rng.normal(60, 10, size=(500, 2))
+        stats = RunningStats(2)
+        stats.update(values)
+        stats.remove(values[100:150])
+        rest = np.delete(values, np.s_[100:150], axis=0)
+        np.testing.assert_allclose(stats.averages(), rest.mean(axis=0))
+        np.testing.assert_allclose(stats.variance(), rest.var(axis=0, ddof=1))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import sys
+import os
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.services import ingest_cache
+from src.services.ingest_cache import read_table, sidecar_key
+
+
+class TestIngestCache(unittest.TestCase):
+    """Test cases for the columnar sidecar ingestion cache"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_dir = os.path.join(self.temp_dir, 'cache')
+        self.csv_path = os.path.join(self.temp_dir, 'result.csv')
+        shutil.copy(os.path.join(os.path.dirname(__file__), '..', 'data', 'result.csv'), self.csv_path)
+        self.parse_calls = 0
+        self._parse_file = ingest_cache.parse_file
+
+        def counting_parse(path):
+            self.parse_calls += 1
+            return self._parse_file(path)
+        ingest_cache.parse_file = counting_parse
+
+    def tearDown(self):
+        """Clean up after each test method"""
+        ingest_cache.parse_file = self._parse_file
+        shutil.rmtree(self.temp_dir)
+
+    def test_csv_round_trip(self):
+        """Sidecar loads are identical to a fresh parse and skip parsing"""
+        first = read_table(self.csv_path, cache_dir=self.cache_dir)
+        second = read_table(self.csv_path, cache_dir=self.cache_dir)
+        self.assertEqual(self.parse_calls, 1)
+        pd.testing.assert_frame_equal(second, pd.read_csv(self.csv_path))
+        pd.testing.assert_frame_equal(first, second)
+
+    def test_excel_round_trip_with_missing_values(self):
+        """Strings with blanks, floats, ints, bools and dates survive the sidecar"""
+        frame = pd.DataFrame({
+            'Student Name': ['A', None, 'C'],
+            'CT1': [1.5, np.nan, 3.0],
+            'StudentID': [2252421061, 2252421062, 2252421063],
+            'Passed': [True, False, True],
+            'Date': pd.to_datetime(['2025-01-01', '2025-02-01', '2025-03-01']),
+        })
+        xlsx_path = os.path.join(self.temp_dir, 'result.xlsx')
+        frame.to_excel(xlsx_path, index=False)
+
+        parsed = read_table(xlsx_path, cache_dir=self.cache_dir)
+        cached = read_table(xlsx_path, cache_dir=self.cache_dir)
+        self.assertEqual(self.parse_calls, 1)
+        pd.testing.assert_frame_equal(cached, parsed)
+
+    def test_changed_file_is_reparsed(self):
+        """A new mtime or size gives a new sidecar"""
+        key = sidecar_key(self.csv_path)
+        read_table(self.csv_path, cache_dir=self.cache_dir)
+        with open(self.csv_path, 'a') as f:
+            f.write("82,1,NEW STUDENT,1,1,1,1,1,1,1\n")
+        self.assertNotEqual(sidecar_key(self.csv_path), key)
+        self.assertEqual(len(read_table(self.csv_path, cache_dir=self.cache_dir)), 82)
+        self.assertEqual(self.parse_calls, 2)
+
+    def test_mixed_columns_are_not_cached(self):
+        """Columns that cannot be stored faithfully bypass the cache"""
+        mixed_path = os.path.join(self.temp_dir, 'mixed.xlsx')
+        pd.DataFrame({'value': [1, 'two', 3.5]}).to_excel(mixed_path, index=False)
+        read_table(mixed_path, cache_dir=self.cache_dir)
+        read_table(mixed_path, cache_dir=self.cache_dir)
+        self.assertEqual(self.parse_calls, 2)
+
+    def test_eviction_keeps_cache_within_budget(self):
+        """Least recently used sidecars are evicted past the size budget"""
+        paths = []
+        for i in range(3):
+            path = os.path.join(self.temp_dir, f"course{i}.csv")
+            shutil.copy(self.csv_path, path)
+            paths.append(path)
+            read_table(path, cache_dir=self.cache_dir, max_bytes=1)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertTrue(os.path.isdir(os.path.join(self.cache_dir, sidecar_key(paths[-1]))))
+
+if __name__ == "__main__":
+    unittest.main()
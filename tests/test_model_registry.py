@@ -0,0 +1,99 @@
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+from unittest import mock
+import numpy as np
+import pandas as pd
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.models.scholarship_model import ScholarshipModel
+from src.services.model_registry import ModelRegistry, training_key
+
+
+class TestModelRegistry(unittest.TestCase):
+    """Test cases for the trained-model registry"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.registry_dir = os.path.join(self.temp_dir, 'models')
+        rng = np.random.default_rng(0)
+        self.data_file = os.path.join(self.temp_dir, 'students.csv')
+        frame = pd.DataFrame({'grade': rng.integers(40, 100, 200), 'attendance': rng.integers(50, 100, 200),
+                              'extracurricular': rng.integers(0, 2, 200)})
+        frame['eligible'] = ((frame['grade'] > 80) & (frame['attendance'] > 75)).astype(int)
+        frame.to_csv(self.data_file, index=False)
+        self.features = ['grade', 'attendance', 'extracurricular']
+
+    def tearDown(self):
+        """Clean up after each test method"""
+        shutil.rmtree(self.temp_dir)
+
+    def make_model(self):
+        model = ScholarshipModel(registry=ModelRegistry(self.registry_dir))
+        model.load_data(self.data_file)
+        return model
+
+    def test_training_is_a_lookup_when_nothing_changed(self):
+        """Unchanged data, features and settings reuse the registered fit"""
+        first = self.make_model()
+        self.assertFalse(first.train_model(self.features, 'eligible'))
+        second = self.make_model()
+        with mock.patch.object(second.model, 'fit') as fit:
+            self.assertTrue(second.train_model(self.features, 'eligible'))
+        fit.assert_not_called()
+        self.assertEqual(second.model_key, first.model_key)
+        self.assertTrue((second.score_batch(first.data[self.features])['prediction'] ==
+                         first.model.predict(first.data[self.features])).all())
+
+        info = ModelRegistry(self.registry_dir).metadata(first.model_key)
+        self.assertEqual(info['features'], self.features)
+        self.assertEqual(info['estimator'], 'DecisionTreeClassifier')
+        self.assertIn('sklearn_version', info)
+
+        # Other features or edited data are different fits
+        self.assertFalse(self.make_model().train_model(['grade', 'attendance'], 'eligible'))
+        edited = self.make_model()
+        edited.data.loc[0, 'grade'] += 1
+        self.assertFalse(edited.load_registered(self.features, 'eligible'))
+        self.assertFalse(edited.train_model(self.features, 'eligible'))
+        self.assertEqual(len(ModelRegistry(self.registry_dir).entries), 3)
+
+    def test_key_covers_estimator_settings(self):
+        """Estimator parameters are part of the key"""
+        from sklearn.tree import DecisionTreeClassifier
+        model = self.make_model()
+        X, y = model.data[self.features], model.data['eligible']
+        shallow, _ = training_key(DecisionTreeClassifier(max_depth=2), X, y, self.features)
+        deep, _ = training_key(DecisionTreeClassifier(max_depth=5), X, y, self.features)
+        self.assertNotEqual(shallow, deep)
+        self.assertEqual(shallow, training_key(DecisionTreeClassifier(max_depth=2), X, y, self.features)[0])
+
+    def test_save_and_load_with_metadata(self):
+        """save_model records the training metadata and load_model checks the library version"""
+        model = self.make_model()
+        model.train_model(self.features, 'eligible')
+        path = os.path.join(self.temp_dir, 'model.joblib')
+        model.save_model(path)
+
+        loaded = ScholarshipModel()
+        loaded.load_model(path)
+        self.assertEqual(loaded.model_key, model.model_key)
+        self.assertEqual(loaded.model_info['data_hash'], model.model_info['data_hash'])
+
+        with open(path + '.json') as f:
+            info = json.load(f)
+        info['sklearn_version'] = '0.0'
+        with open(path + '.json', 'w') as f:
+            json.dump(info, f)
+        with self.assertRaises(ValueError):
+            ScholarshipModel().load_model(path)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+import sys
+import os
+import json
+import shutil
+import tempfile
+import tracemalloc
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.services.cluster_analyzer import ClusterAnalyzer
+from src.services.result_analyzer import ResultAnalyzer
+from src.utils.profiling import StageProfiler
+
+
+class TestProfiling(unittest.TestCase):
+    """Test cases for per-stage timing and memory instrumentation"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.dataset_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'result.csv')
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Clean up after each test method"""
+        shutil.rmtree(self.temp_dir)
+
+    def test_nested_stages_and_peak_memory(self):
+        """Nested stages record their parent and an allocation shows in both peaks"""
+        profiler = StageProfiler()
+        with profiler.stage('outer'):
+            with profiler.stage('inner'):
+                block = bytearray(8 * 2**20)
+                del block
+        inner, outer = profiler.stages[1], profiler.stages[0]
+        self.assertEqual(inner['parent'], 'outer')
+        self.assertGreaterEqual(inner['peak_bytes'], 8 * 2**20)
+        self.assertGreaterEqual(outer['peak_bytes'], inner['peak_bytes'])
+        self.assertFalse(tracemalloc.is_tracing())
+
+        path = profiler.save_json(os.path.join(self.temp_dir, 'profile.json'))
+        with open(path) as f:
+            self.assertEqual([stage['name'] for stage in json.load(f)['stages']], ['outer', 'inner'])
+
+    def test_result_analyzer_stages(self):
+        """Every pipeline step and each chart is a stage"""
+        profiler = StageProfiler(track_memory=False)
+        analyzer = ResultAnalyzer(self.dataset_path, output_dir=self.temp_dir, profiler=profiler)
+        analyzer.load_data()
+        analyzer.categorize_students()
+        analyzer.generate_graphs(dpi=50, use_cache=False)
+        names = [stage['name'] for stage in profiler.stages]
+        for name in ['load', 'categorize', 'preprocess', 'score', 'report', 'charts', 'chart:grade_distribution']:
+            self.assertIn(name, names)
+        self.assertIsNone(profiler.stages[0]['peak_bytes'])
+        self.assertIn('total', profiler.summary())
+
+    def test_cluster_analyzer_stages(self):
+        """run_full_analysis returns the profile with scaling, KMeans and PCA stages"""
+        analyzer = ClusterAnalyzer(self.dataset_path, output_dir=self.temp_dir, profiler=StageProfiler())
+        results = analyzer.run_full_analysis()
+        names = [stage['name'] for stage in results['profile']['stages']]
+        for name in ['load', 'clustering', 'scale', 'kmeans', 'plot', 'pca', 'save', 'report']:
+            self.assertIn(name, names)
+
+if __name__ == "__main__":
+    unittest.main()
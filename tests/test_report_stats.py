@@ -0,0 +1,89 @@
+import unittest
+import sys
+import os
+import json
+import numpy as np
+import pandas as pd
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.services.report_stats import AnalysisReport, build_report, top_k_indices
+from src.services.result_analyzer import ResultAnalyzer
+
+
+def legacy_report(data):
+    """Per-column pandas report the statistics kernel replaced"""
+    report = {
+        'total_students': len(data),
+        'average_percentage': data['Percentage'].mean(),
+        'highest_percentage': data['Percentage'].max(),
+        'lowest_percentage': data['Percentage'].min(),
+        'median_percentage': data['Percentage'].median(),
+        'category_distribution': {k: v for k, v in data['Category'].value_counts().items() if v > 0},
+        'grade_distribution': {k: v for k, v in data['Grade'].value_counts().items() if v > 0},
+        'top_performers': data.nlargest(5, 'Percentage')[['Student Name', 'Percentage', 'Grade']].to_dict('records'),
+        'students_needing_attention': data.nsmallest(5, 'Percentage')[['Student Name', 'Percentage', 'Grade']].to_dict('records'),
+    }
+    exam_analysis = {}
+    for label, column in [('CT1', 'CT1'), ('CT2', 'CT2'), ('CT3', 'CT3'), ('CT4', 'CT4'),
+                          ('Best_3_CT_Avg', 'Best_3_CT_Avg'), ('Mid-Term_Original', 'Mid-Term'),
+                          ('Mid-Term', 'Midterm_Scaled'), ('Presentation', 'Presentation'),
+                          ('Attendance', 'Attendance')]:
+        exam_analysis[label] = {
+            'average': data[column].mean(),
+            'highest': data[column].max(),
+            'lowest': data[column].min(),
+            'students_with_zero': (data[column] == 0).sum()
+        }
+    report['exam_analysis'] = exam_analysis
+    return report
+
+
+class TestReportStats(unittest.TestCase):
+    """Test cases for the single-pass report statistics kernel"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        dataset_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'result.csv')
+        self.analyzer = ResultAnalyzer(dataset_path)
+        self.analyzer.load_data()
+        self.data = self.analyzer.categorize_students()
+
+    def test_report_matches_legacy(self):
+        """Kernel output equals the old per-column computation"""
+        report = build_report(self.data)
+        expected = legacy_report(self.data)
+
+        self.assertEqual(list(report.keys()), list(expected.keys()))
+        for key in ['total_students', 'average_percentage', 'highest_percentage',
+                    'lowest_percentage', 'median_percentage']:
+            self.assertAlmostEqual(report[key], expected[key])
+        self.assertEqual(list(report['category_distribution'].items()), list(expected['category_distribution'].items()))
+        self.assertEqual(report['grade_distribution'], expected['grade_distribution'])
+        self.assertEqual(report['top_performers'], expected['top_performers'])
+        self.assertEqual(report['students_needing_attention'], expected['students_needing_attention'])
+
+        self.assertEqual(list(report['exam_analysis']), list(expected['exam_analysis']))
+        for label, stats in expected['exam_analysis'].items():
+            for name, value in stats.items():
+                self.assertAlmostEqual(report['exam_analysis'][label][name], value)
+
+    def test_top_k_matches_nlargest_ties(self):
+        """Partial selection breaks ties by position like nlargest/nsmallest"""
+        values = pd.Series([5, 9, 9, 1, 9, np.nan, 1, 7, 1])
+        self.assertEqual(list(top_k_indices(values, 3)), list(values.nlargest(3).index))
+        self.assertEqual(list(top_k_indices(values, 2, largest=False)), list(values.nsmallest(2).index))
+        self.assertEqual(len(top_k_indices(values, 20)), 8)
+
+    def test_report_object(self):
+        """The report is typed but still a dict, and serializes to JSON"""
+        report = self.analyzer.generate_detailed_report()
+        self.assertIsInstance(report, AnalysisReport)
+        self.assertIsInstance(report, dict)
+        self.assertEqual(report.total_students, report['total_students'])
+        json.dumps(report.to_dict())
+
+if __name__ == "__main__":
+    unittest.main()
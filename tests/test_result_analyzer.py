@@ -55,6 +55,18 @@ class TestResultAnalyzer(unittest.TestCase):
             self.assertIsInstance(report, dict, "Report should be a dictionary")
             self.assertIn('total_students', report, "Report should contain total_students")
 
+    def test_legacy_report_counts_observed_categories(self):
+        """Test the legacy category counts keep the old rows and order"""
+        if self.analyzer.load_data():
+            self.analyzer.preprocess_data()
+            self.analyzer.calculate_total_and_percentage()
+            self.analyzer.categorize_students()
+            report = self.analyzer.generate_report()
+            categories = self.analyzer.processed_data['Category'].astype(str)
+            self.assertEqual(report['Category'].tolist(), sorted(categories.unique()))
+            self.assertTrue((report['Count'] > 0).all(), "Unobserved categories should not be listed")
+            self.assertEqual(report['Count'].sum(), len(categories))
+
 def run_comprehensive_test():
     """Run comprehensive test with detailed output"""
     print("="*80)
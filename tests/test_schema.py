@@ -0,0 +1,73 @@
+import unittest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.services.cluster_analyzer import ClusterAnalyzer
+from src.services.result_analyzer import ResultAnalyzer
+from src.services.schema import compact_frame, memory_usage
+
+
+class TestSchema(unittest.TestCase):
+    """Test cases for the compact result-frame schema"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.dataset_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'result.csv')
+
+    def test_compact_dtypes(self):
+        """Marks become float32, IDs fixed-width ints and labels categoricals"""
+        frame = compact_frame(pd.DataFrame({
+            'Sl. No': [1, 2, 3],
+            'StudentID': ['2252421061', '2252421086', '2252421109'],
+            'Student Name': ['A', 'B', 'A'],
+            'CT1': [4, 5.5, np.nan],
+            'Notes': ['x', 'y', 'z'],
+        }))
+        self.assertEqual(frame['Sl. No'].dtype, np.uint8)
+        self.assertEqual(frame['StudentID'].dtype, np.uint32)
+        self.assertIsInstance(frame['Student Name'].dtype, pd.CategoricalDtype)
+        self.assertEqual(frame['CT1'].dtype, np.float32)
+        self.assertEqual(frame['Notes'].dtype, object)
+
+    def test_memory_shrinks_on_large_cohort(self):
+        """A realistic cohort needs several times less memory"""
+        base = pd.read_csv(self.dataset_path)
+        cohort = pd.concat([base] * 50, ignore_index=True)
+        before = memory_usage(cohort)
+        after = memory_usage(compact_frame(cohort.copy()))
+        self.assertLess(after * 3, before)
+
+    def test_result_analyzer_on_compact_frame(self):
+        """Reports from the compact frame match the full-width ones"""
+        full = ResultAnalyzer(self.dataset_path)
+        full.load_data()
+        full.categorize_students()
+        compact = ResultAnalyzer(self.dataset_path, compact=True)
+        compact.load_data()
+        compact.categorize_students()
+
+        self.assertEqual(compact.processed_data['Percentage'].dtype, np.float32)
+        self.assertIn('after_bytes', compact.memory_report)
+        expected, report = full.generate_detailed_report(), compact.generate_detailed_report()
+        self.assertAlmostEqual(report['average_percentage'], expected['average_percentage'], places=3)
+        self.assertEqual(report['grade_distribution'], expected['grade_distribution'])
+        self.assertEqual([s['Student Name'] for s in report['top_performers']],
+                         [s['Student Name'] for s in expected['top_performers']])
+
+    def test_cluster_analyzer_on_compact_frame(self):
+        """Clustering the compact frame gives the same groups"""
+        full = ClusterAnalyzer(self.dataset_path)
+        compact = ClusterAnalyzer(self.dataset_path, compact=True)
+        for analyzer in (full, compact):
+            self.assertTrue(analyzer.load_data())
+            self.assertTrue(analyzer.perform_clustering())
+        self.assertEqual(list(compact.processed_data['Group']), list(full.processed_data['Group']))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -45,5 +45,22 @@ class TestScholarshipService(unittest.TestCase):
         recommendation = self.service.recommend_scholarship([90, 95, 1])
         self.assertIsInstance(recommendation, (list, tuple))
 
+    def test_batch_scoring(self):
+        """Batch scoring matches per-student predictions, in one frame or in chunks"""
+        features = self.sample_data[['grade', 'attendance', 'extracurricular']]
+        self.service.train_model(features, self.sample_data['scholarship_eligible'])
+
+        scored = self.service.score_batch(features)
+        self.assertEqual(list(scored.columns), ['prediction', 'probability_0', 'probability_1'])
+        self.assertEqual(list(scored['prediction']), list(self.model.predict(features)))
+        self.assertTrue((scored[['probability_0', 'probability_1']].sum(axis=1) == 1).all())
+
+        # Columns are matched by name, and chunked input gives the same result
+        shuffled = features[['extracurricular', 'grade', 'attendance']]
+        pd.testing.assert_frame_equal(self.service.score_batch(shuffled, chunksize=2), scored)
+        pd.testing.assert_frame_equal(self.service.score_batch([features.iloc[:2], features.iloc[2:]]), scored)
+        self.assertEqual(list(self.service.score_batch(features.to_numpy(), chunksize=3)['prediction']),
+                         list(scored['prediction']))
+
 if __name__ == "__main__":
     unittest.main()
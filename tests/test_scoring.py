@@ -0,0 +1,76 @@
+import unittest
+import sys
+import os
+import numpy as np
+import pandas as pd
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.services.scoring import best_ct_average, compute_scores
+from src.services.result_analyzer import ResultAnalyzer
+
+
+def legacy_best_3_ct(frame, ct_columns=('CT1', 'CT2', 'CT3', 'CT4')):
+    """Row-by-row reference implementation the scoring module replaced"""
+    ct_scores = []
+    for _, row in frame.iterrows():
+        scores = [row[col] for col in ct_columns if col in frame.columns and pd.notna(row[col])]
+        scores.sort(reverse=True)
+        best_3_avg = sum(scores[:3]) / 3 if len(scores) >= 3 else (sum(scores) / len(scores) if scores else 0)
+        ct_scores.append(best_3_avg)
+    return np.array(ct_scores, dtype=float)
+
+
+class TestScoring(unittest.TestCase):
+    """Test cases for the vectorized scoring module"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.dataset_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'result.csv')
+
+    def test_best_ct_matches_legacy_on_dataset(self):
+        """Best-3 CT average matches the old loop on the bundled results"""
+        frame = pd.read_csv(self.dataset_path)
+        np.testing.assert_allclose(best_ct_average(frame), legacy_best_3_ct(frame))
+
+    def test_best_ct_handles_missing_marks(self):
+        """NaN marks are skipped and rows with no marks score 0"""
+        frame = pd.DataFrame({
+            'CT1': [10, np.nan, np.nan, 4, 7],
+            'CT2': [8, 6, np.nan, np.nan, 7],
+            'CT3': [9, np.nan, np.nan, 2, 7],
+            'CT4': [2, 9, np.nan, np.nan, 7],
+        })
+        np.testing.assert_allclose(best_ct_average(frame), legacy_best_3_ct(frame))
+        np.testing.assert_allclose(best_ct_average(frame), [9, 7.5, 0, 3, 7])
+
+    def test_best_ct_with_missing_columns(self):
+        """Only the CT columns present in the frame are used"""
+        frame = pd.DataFrame({'CT1': [6, 3], 'CT3': [4, np.nan]})
+        np.testing.assert_allclose(best_ct_average(frame), legacy_best_3_ct(frame))
+        np.testing.assert_allclose(best_ct_average(pd.DataFrame({'Other': [1]})), [0])
+
+    def test_analyzer_scores_match_legacy(self):
+        """ResultAnalyzer totals match the legacy arithmetic"""
+        analyzer = ResultAnalyzer(self.dataset_path)
+        self.assertTrue(analyzer.load_data())
+        analyzer.preprocess_data()
+        result = analyzer.calculate_total_and_percentage()
+
+        expected_ct = legacy_best_3_ct(result)
+        expected_total = result['Mid-Term'] / 2 + expected_ct + result['Presentation'] + result['Attendance']
+        np.testing.assert_allclose(result['Best_3_CT_Avg'], expected_ct)
+        np.testing.assert_allclose(result['Total_Obtained'], expected_total)
+        np.testing.assert_allclose(result['Percentage'], expected_total / 50 * 100)
+
+    def test_compute_scores_defaults(self):
+        """Missing Presentation and Attendance columns get their defaults"""
+        frame = compute_scores(pd.DataFrame({'Mid-Term': [40.0], 'CT1': [10.0], 'CT2': [10.0], 'CT3': [10.0]}))
+        self.assertEqual(frame['Presentation'].iloc[0], 0)
+        self.assertEqual(frame['Attendance'].iloc[0], 8)
+        self.assertAlmostEqual(frame['Total_Obtained'].iloc[0], 38)
+
+if __name__ == "__main__":
+    unittest.main()
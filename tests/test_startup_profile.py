@@ -0,0 +1,36 @@
+import unittest
+import sys
+import os
+import importlib.util
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.utils.startup_profile import import_times, loaded_heavy_modules, package_totals
+
+
+class TestStartupProfile(unittest.TestCase):
+    """Test cases for the cold-start import budget"""
+
+    def test_import_times(self):
+        """The import table lists the module and sums per package"""
+        rows = import_times('src.services.batch_runner')
+        self.assertIn('src.services.batch_runner', [row['name'] for row in rows])
+        totals = package_totals(rows)
+        self.assertIn('src', totals)
+        self.assertEqual(list(totals.values()), sorted(totals.values(), reverse=True))
+
+    def test_services_defer_heavy_imports(self):
+        """Plotting and the analysis stack load only when needed"""
+        self.assertEqual(loaded_heavy_modules('src.services.batch_runner'), [])
+        self.assertNotIn('matplotlib', loaded_heavy_modules('src.services.result_analyzer'))
+
+    @unittest.skipIf(importlib.util.find_spec('customtkinter') is None, "customtkinter is not installed")
+    def test_gui_defers_heavy_imports(self):
+        """Opening the teachers menu does not import pandas, matplotlib or sklearn"""
+        self.assertEqual(loaded_heavy_modules('src.gui.teachers_menu'), [])
+        self.assertEqual(loaded_heavy_modules('src.gui.login'), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import sys
+import os
+import numpy as np
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.services.result_analyzer import ResultAnalyzer
+from src.services.streaming_stats import BoundedTopK, RunningStats, ValueCounter
+
+
+class TestStreamingStats(unittest.TestCase):
+    """Test cases for chunked streaming statistics"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.dataset_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'result.csv')
+
+    def assertReportsEqual(self, streamed, expected):
+        self.assertEqual(list(streamed.keys()), list(expected.keys()))
+        for key in ['total_students', 'average_percentage', 'highest_percentage',
+                    'lowest_percentage', 'median_percentage']:
+            self.assertAlmostEqual(streamed[key], expected[key])
+        self.assertEqual(list(streamed['category_distribution'].items()), list(expected['category_distribution'].items()))
+        self.assertEqual(list(streamed['grade_distribution'].items()), list(expected['grade_distribution'].items()))
+        self.assertEqual(streamed['top_performers'], expected['top_performers'])
+        self.assertEqual(streamed['students_needing_attention'], expected['students_needing_attention'])
+        self.assertEqual(list(streamed['exam_analysis']), list(expected['exam_analysis']))
+        for label, stats in expected['exam_analysis'].items():
+            for name, value in stats.items():
+                self.assertAlmostEqual(streamed['exam_analysis'][label][name], value)
+
+    def test_streaming_report_matches_in_memory(self):
+        """Streaming in small chunks gives the in-memory report"""
+        analyzer = ResultAnalyzer(self.dataset_path)
+        analyzer.load_data()
+        analyzer.categorize_students()
+        expected = analyzer.generate_detailed_report()
+
+        for chunksize in [7, 40, 1000]:
+            streamed = ResultAnalyzer(self.dataset_path).generate_streaming_report(chunksize=chunksize)
+            self.assertReportsEqual(streamed, expected)
+
+    def test_running_stats_match_numpy(self):
+        """Merged chunk statistics equal whole-array statistics, NaN skipped"""
+        rng = np.random.default_rng(7)
+        values = rng.normal(50, 12, size=(1000, 3))
+        values[rng.random(values.shape) < 0.05] = np.nan
+        values[:10, 0] = 0
+
+        stats = RunningStats(3)
+        for chunk in np.array_split(values, 13):
+            stats.update(chunk)
+
+        np.testing.assert_allclose(stats.averages(), np.nanmean(values, axis=0))
+        np.testing.assert_allclose(stats.variance(), np.nanvar(values, axis=0, ddof=1))
+        np.testing.assert_allclose(stats.extremes()[0], np.nanmin(values, axis=0))
+        np.testing.assert_allclose(stats.extremes()[1], np.nanmax(values, axis=0))
+        self.assertEqual(stats.zeros[0], 10)
+
+    def test_value_counter_median(self):
+        """Frequency-table median matches np.median for odd and even counts"""
+        for values in [[3, 1, 2], [4, 1, 3, 2], [5, 5, 5, 1], [7.5]]:
+            counter = ValueCounter()
+            counter.update(values)
+            self.assertEqual(counter.median(), np.median(values))
+
+    def test_bounded_top_k_keeps_first_ties(self):
+        """Equal values keep the earliest rows"""
+        top = BoundedTopK(2)
+        for position, value in enumerate([5, 9, 9, 9, 1]):
+            top.push(value, position, position)
+        self.assertEqual(top.items(), [1, 2])
+
+    def test_excel_is_rejected(self):
+        """Streaming mode only accepts CSV input"""
+        self.assertIsNone(ResultAnalyzer('results.xlsx').generate_streaming_report())
+
+if __name__ == "__main__":
+    unittest.main()
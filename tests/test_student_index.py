@@ -0,0 +1,100 @@
+import unittest
+import sys
+import os
+import io
+import shutil
+import tempfile
+import contextlib
+import numpy as np
+
+# Add the project root directory to the Python path
+project_root = os.path.join(os.path.dirname(__file__), '..')
+sys.path.insert(0, project_root)
+
+from src.services.cluster_analyzer import ClusterAnalyzer
+from src.services.student_index import StudentIndex
+
+
+class TestStudentIndex(unittest.TestCase):
+    """Test cases for the similar-student index"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method"""
+        self.dataset_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'result.csv')
+        self.temp_dir = tempfile.mkdtemp()
+        self.analyzer = ClusterAnalyzer(self.dataset_path, output_dir=self.temp_dir)
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.analyzer.load_data()
+            self.analyzer.perform_clustering()
+            self.index = self.analyzer.build_student_index()
+        self.ids = self.analyzer.processed_data['StudentID'].tolist()
+        self.features = list(self.analyzer.exam_columns())
+
+    def tearDown(self):
+        """Clean up after each test method"""
+        shutil.rmtree(self.temp_dir)
+
+    def brute_force(self, point, exclude=None):
+        distances = np.sqrt(((self.analyzer.X_scaled - point) ** 2).sum(axis=1))
+        return sorted(distance for student_id, distance in zip(self.ids, distances) if student_id != exclude)
+
+    def test_query_matches_brute_force(self):
+        """Neighbours of a student or a mark vector are the true nearest ones"""
+        student_id = self.ids[10]
+        neighbours = self.index.query(student_id=student_id, k=5)
+        self.assertNotIn(student_id, [neighbour['id'] for neighbour in neighbours])
+        expected = self.brute_force(self.analyzer.X_scaled[10], exclude=student_id)[:5]
+        self.assertTrue(np.allclose([neighbour['distance'] for neighbour in neighbours], expected))
+
+        marks = self.analyzer.processed_data.iloc[10][self.features].to_dict()
+        by_marks = self.index.query(marks=marks, k=1)
+        self.assertAlmostEqual(by_marks[0]['distance'], 0.0)
+        with self.assertRaises(KeyError):
+            self.index.query(student_id=-1)
+        with self.assertRaises(ValueError):
+            self.index.query()
+
+    def test_incremental_changes_and_rebuild(self):
+        """Upserts and removals are visible at once and fold into the tree later"""
+        row = self.analyzer.processed_data.iloc[0]
+        self.index.upsert([999], ['NEW STUDENT'], row[self.features].to_frame().T)
+        self.assertIn(999, self.index)
+        self.assertEqual(self.index.query(student_id=row['StudentID'], k=1)[0]['distance'], 0.0)
+
+        self.index.remove([999, self.ids[1]])
+        self.assertNotIn(self.ids[1], self.index)
+        self.assertEqual(len(self.index), len(self.ids) - 1)
+        self.assertNotIn(self.ids[1], [n['id'] for n in self.index.query(student_id=self.ids[2], k=80)])
+
+        # Moving a student's marks onto another's supersedes the tree row
+        self.index.upsert([self.ids[3]], ['MOVED'], self.analyzer.processed_data.iloc[[4]][self.features])
+        self.assertEqual(self.index.query(student_id=self.ids[4], k=1)[0]['id'], self.ids[3])
+
+        tree = self.index.tree
+        self.index.upsert(list(range(2000, 2010)), ['X'] * 10,
+                          self.analyzer.processed_data.iloc[:10][self.features])
+        self.assertIsNot(self.index.tree, tree)
+        self.assertEqual((self.index.tombstones, len(self.index.delta)), (0, 0))
+        self.assertEqual(len(self.index), len(self.ids) + 9)
+
+    def test_save_and_load(self):
+        """A saved index answers the same queries after loading"""
+        self.index.upsert([999], ['NEW STUDENT'], self.analyzer.processed_data.iloc[[5]][self.features])
+        path = self.index.save(os.path.join(self.temp_dir, 'index.npz'))
+        loaded = StudentIndex.load(path)
+        self.assertEqual(loaded.query(student_id=999, k=3), self.index.query(student_id=999, k=3))
+        self.assertEqual(loaded.features, self.features)
+
+    def test_string_ids(self):
+        """Non-numeric StudentIDs survive upserts, rebuilds and a save/load round trip"""
+        ids = np.array(['S1', 'S2', 'S3'], dtype=object)
+        index = StudentIndex(ids, ['A', 'B', 'C'], np.eye(3), ['x', 'y', 'z'], np.zeros(3), np.ones(3))
+        index.upsert(['S10'], ['D'], np.array([[0.0, 0.0, 0.9]]))
+        index.rebuild()
+        self.assertIn('S10', index)
+        self.assertEqual(index.query(student_id='S3', k=1)[0]['id'], 'S10')
+        loaded = StudentIndex.load(index.save(os.path.join(self.temp_dir, 'strings.npz')))
+        self.assertEqual(loaded.query(student_id='S10', k=3), index.query(student_id='S10', k=3))
+
+if __name__ == "__main__":
+    unittest.main()